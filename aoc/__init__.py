@@ -0,0 +1 @@
+"""Shared helpers behind the main.py CLI (test harness, runners, tooling)."""
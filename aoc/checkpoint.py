@@ -0,0 +1,153 @@
+"""
+Checkpoint/resume for long-running solves.
+
+A solve opts in by being written as a generator that takes an optional state
+to resume from, yields its (picklable) state every so often, and returns the
+answer:
+
+    @resumable
+    def solve(lines: list[str], state: PeelState | None = None):
+        state = state or PeelState(...)
+        while ...:
+            ...
+            yield state
+        return answer
+
+A yielded state must not be mutated afterwards (build a new one per yield):
+on Ctrl+C the runner saves the last state yielded, while the generator itself
+may be halfway through its next step.
+
+@resumable keeps solve(lines) an ordinary call that runs to completion, so
+tests, bench and other callers are unaffected; the generator stays reachable
+as solve.steps. `main.py execute` drives solve.steps itself and pickles the
+latest state to the solution's data/YYYY/dayXX/.checkpoints/, also for
+--input files kept elsewhere (atomically, at most every --checkpoint-every
+seconds, and once more on Ctrl+C or when --timeout cancels the run).
+`execute --resume` picks the state back up. A checkpoint is named by and
+only reused for the same input digest and solution source; it is deleted
+once the solve finishes.
+"""
+
+from __future__ import annotations
+
+import functools
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Generator
+
+from aoc import progress
+from aoc.store import write_atomic
+
+CHECKPOINT_DIRNAME = ".checkpoints"
+VERSION = 1
+
+Steps = Callable[..., Generator[Any, None, Any]]
+
+
+def resumable(steps: Steps) -> Callable[..., Any]:
+    """Turn a state-yielding generator into a plain solve(); see the module docstring."""
+
+    @functools.wraps(steps)
+    def solve(puzzle_input: Any) -> Any:
+        return drain(steps(puzzle_input))
+
+    solve.steps = steps  # type: ignore[attr-defined]
+    return solve
+
+
+def drain(generator: Generator[Any, None, Any]) -> Any:
+    """Run a resumable solve to completion and return its answer."""
+    while True:
+        try:
+            next(generator)
+        except StopIteration as done:
+            return done.value
+
+
+def checkpoint_path(data_dir: Path, part: int, impl: str, input_digest: str) -> Path:
+    return data_dir / CHECKPOINT_DIRNAME / f"part{part}-{impl}-{input_digest[:16]}.ckpt"
+
+
+def save(path: Path, state: Any, input_digest: str, solution_hash: str, steps: int) -> None:
+    payload = {
+        "version": VERSION,
+        "input": input_digest,
+        "solution": solution_hash,
+        "steps": steps,
+        "saved_at": time.time(),
+        "state": state,
+    }
+    write_atomic(path, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load(path: Path, input_digest: str, solution_hash: str) -> dict[str, Any] | None:
+    """The saved payload, or None if there is none or it belongs to other input/code."""
+    if not path.exists():
+        return None
+    try:
+        payload = pickle.loads(path.read_bytes())
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as exc:
+        print(f"Ignoring unreadable checkpoint {path}: {exc}", file=sys.stderr)
+        return None
+    if payload.get("version") != VERSION or payload.get("input") != input_digest:
+        print(f"Ignoring checkpoint {path}: it was saved for another input", file=sys.stderr)
+        return None
+    if payload.get("solution") != solution_hash:
+        print(
+            f"Ignoring checkpoint {path}: the solution has changed since it was saved",
+            file=sys.stderr,
+        )
+        return None
+    return payload
+
+
+def run(
+    steps: Steps,
+    puzzle_input: Any,
+    path: Path,
+    input_digest: str,
+    solution_hash: str,
+    resume: bool = False,
+    interval: float = 5.0,
+) -> Any:
+    """
+    Drive a resumable solve, saving its latest state to `path` at most every
+    `interval` seconds and when interrupted or cancelled. With resume, start from the
+    state already saved there (if it matches this input and solution).
+    """
+    state = None
+    count = 0
+    if resume:
+        payload = load(path, input_digest, solution_hash)
+        if payload is not None:
+            state, count = payload["state"], payload["steps"]
+            saved = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(payload["saved_at"]))
+            print(f"Resuming from {path} ({count} steps, saved {saved})", file=sys.stderr)
+            progress.resumed()
+        else:
+            print(f"No usable checkpoint at {path}; starting from scratch", file=sys.stderr)
+
+    generator = steps(puzzle_input, state)
+    latest = state
+    last_save = time.monotonic()
+    try:
+        while True:
+            try:
+                latest = next(generator)
+            except StopIteration as done:
+                path.unlink(missing_ok=True)
+                return done.value
+            count += 1
+            if time.monotonic() - last_save >= interval:
+                save(path, latest, input_digest, solution_hash, count)
+                last_save = time.monotonic()
+    except (KeyboardInterrupt, progress.Cancelled):
+        if latest is not None:
+            save(path, latest, input_digest, solution_hash, count)
+            print(
+                f"\nStopped; saved checkpoint to {path}. Re-run with --resume to continue.",
+                file=sys.stderr,
+            )
+        raise
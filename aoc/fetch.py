@@ -0,0 +1,186 @@
+"""
+Concurrent puzzle input downloads.
+
+All requests share one pooled requests.Session and go through a thread pool
+bounded by `concurrency`. A rate limiter spaces out request starts, 429 and
+5xx responses (and connection errors) are retried with exponential backoff
+that honours Retry-After, and inputs that already exist are revalidated with
+If-None-Match / If-Modified-Since so unchanged inputs are not rewritten.
+Downloads land in the content-addressed input store (see aoc.store).
+
+The base URL is configurable so the fetcher can be pointed at a local
+stand-in server.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from aoc.store import InputStore, current_ref, store_input, write_atomic
+
+AOC_URL = "https://adventofcode.com"
+USER_AGENT = "aoc-cli"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class FetchResult:
+    year: int
+    day: int
+    status: str  # "written", "unchanged" or "failed"
+    data_dir: Path
+    detail: str = ""
+
+
+class RateLimiter:
+    """Thread-safe limiter that lets at most `rate` requests start per second."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _meta_path(data_dir: Path) -> Path:
+    return data_dir / ".part1.http.json"
+
+
+def _retry_after(resp: requests.Response) -> float | None:
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class InputFetcher:
+    def __init__(
+        self,
+        cookie: str,
+        base_url: str = AOC_URL,
+        concurrency: int = 4,
+        rate: float = 2.0,
+        retries: int = 5,
+        backoff: float = 1.0,
+        timeout: float = 15.0,
+        compression: str = "none",
+        store: InputStore | None = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.compression = compression
+        self.store = store or InputStore()
+        self.concurrency = max(1, concurrency)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.limiter = RateLimiter(rate)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Cookie": cookie, "User-Agent": USER_AGENT})
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> InputFetcher:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _get(self, url: str, headers: dict[str, str]) -> requests.Response:
+        """GET with rate limiting and exponential backoff on 429/5xx/network errors."""
+        attempt = 0
+        while True:
+            self.limiter.wait()
+            try:
+                resp = self.session.get(url, headers=headers, timeout=self.timeout)
+            except requests.RequestException:
+                if attempt >= self.retries:
+                    raise
+                delay = None
+            else:
+                if resp.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                    return resp
+                delay = _retry_after(resp)
+            if delay is None:
+                delay = self.backoff * 2**attempt * (1 + random.random() / 2)
+            time.sleep(delay)
+            attempt += 1
+
+    def fetch(self, year: int, day: int, data_dir: Path) -> FetchResult:
+        meta_path = _meta_path(data_dir)
+        headers: dict[str, str] = {}
+        have_input = current_ref(data_dir) is not None or (data_dir / "part1.txt").exists()
+        if have_input and meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        url = f"{self.base_url}/{year}/day/{day}/input"
+        try:
+            resp = self._get(url, headers)
+        except requests.RequestException as exc:
+            return FetchResult(year, day, "failed", data_dir, f"network error: {exc}")
+
+        if resp.status_code == 304:
+            return FetchResult(year, day, "unchanged", data_dir, "not modified")
+        if resp.status_code != 200:
+            return FetchResult(
+                year, day, "failed", data_dir, f"HTTP {resp.status_code}: {resp.text.strip()}"
+            )
+
+        _, changed = store_input(data_dir, resp.content, self.compression, self.store)
+        status = "written" if changed else "unchanged"
+
+        meta = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+        write_atomic(meta_path, json.dumps(meta).encode())
+        return FetchResult(year, day, status, data_dir)
+
+    def fetch_many(
+        self,
+        jobs: Iterable[tuple[int, int]],
+        data_dir_for: Callable[[int, int], Path],
+    ) -> Iterator[FetchResult]:
+        """Fetch (year, day) pairs concurrently, yielding results as they complete."""
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = [
+                pool.submit(self.fetch, year, day, data_dir_for(year, day))
+                for year, day in jobs
+            ]
+            for future in as_completed(futures):
+                yield future.result()
@@ -0,0 +1,266 @@
+"""
+Differential fuzzing of a solution's registered implementations.
+
+Small random inputs come from the seeded generators in aoc.generators. Every
+implementation of a day/part runs on each one, and plain solve() is the
+reference. When another implementation disagrees with it (a different answer
+or an exception where solve() succeeded), the input is shrunk with delta
+debugging: first whole lines, then comma-separated tokens within a line. The
+minimal input is appended to the solution's TESTS with solve()'s answer as the
+expected value, so `main.py test` replays it against every implementation
+from then on.
+
+Inputs are normalised exactly as inline TESTS are (harness.test_lines), so a
+saved reproducer fails the same way it did while fuzzing.
+"""
+
+from __future__ import annotations
+
+import ast
+import contextlib
+import io
+import random
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Sequence
+
+from aoc import generators, harness, registry
+from aoc.loader import import_solution, solution_path
+
+# Largest generator scale used per day; small inputs keep runs fast and shrink well.
+SMALL_SCALES = {1: 12, 2: 4, 3: 6, 4: 8, 5: 8, 6: 6}
+
+Outcome = tuple[str, object]  # ("ok", answer) or ("error", "ExcType: message")
+
+
+@dataclass
+class Mismatch:
+    day: int
+    part: int
+    raw: str
+    outcomes: dict[str, Outcome]
+    original_lines: int
+    saved: bool = False
+
+    @property
+    def expected(self) -> object:
+        return self.outcomes[registry.DEFAULT][1]
+
+
+@dataclass
+class FuzzTarget:
+    day: int
+    part: int
+    module: ModuleType
+    variants: dict[str, registry.Variant]
+    cases: int = 0
+    mismatch: Mismatch | None = None
+
+    @property
+    def label(self) -> str:
+        return f"day{self.day:02d}-part{self.part}"
+
+
+@dataclass
+class FuzzReport:
+    targets: list[FuzzTarget] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def mismatches(self) -> list[Mismatch]:
+        return [target.mismatch for target in self.targets if target.mismatch]
+
+
+def outcome(variant: registry.Variant, raw: str) -> Outcome:
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return ("ok", harness.run_variant(variant, raw))
+    except Exception as exc:  # noqa: BLE001 - a crash is a result to compare
+        return ("error", traceback.format_exception_only(type(exc), exc)[-1].strip())
+
+
+def disagreement(
+    variants: dict[str, registry.Variant], raw: str
+) -> dict[str, Outcome] | None:
+    """All outcomes if some implementation differs from a successful solve(), else None."""
+    reference = outcome(variants[registry.DEFAULT], raw)
+    if reference[0] != "ok":
+        return None
+    outcomes = {registry.DEFAULT: reference}
+    for name, variant in variants.items():
+        if name != registry.DEFAULT:
+            outcomes[name] = outcome(variant, raw)
+    if all(result == reference for result in outcomes.values()):
+        return None
+    return outcomes
+
+
+def ddmin(items: list[str], fails: Callable[[list[str]], bool]) -> list[str]:
+    """Zeller's delta debugging: a 1-minimal sublist of items that still fails."""
+    granularity = 2
+    while len(items) >= 2:
+        chunk = -(-len(items) // granularity)
+        reduced = False
+        for start in range(0, len(items), chunk):
+            subset = items[start : start + chunk]
+            complement = items[:start] + items[start + chunk :]
+            if fails(subset):
+                items, granularity, reduced = subset, 2, True
+                break
+            if fails(complement):
+                items, granularity, reduced = complement, max(granularity - 1, 2), True
+                break
+        if not reduced:
+            if granularity >= len(items):
+                break
+            granularity = min(len(items), granularity * 2)
+    return items
+
+
+def shrink(raw: str, fails: Callable[[str], bool]) -> str:
+    lines = ddmin(harness.test_lines(raw), lambda candidate: fails("\n".join(candidate)))
+    for index, line in enumerate(lines):
+        if "," not in line:
+            continue
+
+        def fails_with(tokens: Sequence[str], index: int = index) -> bool:
+            return fails("\n".join(lines[:index] + [",".join(tokens)] + lines[index + 1 :]))
+
+        lines[index] = ",".join(ddmin(line.split(","), fails_with))
+    return "\n".join(lines)
+
+
+def _tests_node(tree: ast.Module) -> ast.List | None:
+    for node in tree.body:
+        if isinstance(node, ast.AnnAssign):
+            targets = [node.target]
+        elif isinstance(node, ast.Assign):
+            targets = node.targets
+        else:
+            continue
+        if any(isinstance(t, ast.Name) and t.id == "TESTS" for t in targets):
+            return node.value if isinstance(node.value, ast.List) else None
+    return None
+
+
+def _literal(raw: str) -> str:
+    if '"""' in raw or "\\" in raw:
+        return repr(raw + "\n")
+    return f'"""{raw}\n"""'
+
+
+def add_test_case(path: Path, raw: str, expected: object) -> bool:
+    """
+    Append (raw, expected) to the TESTS list in a solution file, editing the
+    source text in place so the rest of the file is untouched. Returns False
+    if there is no literal TESTS list or the input is already in it.
+    """
+    source = path.read_text()
+    tree = ast.parse(source)
+    node = _tests_node(tree)
+    if node is None:
+        return False
+    for element in node.elts:
+        if (
+            isinstance(element, ast.Tuple)
+            and element.elts
+            and isinstance(element.elts[0], ast.Constant)
+            and harness.test_lines(str(element.elts[0].value)) == harness.test_lines(raw)
+        ):
+            return False
+
+    lines = source.splitlines(keepends=True)
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+    # ast columns are UTF-8 byte offsets; the solution files are ASCII.
+    close = offsets[node.end_lineno - 1] + node.end_col_offset - 1
+    body = source[:close].rstrip()
+    separator = "" if body.endswith(("[", ",")) else ","
+    entry = f"\n    (\n{_literal(raw)},\n        {expected!r},\n    ),\n"
+    path.write_text(body + separator + entry + source[close:])
+    return True
+
+
+def targets_for(
+    days: Sequence[int], parts: Sequence[int] | None
+) -> tuple[list[FuzzTarget], list[str]]:
+    targets: list[FuzzTarget] = []
+    skipped: list[str] = []
+    for day in days:
+        for part in parts or (1, 2):
+            label = f"day{day:02d}-part{part}"
+            if not solution_path(day, part).exists():
+                continue
+            if day not in generators.GENERATORS:
+                skipped.append(f"{label} (no input generator)")
+                continue
+            module = import_solution(day, part)
+            variants = registry.variants(module)
+            if len(variants) < 2:
+                skipped.append(f"{label} (only one implementation)")
+                continue
+            targets.append(FuzzTarget(day, part, module, variants))
+    return targets, skipped
+
+
+def fuzz(
+    days: Sequence[int],
+    parts: Sequence[int] | None,
+    budget: float,
+    seed: int = 0,
+    save: bool = True,
+) -> FuzzReport:
+    """
+    Cycle through the targets with fresh random inputs until `budget` seconds
+    have passed. A target stops being fuzzed after its first mismatch, which is
+    shrunk (within whatever budget is left) and, with save, added to TESTS.
+    """
+    started = time.monotonic()
+    deadline = started + budget
+    targets, skipped = targets_for(days, parts)
+    report = FuzzReport(targets, skipped)
+    rng = random.Random(seed)
+
+    active = list(targets)
+    while active and time.monotonic() < deadline:
+        for target in list(active):
+            if time.monotonic() >= deadline:
+                break
+            scale = rng.randint(1, SMALL_SCALES.get(target.day, 8))
+            raw = "\n".join(
+                harness.test_lines(
+                    generators.generate_text(target.day, scale, rng.getrandbits(32))
+                )
+            )
+            target.cases += 1
+            first = disagreement(target.variants, raw)
+            if first is None:
+                continue
+
+            def fails(candidate: str, target: FuzzTarget = target) -> bool:
+                # Out of time: stop shrinking and keep the smallest input so far.
+                if time.monotonic() >= deadline:
+                    return False
+                return disagreement(target.variants, candidate) is not None
+
+            small = shrink(raw, fails)
+            outcomes = disagreement(target.variants, small)
+            if outcomes is None:  # a flaky implementation; keep the original input
+                small, outcomes = raw, first
+            mismatch = Mismatch(
+                target.day, target.part, small, outcomes, len(harness.test_lines(raw))
+            )
+            if save:
+                mismatch.saved = add_test_case(
+                    solution_path(target.day, target.part), small, mismatch.expected
+                )
+            target.mismatch = mismatch
+            active.remove(target)
+
+    report.elapsed = time.monotonic() - started
+    return report
@@ -0,0 +1,154 @@
+"""
+Deterministic synthetic puzzle inputs, written as a stream.
+
+Every generator takes a `scale` (the number of "items" for that day, see
+GENERATORS below), a `seed`, and a text stream to write into. Output is
+produced in fixed-size batches, so generating a multi-gigabyte file only ever
+holds one batch in memory. The same (day, scale, seed) always yields
+byte-identical output.
+"""
+
+from __future__ import annotations
+
+import io
+import random
+from typing import Callable, Iterator, TextIO
+
+BATCH = 4096
+
+
+def _batched_lines(lines: Iterator[str], out: TextIO) -> None:
+    batch: list[str] = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= BATCH:
+            out.write("\n".join(batch))
+            out.write("\n")
+            batch.clear()
+    if batch:
+        out.write("\n".join(batch))
+        out.write("\n")
+
+
+def day01(scale: int, seed: int, out: TextIO) -> None:
+    """`scale` dial rotations such as L68 / R48."""
+    rng = random.Random(seed)
+    _batched_lines(
+        (f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(scale)), out
+    )
+
+
+def day02(scale: int, seed: int, out: TextIO) -> None:
+    """One line of `scale` comma-separated ID ranges such as 998-1012."""
+    rng = random.Random(seed)
+    for i in range(scale):
+        digits = rng.randint(1, 10)
+        start = rng.randint(10 ** (digits - 1), 10**digits - 1)
+        end = start + rng.randint(0, min(start, 100_000))
+        if i:
+            out.write(",")
+        out.write(f"{start}-{end}")
+    out.write("\n")
+
+
+def day03(scale: int, seed: int, out: TextIO, width: int = 100) -> None:
+    """`scale` battery banks of `width` digits 1-9."""
+    rng = random.Random(seed)
+    digits = "123456789"
+    _batched_lines(
+        ("".join(rng.choices(digits, k=width)) for _ in range(scale)), out
+    )
+
+
+def day04(scale: int, seed: int, out: TextIO, density: float = 0.65) -> None:
+    """A `scale` x `scale` grid of paper rolls (@) and empty cells (.)."""
+    rng = random.Random(seed)
+    cells = "@."
+    weights = (density, 1 - density)
+    _batched_lines(
+        ("".join(rng.choices(cells, weights, k=scale)) for _ in range(scale)), out
+    )
+
+
+def day05(scale: int, seed: int, out: TextIO) -> None:
+    """`scale` fresh-ID intervals, a blank line, then `scale` IDs to check."""
+    rng = random.Random(seed)
+    top = 10**15
+
+    def intervals() -> Iterator[str]:
+        for _ in range(scale):
+            start = rng.randint(1, top)
+            yield f"{start}-{start + rng.randint(0, top // max(scale, 1) // 10)}"
+
+    _batched_lines(intervals(), out)
+    out.write("\n")
+    _batched_lines((str(rng.randint(1, top)) for _ in range(scale)), out)
+
+
+def _day06_block(
+    seed: int, block: int, count: int, rows: int
+) -> list[tuple[list[str], str, bool]]:
+    """Problems for one block: (operands, operator, right_aligned)."""
+    rng = random.Random(f"{seed}:{block}")
+    problems = []
+    for _ in range(count):
+        # Order operand lengths so that, like the real input, no digit column
+        # has a blank between two digits.
+        lengths = sorted(
+            (rng.randint(1, 4) for _ in range(rows)), reverse=rng.random() < 0.5
+        )
+        operands = [str(rng.randint(10 ** (n - 1), 10**n - 1)) for n in lengths]
+        problems.append((operands, rng.choice("+*"), rng.random() < 0.5))
+    return problems
+
+
+def day06(scale: int, seed: int, out: TextIO, rows: int = 4) -> None:
+    """
+    A worksheet of `scale` problems side by side: `rows` number rows and an
+    operator row, problems separated by a column of spaces.
+
+    Rows are written one at a time; each block of problems is regenerated from
+    its own seed for every row, so memory stays bounded by the block size.
+    """
+    blocks = range(0, scale, BATCH)
+    for row in range(rows + 1):
+        for block_start in blocks:
+            count = min(BATCH, scale - block_start)
+            cells: list[str] = []
+            for operands, operator, right in _day06_block(seed, block_start, count, rows):
+                width = max(len(value) for value in operands)
+                if row == rows:
+                    cells.append(operator.ljust(width))
+                elif right:
+                    cells.append(operands[row].rjust(width))
+                else:
+                    cells.append(operands[row].ljust(width))
+            if block_start:
+                out.write(" ")
+            out.write(" ".join(cells))
+        out.write("\n")
+
+
+GENERATORS: dict[int, Callable[[int, int, TextIO], None]] = {
+    1: day01,
+    2: day02,
+    3: day03,
+    4: day04,
+    5: day05,
+    6: day06,
+}
+
+
+def generate(day: int, scale: int, seed: int, out: TextIO) -> None:
+    try:
+        generator = GENERATORS[day]
+    except KeyError:
+        raise ValueError(f"No input generator for day {day}.") from None
+    generator(scale, seed, out)
+
+
+def generate_text(day: int, scale: int, seed: int) -> str:
+    """In-memory convenience wrapper for small inputs (tests, fuzzing, scaling runs)."""
+    buffer = io.StringIO()
+    generate(day, scale, seed, buffer)
+    return buffer.getvalue()
@@ -0,0 +1,253 @@
+"""
+Parallel runner for the inline TESTS of every solution file.
+
+Each test case runs in its own process so a runaway solve() can be killed
+once it exceeds the timeout without taking the rest of the run down with it.
+Every registered implementation (see aoc.registry) is checked against every
+case, not just solve().
+
+A case may start worker processes of its own (the pool variants do), so each
+case process leads its own process group where the platform has them. On a
+timeout the group gets SIGTERM, which the case turns into SystemExit so its
+finally blocks (shutting its pool down, unlinking shared memory) still run,
+and SIGKILL after KILL_GRACE seconds takes down anything left.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import multiprocessing
+import os
+import signal
+import tempfile
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Callable
+
+from aoc import registry
+from aoc.loader import available_days, import_solution, solution_path
+from aoc.units import format_duration
+
+# Seconds a timed-out case gets to clean up after SIGTERM before SIGKILL.
+KILL_GRACE = 1.0
+
+
+@dataclass
+class TestCase:
+    day: int
+    part: int
+    index: int
+    expected: int | str
+    impl: str = registry.DEFAULT
+
+    @property
+    def label(self) -> str:
+        label = f"day{self.day:02d} part{self.part} #{self.index + 1}"
+        return label if self.impl == registry.DEFAULT else f"{label} [{self.impl}]"
+
+
+@dataclass
+class CaseResult:
+    case: TestCase
+    status: str  # "pass", "fail", "error" or "timeout"
+    duration: float
+    detail: str = ""
+
+    def to_record(self) -> dict[str, int | str]:
+        return {
+            "day": self.case.day,
+            "part": self.case.part,
+            "case": self.case.index + 1,
+            "impl": self.case.impl,
+            "status": self.status,
+            "duration_ns": int(self.duration * 1e9),
+            "detail": self.detail,
+        }
+
+
+def test_lines(raw: str) -> list[str]:
+    """Turn an inline TESTS string into the lines solve() expects."""
+    return raw.strip("\r\n").splitlines()
+
+
+def run_variant(variant: registry.Variant, raw: str) -> int | str:
+    """Run one implementation on an inline test input, in the form it expects."""
+    lines = test_lines(raw)
+    if variant.kind == "lines":
+        return variant.fn(lines)
+    data = ("\n".join(lines) + "\n").encode()
+    if variant.kind == "bytes":
+        return variant.fn(data)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "input.txt"
+        path.write_bytes(data)
+        return variant.fn(path)
+
+
+def collect_cases(days: list[int] | None = None) -> list[TestCase]:
+    cases: list[TestCase] = []
+    for day in days or available_days():
+        for part in (1, 2):
+            if not solution_path(day, part).exists():
+                continue
+            module = import_solution(day, part)
+            for index, (_, expected) in enumerate(getattr(module, "TESTS", [])):
+                for impl in registry.variants(module):
+                    cases.append(TestCase(day, part, index, expected, impl))
+    return cases
+
+
+def _terminated(signum: int, frame: object) -> None:
+    raise SystemExit(f"terminated by signal {signum}")
+
+
+def _run_case(case: TestCase, conn: Connection) -> None:
+    """Child process entry point: run one case and send back (status, seconds, detail)."""
+    if hasattr(os, "setsid"):
+        os.setsid()
+    signal.signal(signal.SIGTERM, _terminated)
+    try:
+        module = import_solution(case.day, case.part)
+        raw, expected = module.TESTS[case.index]
+        variant = registry.variants(module)[case.impl]
+        # Solutions print debugging output freely; keep it out of the report.
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = run_variant(variant, raw)
+            elapsed = time.perf_counter() - start
+        if result == expected:
+            conn.send(("pass", elapsed, f"got {result!r}"))
+        else:
+            conn.send(("fail", elapsed, f"expected {expected!r}, got {result!r}"))
+    except BaseException as exc:  # noqa: BLE001 - report everything, including SystemExit
+        last = traceback.format_exception_only(type(exc), exc)[-1].strip()
+        conn.send(("error", 0.0, last))
+    finally:
+        conn.close()
+
+
+def _signal_group(proc: multiprocessing.process.BaseProcess, signum: int) -> None:
+    """Send signum to proc's process group, or just to proc where there are none."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signum)
+        else:
+            os.kill(proc.pid, signum)
+    except ProcessLookupError:
+        pass  # the group is already gone (or proc never got to os.setsid())
+
+
+def stop_case(proc: multiprocessing.process.BaseProcess) -> None:
+    """Stop a case process and every process it started."""
+    _signal_group(proc, signal.SIGTERM)
+    proc.join(KILL_GRACE)
+    # Whatever did not exit in time, plus any workers the case left behind.
+    _signal_group(proc, getattr(signal, "SIGKILL", signal.SIGTERM))
+    if proc.is_alive():
+        proc.kill()
+    proc.join()
+
+
+def run_cases(
+    cases: list[TestCase],
+    jobs: int,
+    timeout: float,
+    on_result: Callable[[CaseResult], None] | None = None,
+) -> list[CaseResult]:
+    """
+    Run cases on up to `jobs` processes, killing any that outlive `timeout` seconds.
+
+    on_result is called with each result as soon as its case finishes.
+    """
+    ctx = multiprocessing.get_context()
+    pending = deque(cases)
+    running: dict[Connection, tuple[multiprocessing.process.BaseProcess, TestCase, float]] = {}
+    results: list[CaseResult] = []
+
+    try:
+        while pending or running:
+            while pending and len(running) < jobs:
+                case = pending.popleft()
+                recv_conn, send_conn = ctx.Pipe(duplex=False)
+                # Not daemonic, so cases may start their own worker pools;
+                # stop_case() does the cleanup daemon=True would have done.
+                proc = ctx.Process(target=_run_case, args=(case, send_conn))
+                proc.start()
+                send_conn.close()
+                running[recv_conn] = (proc, case, time.perf_counter())
+
+            now = time.perf_counter()
+            next_deadline = min(started + timeout for _, _, started in running.values())
+            ready = wait(list(running), timeout=max(0.0, next_deadline - now))
+
+            for conn in ready:
+                proc, case, started = running.pop(conn)
+                try:
+                    status, elapsed, detail = conn.recv()
+                except EOFError:
+                    status, elapsed = "error", time.perf_counter() - started
+                    detail = "process exited without reporting a result"
+                conn.close()
+                proc.join()
+                results.append(CaseResult(case, status, elapsed, detail))
+                if on_result:
+                    on_result(results[-1])
+
+            now = time.perf_counter()
+            for conn, (proc, case, started) in list(running.items()):
+                if now - started < timeout:
+                    continue
+                stop_case(proc)
+                conn.close()
+                del running[conn]
+                results.append(
+                    CaseResult(case, "timeout", now - started, f"exceeded {timeout}s")
+                )
+                if on_result:
+                    on_result(results[-1])
+
+    finally:
+        for conn, (proc, _, _) in running.items():
+            stop_case(proc)
+            conn.close()
+
+    results.sort(
+        key=lambda r: (
+            r.case.day,
+            r.case.part,
+            r.case.index,
+            r.case.impl != registry.DEFAULT,
+            r.case.impl,
+        )
+    )
+    return results
+
+
+def report(results: list[CaseResult], slowest: int = 5) -> bool:
+    """Print a per-case table plus the slowest cases; return True if all passed."""
+    width = max((len(result.case.label) for result in results), default=18)
+    for result in results:
+        print(
+            f"{result.case.label:<{width}} {result.status.upper():<8} "
+            f"{format_duration(result.duration):>10}  {result.detail}"
+        )
+
+    timed = sorted(results, key=lambda r: r.duration, reverse=True)[:slowest]
+    if timed:
+        print("\nSlowest cases:")
+        for result in timed:
+            print(f"  {result.case.label:<{width}} {format_duration(result.duration):>10}")
+
+    counts = {status: 0 for status in ("pass", "fail", "error", "timeout")}
+    for result in results:
+        counts[result.status] += 1
+    print(
+        f"\n{counts['pass']} passed, {counts['fail']} failed, "
+        f"{counts['timeout']} timed out, {counts['error']} errors"
+    )
+    return counts["pass"] == len(results)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parents[1]
+SOLUTIONS_DIR = ROOT / "solutions"
+
+
+def solution_path(day: int, part: int) -> Path:
+    return SOLUTIONS_DIR / f"day{day:02d}" / f"part{part}.py"
+
+
+def available_days() -> list[int]:
+    """Days that have a solutions/dayXX directory."""
+    days: list[int] = []
+    for path in sorted(SOLUTIONS_DIR.glob("day[0-9][0-9]")):
+        if path.is_dir():
+            days.append(int(path.name[3:]))
+    return days
+
+
+def import_solution(day: int, part: int) -> ModuleType:
+    """
+    Import solutions/dayXX/partY.py by path and register it in sys.modules.
+
+    Raises FileNotFoundError/ImportError; callers decide how to surface them.
+    """
+    path = solution_path(day, part)
+    if not path.exists():
+        raise FileNotFoundError(path)
+
+    module_name = f"solutions.day{day:02d}.part{part}"
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Unable to load module from {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
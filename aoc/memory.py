@@ -0,0 +1,89 @@
+"""
+Peak memory accounting for a single phase (read_input() or solve()).
+
+Two numbers are recorded per phase:
+
+* the process peak RSS from resource.getrusage() once the phase finishes, and
+  how much that high-water mark grew during the phase; RSS never goes down, so
+  a phase that stays below an earlier peak reports zero growth;
+* the tracemalloc peak, i.e. the most Python-allocated memory alive at any
+  point during the phase.
+
+resource is POSIX-only; on other platforms the RSS fields are None.
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from types import TracebackType
+
+from aoc.units import format_bytes
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class MemoryStats:
+    rss_peak: int | None
+    rss_growth: int | None
+    traced_peak: int
+
+    def to_dict(self) -> dict[str, int | None]:
+        return asdict(self)
+
+
+def peak_rss() -> int | None:
+    """Process high-water RSS in bytes, or None where getrusage is unavailable."""
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+class MemoryMeter:
+    """Context manager that fills `stats` with the memory used inside the block."""
+
+    def __init__(self) -> None:
+        self.stats: MemoryStats | None = None
+        self._rss_before: int | None = None
+        self._started_tracing = False
+
+    def __enter__(self) -> MemoryMeter:
+        self._rss_before = peak_rss()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        traced_peak = tracemalloc.get_traced_memory()[1]
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        rss_after = peak_rss()
+        growth = None
+        if rss_after is not None and self._rss_before is not None:
+            growth = rss_after - self._rss_before
+        self.stats = MemoryStats(rss_after, growth, traced_peak)
+
+
+def describe_memory(stats: MemoryStats | None) -> str:
+    if stats is None:
+        return "memory not measured"
+    if stats.rss_peak is None or stats.rss_growth is None:
+        rss = "peak RSS n/a"
+    else:
+        rss = f"peak RSS {format_bytes(stats.rss_peak)} (+{format_bytes(stats.rss_growth)})"
+    return f"{rss}, traced peak {format_bytes(stats.traced_peak)}"
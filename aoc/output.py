@@ -0,0 +1,50 @@
+"""
+Streaming record output for execute, bench and test.
+
+`json` writes a single JSON array and `ndjson` one object per line; both
+write (and flush) each record as soon as it is produced, so a multi-day run
+can be piped straight into a collector.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from types import TracebackType
+from typing import Any, TextIO
+
+FORMATS = ("text", "json", "ndjson")
+
+
+class RecordWriter:
+    def __init__(self, fmt: str, stream: TextIO | None = None) -> None:
+        if fmt not in ("json", "ndjson"):
+            raise ValueError(f"RecordWriter handles json/ndjson, not {fmt!r}")
+        self.fmt = fmt
+        self.stream = stream or sys.stdout
+        self.count = 0
+
+    def write(self, record: dict[str, Any]) -> None:
+        text = json.dumps(record)
+        if self.fmt == "ndjson":
+            self.stream.write(text + "\n")
+        else:
+            self.stream.write(("[\n  " if self.count == 0 else ",\n  ") + text)
+        self.stream.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        if self.fmt == "json":
+            self.stream.write("[]\n" if self.count == 0 else "\n]\n")
+            self.stream.flush()
+
+    def __enter__(self) -> RecordWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,148 @@
+"""
+Binary sidecar cache for parsed puzzle inputs.
+
+A solution opts in by defining
+
+    def parse(data: bytes) -> dict[str, array.array]: ...
+    def solve_parsed(parsed: Mapping[str, memoryview]) -> int | str: ...
+
+The runner stores parse()'s typed arrays next to the input in
+data/YYYY/dayXX/.parsed/, keyed by the input's SHA-256 and a hash of the
+cache format, the solution module and the solutions/lib sources (so editing
+the parser or any helper it calls invalidates old entries). Later runs
+memory-map the sidecar and hand solve_parsed() zero-copy memoryviews cast to
+each array's typecode, skipping text parsing entirely.
+
+File layout: 8-byte magic, little-endian u64 header length, JSON header
+listing the payload size and each field's name, typecode, offset and item
+count, then the raw array buffers, each aligned to 8 bytes. A sidecar that is
+truncated or otherwise does not add up is treated as a miss and rewritten.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Callable, Mapping
+
+from aoc.loader import SOLUTIONS_DIR
+from aoc.store import write_atomic
+
+MAGIC = b"AOCPC\x00\x00\x02"
+CACHE_DIRNAME = ".parsed"
+ALIGN = 8
+# Shared parsing helpers; editing any of them invalidates every cached parse.
+LIB_DIR = SOLUTIONS_DIR / "lib"
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def parser_digest(parse: Callable[[bytes], Mapping[str, array]]) -> str:
+    """
+    Hash of everything parse() output can depend on: the cache format, the
+    whole solution module (parse() may call helpers defined beside it) and
+    the shared solutions/lib sources (lib.ints, lib.ranges, ...).
+    """
+    digest = hashlib.sha256(MAGIC)
+    module = sys.modules.get(parse.__module__)
+    try:
+        digest.update(inspect.getsource(module or parse).encode())
+    except (OSError, TypeError):
+        digest.update(parse.__qualname__.encode())
+    for path in sorted(LIB_DIR.glob("*.py")):
+        digest.update(path.name.encode() + b"\0" + path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def cache_path(data_dir: Path, input_digest: str, part: int, parser_hash: str) -> Path:
+    return data_dir / CACHE_DIRNAME / f"{input_digest[:16]}-part{part}-{parser_hash}.bin"
+
+
+def dump(path: Path, fields: Mapping[str, array]) -> None:
+    """Serialize typed arrays to `path` (atomically)."""
+    header_fields = []
+    offset = 0
+    for name, values in fields.items():
+        if not isinstance(values, array):
+            raise TypeError(f"parse() field {name!r} must be an array.array, got {type(values)}")
+        offset = _align(offset)
+        header_fields.append(
+            {"name": name, "typecode": values.typecode, "offset": offset, "length": len(values)}
+        )
+        offset += len(values) * values.itemsize
+
+    header = json.dumps(
+        {"byteorder": sys.byteorder, "size": offset, "fields": header_fields}
+    ).encode()
+    data_start = _align(len(MAGIC) + 8 + len(header))
+    blob = bytearray(data_start + offset)
+    blob[: len(MAGIC)] = MAGIC
+    struct.pack_into("<Q", blob, len(MAGIC), len(header))
+    blob[len(MAGIC) + 8 : len(MAGIC) + 8 + len(header)] = header
+    for field, values in zip(header_fields, fields.values()):
+        start = data_start + field["offset"]
+        raw = values.tobytes()
+        blob[start : start + len(raw)] = raw
+    write_atomic(path, bytes(blob))
+
+
+def load(path: Path) -> dict[str, memoryview] | None:
+    """Memory-map a sidecar and return zero-copy views, or None if it is unusable."""
+    with path.open("rb") as handle:
+        if path.stat().st_size < len(MAGIC) + 8:
+            return None
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    # The views below keep the mapping alive; it is unmapped once they are freed.
+    view = memoryview(mapped)
+    try:
+        if bytes(view[: len(MAGIC)]) != MAGIC:
+            return None
+        (header_len,) = struct.unpack_from("<Q", view, len(MAGIC))
+        header_end = len(MAGIC) + 8 + header_len
+        if header_end > len(view):
+            return None
+        header = json.loads(bytes(view[len(MAGIC) + 8 : header_end]))
+        data_start = _align(header_end)
+        # A short file would otherwise just yield short views below.
+        if header["byteorder"] != sys.byteorder or data_start + header["size"] != len(view):
+            return None
+
+        fields: dict[str, memoryview] = {}
+        for field in header["fields"]:
+            itemsize = array(field["typecode"]).itemsize
+            start = data_start + field["offset"]
+            end = start + field["length"] * itemsize
+            if field["offset"] < 0 or end > len(view):
+                return None
+            fields[field["name"]] = view[start:end].cast(field["typecode"])
+        return fields
+    except (struct.error, ValueError, TypeError, KeyError):
+        # json.JSONDecodeError and UnicodeDecodeError are ValueErrors too.
+        return None
+
+
+def load_or_parse(
+    parse: Callable[[bytes], Mapping[str, array]],
+    read_bytes: Callable[[], bytes],
+    data_dir: Path,
+    input_digest: str,
+    part: int,
+) -> tuple[Mapping[str, memoryview] | Mapping[str, array], bool]:
+    """Return (parsed fields, cache_hit), parsing and writing the sidecar on a miss."""
+    path = cache_path(data_dir, input_digest, part, parser_digest(parse))
+    if path.exists():
+        fields = load(path)
+        if fields is not None:
+            return fields, True
+
+    parsed = parse(read_bytes())
+    dump(path, parsed)
+    return parsed, False
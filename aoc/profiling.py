@@ -0,0 +1,129 @@
+"""
+Optional profilers wrapped around the read_input() and solve() phases.
+
+cProfile stats are written to profiles/<label>.prof (open them with
+`python -m pstats` or snakeviz) and the top functions by cumulative time are
+printed to stderr so the answer on stdout stays clean. tracemalloc snapshots
+are written to profiles/<label>.tracemalloc and the lines that gained the
+most memory over the phase are printed along with the traced peak.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import sys
+import tracemalloc
+from pathlib import Path
+from types import TracebackType
+
+from aoc.loader import ROOT
+from aoc.units import format_bytes
+
+PROFILES_DIR = ROOT / "profiles"
+PROFILERS = ("cprofile", "tracemalloc")
+
+
+class Profiler:
+    """
+    Context manager that profiles every `with` block it wraps, accumulating
+    across repeats, until report() is called.
+
+    A `kind` of None turns it into a no-op so call sites need no branching.
+    """
+
+    def __init__(self, kind: str | None, label: str, top: int = 20) -> None:
+        if kind is not None and kind not in PROFILERS:
+            raise ValueError(f"Unknown profiler {kind!r}; choose from {PROFILERS}.")
+        self.kind = kind
+        self.label = label
+        self.top = top
+        self._cprofile: cProfile.Profile | None = None
+        self._before: tracemalloc.Snapshot | None = None
+        self._after: tracemalloc.Snapshot | None = None
+        self._started_tracing = False
+        self._peak = 0
+
+    def __enter__(self) -> Profiler:
+        if self.kind == "cprofile":
+            if self._cprofile is None:
+                self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        elif self.kind == "tracemalloc":
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            self._before = tracemalloc.take_snapshot()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self.kind == "cprofile" and self._cprofile is not None:
+            self._cprofile.disable()
+        elif self.kind == "tracemalloc":
+            self._after = tracemalloc.take_snapshot()
+            self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    def report(self) -> Path | None:
+        """Save the collected profile under profiles/ and print the top entries."""
+        if self.kind == "cprofile" and self._cprofile is not None:
+            return self._report_cprofile(self._cprofile)
+        if self.kind == "tracemalloc" and self._after is not None:
+            return self._report_tracemalloc(self._after)
+        return None
+
+    def _report_cprofile(self, profile: cProfile.Profile) -> Path:
+        PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+        path = PROFILES_DIR / f"{self.label}.prof"
+        profile.dump_stats(path)
+        print(f"\n[{self.label}] cProfile stats saved to {_display(path)}", file=sys.stderr)
+        stats = pstats.Stats(profile, stream=sys.stderr)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        return path
+
+    def _report_tracemalloc(self, after: tracemalloc.Snapshot) -> Path:
+        PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+        path = PROFILES_DIR / f"{self.label}.tracemalloc"
+        after.dump(str(path))
+
+        ignore = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+        after = after.filter_traces(ignore)
+        if self._before is not None:
+            stats = after.compare_to(self._before.filter_traces(ignore), "lineno")
+        else:
+            stats = after.statistics("lineno")
+
+        print(
+            f"\n[{self.label}] tracemalloc snapshot saved to {_display(path)}; "
+            f"peak traced {format_bytes(self._peak)}",
+            file=sys.stderr,
+        )
+        print(f"Top {self.top} lines by memory held after the phase:", file=sys.stderr)
+        for stat in stats[: self.top]:
+            frame = stat.traceback[0]
+            size = getattr(stat, "size_diff", stat.size)
+            count = getattr(stat, "count_diff", stat.count)
+            print(
+                f"  {_display(Path(frame.filename))}:{frame.lineno}: "
+                f"{format_bytes(size)} in {count} blocks",
+                file=sys.stderr,
+            )
+        return path
+
+
+def _display(path: Path) -> str:
+    try:
+        return str(path.resolve().relative_to(ROOT))
+    except ValueError:
+        return str(path)
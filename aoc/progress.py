@@ -0,0 +1,156 @@
+"""
+Progress reporting and deadlines for running solves.
+
+Solutions report progress by calling
+
+    from aoc import progress
+    progress.update(done, total)   # total may be None if unknown
+
+every so often (per chunk, row or round, not per item). Outside of `main.py
+execute` that is a no-op. The runner injects a Tracker for the duration of a
+run: with --progress it renders items done, items/s and an ETA on stderr (at
+most a few times a second), and with --timeout it raises Cancelled from
+update() once the deadline has passed, so the solve unwinds cleanly at a point
+of its own choosing. Solves that never call update() are interrupted by a
+SIGALRM shortly after the deadline instead, where the platform has one.
+Either is raised in the main process only; solves that fan out to a process
+pool start it with lib.worker_pool(), which terminates the workers as the
+exception unwinds rather than waiting for their remaining tasks.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import signal
+import sys
+import threading
+import time
+from typing import Iterator, TextIO
+
+from aoc.units import format_count, format_duration
+
+# Extra time a solve gets to reach its next update() before SIGALRM fires.
+GRACE = 1.0
+
+
+class Cancelled(Exception):
+    """Raised inside a solve that has run past its deadline."""
+
+
+class Tracker:
+    def __init__(
+        self,
+        label: str,
+        deadline: float | None = None,
+        render: bool = False,
+        stream: TextIO | None = None,
+        interval: float = 0.25,
+    ) -> None:
+        self.label = label
+        self.deadline = deadline
+        self.render = render
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self.started = time.monotonic()
+        self.done = 0
+        self.total: int | None = None
+        # items/s counts only work done in this run: from (time, done) here on.
+        self._since = self.started
+        self._done_before = 0
+        self._rebase = False
+        self._last_render = 0.0
+        self._rendered = False
+
+    def update(self, done: int, total: int | None = None) -> None:
+        now = time.monotonic()
+        self.done = done
+        if self._rebase:
+            self._rebase = False
+            self._since, self._done_before = now, done
+        if total is not None:
+            self.total = total
+        if self.deadline is not None and now >= self.deadline:
+            raise Cancelled(f"{self.label} ran past its deadline")
+        if self.render and now - self._last_render >= self.interval:
+            self._last_render = now
+            self._draw(now)
+
+    def resumed(self) -> None:
+        """
+        The solve picked up from a checkpoint, so its next update() counts
+        items done by earlier runs too; measure the rate from that point on.
+        """
+        self._rebase = True
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self._since
+        return (self.done - self._done_before) / elapsed if elapsed > 0 else 0.0
+
+    def describe(self) -> str:
+        """e.g. "1.2M/200.0M items (0.6%), 246.0k items/s, ETA 812.00 s" """
+        rate = self.rate
+        text = f"{format_count(self.done)}"
+        if self.total:
+            text += f"/{format_count(self.total)} items ({100 * self.done / self.total:.1f}%)"
+        else:
+            text += " items"
+        text += f", {format_count(rate)} items/s"
+        if self.total and rate > 0:
+            text += f", ETA {format_duration(max(0, self.total - self.done) / rate)}"
+        return text
+
+    def _draw(self, now: float) -> None:
+        elapsed = format_duration(now - self.started)
+        self.stream.write(f"\r\x1b[K{self.label}  {elapsed:>9}  {self.describe()}")
+        self.stream.flush()
+        self._rendered = True
+
+    def close(self) -> None:
+        if self._rendered:
+            self.stream.write("\r\x1b[K")
+            self.stream.flush()
+
+
+_active: Tracker | None = None
+
+
+def update(done: int, total: int | None = None) -> None:
+    """Report progress from inside a solve; cheap no-op when nothing is tracking."""
+    if _active is not None:
+        _active.update(done, total)
+
+
+def resumed() -> None:
+    """Tell the active Tracker (if any) that the solve restarted from a checkpoint."""
+    if _active is not None:
+        _active.resumed()
+
+
+def _alarm(signum: int, frame: object) -> None:
+    raise Cancelled("deadline passed (SIGALRM)")
+
+
+@contextlib.contextmanager
+def tracking(tracker: Tracker) -> Iterator[Tracker]:
+    """Install tracker for update() calls, and arm SIGALRM if it has a deadline."""
+    global _active
+    previous = _active
+    _active = tracker
+    armed = (
+        tracker.deadline is not None
+        and hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+    if armed:
+        old_handler = signal.signal(signal.SIGALRM, _alarm)
+        delay = max(tracker.deadline - time.monotonic(), 0.0) + GRACE
+        signal.setitimer(signal.ITIMER_REAL, delay)
+    try:
+        yield tracker
+    finally:
+        if armed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, old_handler)
+        _active = previous
+        tracker.close()
@@ -0,0 +1,118 @@
+"""
+Named solve() variants per solution file.
+
+A solution's plain solve(lines) is always available as the "solve" variant.
+Alternative implementations register themselves with the decorator:
+
+    from aoc.registry import variant
+
+    @variant("precomputed")
+    def solve2(lines: list[str]) -> int: ...
+
+    @variant("bytes", kind="bytes")
+    def solve_bytes(data: bytes) -> int: ...
+
+`kind` says what the variant is handed: the input's lines, its raw bytes, or
+the path of a file holding it (for solutions that mmap or stream it
+themselves). `main.py execute --impl NAME` runs one variant; `bench
+--all-impls` checks they agree, ranks them and can remember the fastest per
+input size class in benchmarks/impls.json, which `--impl auto` then follows.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc.loader import ROOT
+from aoc.store import InputSource, write_atomic
+
+KINDS = ("lines", "bytes", "path")
+DEFAULT = "solve"
+AUTO = "auto"
+CHOICES_PATH = ROOT / "benchmarks" / "impls.json"
+
+# module name -> variant name -> Variant, filled in as solution files are imported.
+_VARIANTS: dict[str, dict[str, Variant]] = {}
+
+
+@dataclass
+class Variant:
+    name: str
+    fn: Callable[[Any], int | str]
+    kind: str = "lines"
+
+    def reader(self, source: InputSource) -> Callable[[], Any]:
+        """The call that loads the input in the form this variant expects."""
+        if self.kind == "bytes":
+            return source.read_bytes
+        if self.kind == "path":
+            return source.file
+        return source.read_lines
+
+
+def variant(
+    name: str | None = None, kind: str = "lines"
+) -> Callable[[Callable[[Any], int | str]], Callable[[Any], int | str]]:
+    """Register the decorated function as a named implementation of its solution."""
+    if kind not in KINDS:
+        raise ValueError(f"Unknown variant kind {kind!r}; choose from {KINDS}.")
+
+    def register(fn: Callable[[Any], int | str]) -> Callable[[Any], int | str]:
+        label = name or fn.__name__
+        if label == AUTO:
+            raise ValueError(f"{AUTO!r} is reserved for automatic selection.")
+        _VARIANTS.setdefault(fn.__module__, {})[label] = Variant(label, fn, kind)
+        return fn
+
+    return register
+
+
+def variants(module: ModuleType) -> dict[str, Variant]:
+    """Every implementation of a solution, starting with its plain solve()."""
+    found: dict[str, Variant] = {}
+    solve = getattr(module, "solve", None)
+    if callable(solve):
+        found[DEFAULT] = Variant(DEFAULT, solve)
+    found.update(_VARIANTS.get(module.__name__, {}))
+    return found
+
+
+def size_class(size: int) -> str:
+    """Bucket an input size in bytes by power of two, e.g. 20000 -> "2^15"."""
+    return f"2^{max(0, size - 1).bit_length()}"
+
+
+def load_choices(path: Path = CHOICES_PATH) -> dict[str, dict[str, str]]:
+    """{"dayXX-partY": {size_class: variant name}}"""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def remember_choice(label: str, size: int, name: str, path: Path = CHOICES_PATH) -> None:
+    choices = load_choices(path)
+    choices.setdefault(label, {})[size_class(size)] = name
+    write_atomic(path, (json.dumps(choices, indent=2, sort_keys=True) + "\n").encode())
+
+
+def choose(
+    label: str, size: int, available: dict[str, Variant], path: Path = CHOICES_PATH
+) -> str:
+    """
+    The remembered fastest variant for this size class, else the one remembered
+    for the nearest class, else the default.
+    """
+    remembered = {
+        bucket: name
+        for bucket, name in load_choices(path).get(label, {}).items()
+        if name in available
+    }
+    if not remembered:
+        return DEFAULT
+    wanted = max(0, size - 1).bit_length()
+    nearest = min(remembered, key=lambda bucket: abs(int(bucket[2:]) - wanted))
+    return remembered[nearest]
@@ -0,0 +1,47 @@
+"""Timing (and optional memory/profiling) around a single solution phase."""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from aoc.memory import MemoryMeter, MemoryStats
+from aoc.profiling import Profiler
+
+
+@dataclass
+class Phase:
+    value: Any
+    elapsed_ns: int
+    memory: MemoryStats | None = None
+
+
+def run_phase(
+    fn: Callable[..., Any],
+    *args: Any,
+    profiler: Profiler | None = None,
+    measure_memory: bool = False,
+    stdout_to_stderr: bool = False,
+) -> Phase:
+    """
+    Call fn(*args) and time it.
+
+    With measure_memory the call also runs under a MemoryMeter, and with
+    stdout_to_stderr anything the solution prints is diverted to stderr so
+    machine-readable output on stdout stays parseable.
+    """
+    meter = MemoryMeter() if measure_memory else contextlib.nullcontext()
+    redirect = (
+        contextlib.redirect_stdout(sys.stderr)
+        if stdout_to_stderr
+        else contextlib.nullcontext()
+    )
+    with redirect, meter, profiler or contextlib.nullcontext():
+        start = time.perf_counter_ns()
+        value = fn(*args)
+        elapsed = time.perf_counter_ns() - start
+    stats = meter.stats if isinstance(meter, MemoryMeter) else None
+    return Phase(value, elapsed, stats)
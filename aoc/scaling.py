@@ -0,0 +1,121 @@
+"""
+Empirical complexity curves for solve().
+
+Each solution is run on generated inputs that grow geometrically; a
+least-squares fit of log(time) against log(input bytes) gives the scaling
+exponent (1.0 is linear, 2.0 quadratic, ...). Exponents can be saved as a
+baseline and later runs flag any solution whose exponent grew by more than a
+tolerance.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import math
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from aoc import generators
+from aoc.loader import ROOT
+
+BASELINE_PATH = ROOT / "benchmarks" / "scaling.json"
+
+# Smallest scale per day, chosen so the first run takes around a millisecond.
+BASE_SCALES = {1: 2000, 2: 50, 3: 200, 4: 24, 5: 100, 6: 500}
+# Day 4's scale is the grid side, so the input grows with its square.
+SCALE_DIMENSIONS = {4: 2}
+
+
+@dataclass
+class ScalingResult:
+    label: str
+    sizes: list[int]
+    seconds: list[float]
+    exponent: float
+
+
+def scales(day: int, steps: int, factor: float) -> list[int]:
+    """Geometric sequence of generator scales whose input size grows by `factor`."""
+    base = BASE_SCALES[day]
+    growth = factor ** (1 / SCALE_DIMENSIONS.get(day, 1))
+    return [max(1, round(base * growth**step)) for step in range(steps)]
+
+
+def fit_exponent(sizes: list[int], seconds: list[float]) -> float:
+    """Slope of the least-squares line through (log size, log seconds)."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1e-9)) for value in seconds]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if var_x == 0:
+        return float("nan")
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return cov / var_x
+
+
+def measure(
+    label: str,
+    day: int,
+    solve: Callable[[list[str]], object],
+    steps: int = 5,
+    factor: float = 2.0,
+    repeat: int = 3,
+    seed: int = 0,
+    max_seconds: float = 5.0,
+) -> ScalingResult:
+    """
+    Time solve() (best of `repeat`) at each scale, stopping early once a single
+    run exceeds max_seconds so a quadratic solution cannot stall the suite.
+    """
+    sizes: list[int] = []
+    seconds: list[float] = []
+    for scale in scales(day, steps, factor):
+        text = generators.generate_text(day, scale, seed)
+        lines = text.splitlines()
+        best = math.inf
+        for _ in range(repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                solve(lines)
+                best = min(best, time.perf_counter() - start)
+        sizes.append(len(text))
+        seconds.append(best)
+        if best > max_seconds:
+            break
+
+    exponent = fit_exponent(sizes, seconds) if len(sizes) > 1 else float("nan")
+    return ScalingResult(label, sizes, seconds, exponent)
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(results: list[ScalingResult], path: Path = BASELINE_PATH) -> None:
+    """Merge results into the baseline file, keyed by label."""
+    baseline = load_baseline(path)
+    for result in results:
+        baseline[result.label] = asdict(result)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def regressions(
+    results: list[ScalingResult], baseline: dict[str, dict], tolerance: float
+) -> list[tuple[ScalingResult, float]]:
+    """Results whose exponent exceeds the baseline exponent by more than tolerance."""
+    worse: list[tuple[ScalingResult, float]] = []
+    for result in results:
+        previous = baseline.get(result.label)
+        if previous is None or math.isnan(result.exponent):
+            continue
+        if result.exponent > previous["exponent"] + tolerance:
+            worse.append((result, previous["exponent"]))
+    return worse
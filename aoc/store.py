@@ -0,0 +1,305 @@
+"""
+Content-addressed store for puzzle inputs.
+
+Blobs live under data/store/sha256/<first two hex digits>/<digest>[.gz|.zst],
+named by the SHA-256 of their *uncompressed* content, so identical inputs are
+stored once and any corruption is detected on read. Every write goes through
+a temp file plus rename, so a crash can never leave a half-written blob or
+ref behind.
+
+A day points at its blob through a small JSON ref file next to where the
+plain input used to live (data/YYYY/dayXX/part1.ref). read_input_text()
+resolves the ref and falls back to the legacy part1.txt, which is what the
+solutions' read_input() calls. Uncompressed blobs are read through mmap;
+compressed ones through a streaming decompressor.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import io
+import json
+import mmap
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+from aoc.loader import ROOT
+
+STORE_DIR = ROOT / "data" / "store"
+REF_NAME = "part1.ref"
+LEGACY_NAME = "part1.txt"
+COMPRESSIONS = ("none", "gzip", "zstd")
+SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+CHUNK = 1 << 20
+
+
+class IntegrityError(Exception):
+    """A blob's content no longer matches the digest it is stored under."""
+
+
+# What reading a damaged blob can raise: a digest mismatch, or a compressed
+# stream that no longer decodes (gzip.BadGzipFile is an OSError, truncated
+# streams raise EOFError).
+DAMAGED: tuple[type[Exception], ...] = (IntegrityError, OSError, EOFError)
+if zstandard is not None:
+    DAMAGED += (zstandard.ZstdError,)
+
+
+@dataclass
+class Ref:
+    sha256: str
+    size: int
+    compression: str
+
+    @classmethod
+    def load(cls, path: Path) -> Ref:
+        return cls(**json.loads(path.read_text()))
+
+    def dump(self) -> bytes:
+        return json.dumps(asdict(self), indent=2).encode() + b"\n"
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file in the same directory and rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        # mkstemp creates 0600 files; match what a plain write would produce.
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "none":
+        return data
+    if compression == "gzip":
+        # mtime=0 keeps the compressed bytes reproducible.
+        return gzip.compress(data, mtime=0)
+    if compression == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd compression needs the optional 'zstandard' package.")
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    raise ValueError(f"Unknown compression {compression!r}; choose from {COMPRESSIONS}.")
+
+
+class InputStore:
+    def __init__(self, root: Path = STORE_DIR) -> None:
+        self.root = root
+
+    def blob_path(self, digest: str, compression: str) -> Path:
+        return self.root / "sha256" / digest[:2] / f"{digest}{SUFFIXES[compression]}"
+
+    def put(self, data: bytes, compression: str = "none") -> Ref:
+        """Store data (unless an intact copy is already there) and return a ref to it."""
+        ref = Ref(hashlib.sha256(data).hexdigest(), len(data), compression)
+        # A blob that no longer matches its digest is replaced, so importing
+        # or fetching the input again repairs it.
+        if not self.intact(ref):
+            write_atomic(self.blob_path(ref.sha256, compression), _compress(data, compression))
+        return ref
+
+    @contextlib.contextmanager
+    def open(self, ref: Ref) -> Iterator[BinaryIO]:
+        """Stream a blob's uncompressed content."""
+        path = self.blob_path(ref.sha256, ref.compression)
+        if not path.exists():
+            raise FileNotFoundError(f"Missing blob {ref.sha256} in {self.root}")
+        if ref.compression == "gzip":
+            with gzip.open(path, "rb") as stream:
+                yield stream
+        elif ref.compression == "zstd":
+            if zstandard is None:
+                raise ValueError("Reading zstd blobs needs the optional 'zstandard' package.")
+            with path.open("rb") as raw, zstandard.ZstdDecompressor().stream_reader(raw) as stream:
+                yield stream
+        else:
+            with path.open("rb") as stream:
+                yield stream
+
+    def read(self, ref: Ref, verify: bool = True) -> bytes:
+        """Return a blob's content, checking it against its digest."""
+        path = self.blob_path(ref.sha256, ref.compression)
+        if ref.compression == "none" and ref.size:
+            if not path.exists():
+                raise FileNotFoundError(f"Missing blob {ref.sha256} in {self.root}")
+            with path.open("rb") as handle, mmap.mmap(
+                handle.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                if verify:
+                    self._check(ref, hashlib.sha256(mapped).hexdigest())
+                return mapped[:]
+
+        buffer = io.BytesIO()
+        digest = hashlib.sha256()
+        with self.open(ref) as stream:
+            while chunk := stream.read(CHUNK):
+                digest.update(chunk)
+                buffer.write(chunk)
+        if verify:
+            self._check(ref, digest.hexdigest())
+        return buffer.getvalue()
+
+    def verify(self, ref: Ref) -> None:
+        digest = hashlib.sha256()
+        with self.open(ref) as stream:
+            while chunk := stream.read(CHUNK):
+                digest.update(chunk)
+        self._check(ref, digest.hexdigest())
+
+    def intact(self, ref: Ref) -> bool:
+        """Whether ref's blob exists and still decompresses to content matching its digest."""
+        if not self.blob_path(ref.sha256, ref.compression).exists():
+            return False
+        try:
+            self.verify(ref)
+        except DAMAGED:
+            return False
+        return True
+
+    def blobs(self) -> Iterator[Ref]:
+        """Every blob in the store (size is left as -1; it is not recorded on disk)."""
+        suffix_to_compression = {suffix: name for name, suffix in SUFFIXES.items() if suffix}
+        for path in sorted((self.root / "sha256").glob("*/*")):
+            if path.name.startswith("."):
+                continue
+            compression = suffix_to_compression.get(path.suffix, "none")
+            digest = path.name.removesuffix(SUFFIXES[compression])
+            yield Ref(digest, -1, compression)
+
+    def _check(self, ref: Ref, actual: str) -> None:
+        if actual != ref.sha256:
+            raise IntegrityError(
+                f"Blob {self.blob_path(ref.sha256, ref.compression)} is corrupt: "
+                f"content hashes to {actual}"
+            )
+
+
+def ref_path(data_dir: Path) -> Path:
+    return data_dir / REF_NAME
+
+
+def store_input(
+    data_dir: Path, data: bytes, compression: str = "none", store: InputStore | None = None
+) -> tuple[Ref, bool]:
+    """Store a day's input and point its ref at it; returns (ref, changed)."""
+    store = store or InputStore()
+    ref = store.put(data, compression)
+    path = ref_path(data_dir)
+    if path.exists() and Ref.load(path) == ref:
+        return ref, False
+    write_atomic(path, ref.dump())
+    return ref, True
+
+
+def current_ref(data_dir: Path) -> Ref | None:
+    path = ref_path(data_dir)
+    return Ref.load(path) if path.exists() else None
+
+
+def file_digest(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def legacy_path(data_dir: Path) -> Path:
+    legacy = data_dir / LEGACY_NAME
+    if not legacy.exists():
+        raise FileNotFoundError(
+            f"No input found in {data_dir}. Run main.py fetch or add {LEGACY_NAME}."
+        )
+    return legacy
+
+
+def input_digest(data_dir: Path) -> str:
+    """SHA-256 of a day's input; free when it is in the store (read from the ref)."""
+    ref = current_ref(data_dir)
+    if ref is not None:
+        return ref.sha256
+    return file_digest(legacy_path(data_dir))
+
+
+def input_size(data_dir: Path) -> int:
+    ref = current_ref(data_dir)
+    if ref is not None:
+        return ref.size
+    return legacy_path(data_dir).stat().st_size
+
+
+def input_file(data_dir: Path, store: InputStore | None = None) -> Path:
+    """
+    A plain file holding a day's input, for solutions that map or stream it
+    themselves. Compressed blobs have no such file.
+    """
+    ref = current_ref(data_dir)
+    if ref is None:
+        return legacy_path(data_dir)
+    if ref.compression != "none":
+        raise ValueError(
+            f"The input for {data_dir} is stored {ref.compression}-compressed; "
+            "re-import it with --compress none to read it as a file."
+        )
+    path = (store or InputStore()).blob_path(ref.sha256, ref.compression)
+    if not path.exists():
+        raise FileNotFoundError(f"Missing blob {ref.sha256} in {STORE_DIR}")
+    return path
+
+
+def read_input_bytes(data_dir: Path, store: InputStore | None = None) -> bytes:
+    """A day's input via its store ref, falling back to the legacy part1.txt."""
+    ref = current_ref(data_dir)
+    if ref is not None:
+        return (store or InputStore()).read(ref)
+    return legacy_path(data_dir).read_bytes()
+
+
+def read_input_text(data_dir: Path, store: InputStore | None = None) -> str:
+    return read_input_bytes(data_dir, store).decode()
+
+
+@dataclass
+class InputSource:
+    """
+    Where a run's input comes from: a day's stored input, or an explicit file
+    (e.g. one written by `main.py gen`) when `path` is set.
+    """
+
+    data_dir: Path
+    path: Path | None = None
+
+    def read_bytes(self) -> bytes:
+        if self.path is not None:
+            return self.path.read_bytes()
+        return read_input_bytes(self.data_dir)
+
+    def read_lines(self) -> list[str]:
+        return self.read_bytes().decode().splitlines()
+
+    def file(self) -> Path:
+        return self.path if self.path is not None else input_file(self.data_dir)
+
+    def digest(self) -> str:
+        if self.path is not None:
+            return file_digest(self.path)
+        return input_digest(self.data_dir)
+
+    def size(self) -> int:
+        if self.path is not None:
+            return self.path.stat().st_size
+        return input_size(self.data_dir)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+
+def format_duration(seconds: float) -> str:
+    """Render a duration with a unit that keeps 3-4 significant digits."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def format_count(value: float) -> str:
+    """Render a count with a k/M/G suffix, e.g. 1234567 -> "1.2M"."""
+    for unit, size in (("G", 1e9), ("M", 1e6), ("k", 1e3)):
+        if value >= size:
+            return f"{value / size:.1f}{unit}"
+    return f"{value:.0f}"
+
+
+def format_bytes(size: float) -> str:
+    """Render a byte count using binary prefixes."""
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GiB"
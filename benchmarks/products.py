@@ -0,0 +1,85 @@
+"""
+Balanced-tree products (lib.product) against left folds.
+
+    uv run benchmarks/products.py [--factors 1000 5000 20000] [--digits 4 12]
+
+times functools.reduce, math.prod and the tree on generated factor columns,
+each like one very wide day06 problem, and checks that all three agree.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import math
+import operator
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from solutions.lib.products import product  # noqa: E402
+
+
+def factor_column(count: int, digits: int, seed: int = 0) -> list[int]:
+    """`count` random factors of exactly `digits` digits, like one wide day06 problem."""
+    rng = random.Random(f"{seed}:{count}:{digits}")
+    return [rng.randint(10 ** (digits - 1), 10**digits - 1) for _ in range(count)]
+
+
+ENGINES: dict[str, Callable[[list[int]], int]] = {
+    "reduce": lambda factors: functools.reduce(operator.mul, factors, 1),
+    "math.prod": math.prod,
+    "tree": product,
+}
+
+
+def benchmark(
+    counts: Iterable[int], digits: Iterable[int], repeat: int = 3, seed: int = 0
+) -> list[dict[str, object]]:
+    """Best-of-`repeat` seconds per engine for every (count, digits) column."""
+    results = []
+    for digit_count in digits:
+        for count in counts:
+            factors = factor_column(count, digit_count, seed)
+            timings: dict[str, float] = {}
+            answers = set()
+            for name, engine in ENGINES.items():
+                best = math.inf
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    answers.add(engine(factors))
+                    best = min(best, time.perf_counter() - started)
+                timings[name] = best
+            if len(answers) != 1:
+                raise AssertionError(f"Engines disagree on {count} x {digit_count} digits")
+            results.append({"factors": count, "digits": digit_count, "seconds": timings})
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark balanced-tree products.")
+    parser.add_argument("--factors", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--digits", type=int, nargs="+", default=[4, 12])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    names = list(ENGINES)
+    header = "".join(f"{name:>12}" for name in names)
+    print(f"{'factors':>8} {'digits':>6}{header}{'speedup':>10}")
+    for row in benchmark(args.factors, args.digits, args.repeat, args.seed):
+        seconds = row["seconds"]
+        assert isinstance(seconds, dict)
+        cells = "".join(f"{seconds[name] * 1000:>10.2f}ms" for name in names)
+        speedup = seconds["math.prod"] / seconds["tree"]
+        print(f"{row['factors']:>8} {row['digits']:>6}{cells}{speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,47 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import datetime as dt
-import importlib.util
+import functools
 import hashlib
+import io
+import json
 import os
 import shutil
+import statistics
 import sys
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional
 
-import requests
 from dotenv import load_dotenv
 
+from aoc import (
+    checkpoint,
+    fuzz,
+    generators,
+    harness,
+    parse_cache,
+    progress,
+    registry,
+    scaling,
+    store,
+)
+from aoc.fetch import AOC_URL, FetchResult, InputFetcher
+from aoc.loader import import_solution, solution_path
+from aoc.memory import MemoryStats, describe_memory, peak_rss
+from aoc.output import FORMATS, RecordWriter
+from aoc.profiling import PROFILERS, Profiler
+from aoc.runner import Phase, run_phase
+from aoc.units import format_duration
+
 ROOT = Path(__file__).parent
 DATA_DIR = ROOT / "data"
 SOLUTIONS_DIR = ROOT / "solutions"
+GENERATED_DIR = DATA_DIR / "generated"
 ENV_PATH = ROOT / ".env"
 AOC_COOKIE_KEY = "AOC_COOKIE"
 
@@ -40,32 +65,110 @@ def get_cookie(explicit_cookie: Optional[str]) -> str:
     return cookie
 
 
-def fetch_input(day: int, year: int, cookie: str) -> Path:
-    if day < 1 or day > 25:
-        raise SystemExit("Day must be between 1 and 25.")
+def input_dir(year: int, day: int) -> Path:
+    return DATA_DIR / str(year) / f"day{day:02d}"
 
-    day_dir = DATA_DIR / str(year) / f"day{day:02d}"
-    day_dir.mkdir(parents=True, exist_ok=True)
-    target_path = day_dir / "part1.txt"
 
-    url = f"https://adventofcode.com/{year}/day/{day}/input"
+def parse_range_spec(spec: str) -> list[int]:
+    """Parse "5", "1-25" or "1,3,10-12" into a sorted list of ints."""
+    values: set[int] = set()
     try:
-        resp = requests.get(
-            url,
-            headers={"Cookie": cookie, "User-Agent": "aoc-cli"},
-            timeout=15,
-        )
-    except requests.RequestException as exc:
-        raise SystemExit(f"Network error fetching day {day}: {exc}")
+        for chunk in spec.split(","):
+            chunk = chunk.strip()
+            if "-" in chunk:
+                low, high = (int(bound) for bound in chunk.split("-", 1))
+                values.update(range(low, high + 1))
+            elif chunk:
+                values.add(int(chunk))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid range {spec!r}; use e.g. 5, 1-25 or 1,3,5-7")
+    if not values:
+        raise argparse.ArgumentTypeError(f"Empty range {spec!r}")
+    return sorted(values)
+
+
+def positive_seconds(value: str) -> float:
+    """argparse type for timeouts: a number of seconds greater than zero."""
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid number of seconds {value!r}")
+    if not seconds > 0:
+        raise argparse.ArgumentTypeError(f"Timeout must be greater than 0, got {value!r}")
+    return seconds
+
+
+def fetch_inputs(
+    days: list[int],
+    years: list[int],
+    cookie: str,
+    base_url: str = AOC_URL,
+    concurrency: int = 4,
+    rate: float = 2.0,
+    retries: int = 5,
+    compression: str = "none",
+) -> list[FetchResult]:
+    if any(day < 1 or day > 25 for day in days):
+        raise SystemExit("Day must be between 1 and 25.")
+
+    jobs = [(year, day) for year in years for day in days]
+    results: list[FetchResult] = []
+    with InputFetcher(
+        cookie,
+        base_url=base_url,
+        concurrency=concurrency,
+        rate=rate,
+        retries=retries,
+        compression=compression,
+    ) as fetcher:
+        for result in fetcher.fetch_many(jobs, input_dir):
+            label = f"{result.year} day {result.day:02d}"
+            ref = store.ref_path(result.data_dir).relative_to(ROOT)
+            if result.status == "written":
+                print(f"Wrote input to the store ({ref})")
+            elif result.status == "unchanged":
+                print(f"{label}: unchanged ({ref})")
+            else:
+                print(f"{label}: failed: {result.detail}", file=sys.stderr)
+            results.append(result)
+    return results
+
+
+def import_inputs(years: list[int], days: list[int], compression: str, prune: bool) -> None:
+    """Move existing plain part1.txt inputs into the content-addressed store."""
+    imported = 0
+    for year in years:
+        for day in days:
+            data_dir = input_dir(year, day)
+            legacy = data_dir / store.LEGACY_NAME
+            if not legacy.exists():
+                continue
+            ref, _ = store.store_input(data_dir, legacy.read_bytes(), compression)
+            # Read back through the store before dropping the plain copy.
+            if store.read_input_bytes(data_dir) != legacy.read_bytes():
+                raise SystemExit(f"Store round-trip failed for {legacy.relative_to(ROOT)}")
+            if prune:
+                legacy.unlink()
+            imported += 1
+            print(f"{legacy.relative_to(ROOT)} -> {ref.sha256[:12]} ({ref.compression})")
+    if not imported:
+        raise SystemExit("No part1.txt inputs found to import.")
 
-    if resp.status_code != 200:
-        raise SystemExit(
-            f"HTTP error {resp.status_code} fetching day {day}: {resp.text.strip()}"
-        )
 
-    target_path.write_bytes(resp.content)
-    print(f"Wrote input to {target_path.relative_to(ROOT)}")
-    return target_path
+def verify_store() -> None:
+    input_store = store.InputStore()
+    bad = 0
+    checked = 0
+    for ref in input_store.blobs():
+        checked += 1
+        try:
+            input_store.verify(ref)
+        except store.DAMAGED as exc:
+            bad += 1
+            print(f"CORRUPT {ref.sha256}: {exc}")
+    print(f"Checked {checked} blobs, {bad} corrupt.")
+    if bad:
+        raise SystemExit(1)
 
 
 def bootstrap_solution_file(day: int, year: int) -> Path:
@@ -93,46 +196,339 @@ def bootstrap_solution_file(day: int, year: int) -> Path:
     return dest
 
 
+def add_compress_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--compress",
+        choices=store.COMPRESSIONS,
+        default="none",
+        help="Compression for stored inputs (zstd needs the zstandard package; default: none)",
+    )
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        choices=PROFILERS,
+        help="Profile read_input() and solve(); results are saved under profiles/",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="Number of functions/lines to print per profiled phase (default: 20)",
+    )
+
+
+def add_report_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--input",
+        type=Path,
+        help="Read this file instead of the stored puzzle input (e.g. from `gen`)",
+    )
+    parser.add_argument(
+        "--no-parse-cache",
+        dest="parse_cache",
+        action="store_false",
+        help="Ignore parse()/solve_parsed() and always parse the text input",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Record peak RSS and tracemalloc peak for the parse and solve phases "
+        "(tracemalloc slows the solve down)",
+    )
+    add_format_argument(parser)
+
+
+def add_format_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="text",
+        help="Output format; json/ndjson stream one record per run as it finishes "
+        "(default: text)",
+    )
+
+
+def add_impl_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--impl",
+        type=str,
+        help="Registered implementation to run, or 'auto' for the remembered fastest "
+        "for this input size (default: solve)",
+    )
+
+
+def add_day_part_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--day",
+        type=parse_range_spec,
+        required=True,
+        help="Day number (1-25), or several days such as 1-6 or 1,3,5",
+    )
+    parser.add_argument(
+        "--part",
+        type=int,
+        choices=[1, 2],
+        help="Puzzle part (1 or 2; default: every existing part)",
+    )
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Advent of Code helper CLI")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     fetch_parser = subparsers.add_parser("fetch", help="Fetch puzzle input")
-    fetch_parser.add_argument("--day", type=int, required=True, help="Day number (1-25)")
-    fetch_parser.add_argument(
+    day_group = fetch_parser.add_mutually_exclusive_group(required=True)
+    day_group.add_argument("--day", type=int, help="Day number (1-25)")
+    day_group.add_argument(
+        "--days",
+        type=parse_range_spec,
+        help="Several days, e.g. 1-25 or 1,3,5-7",
+    )
+    year_group = fetch_parser.add_mutually_exclusive_group()
+    year_group.add_argument(
         "--year",
         type=int,
         default=dt.datetime.now().year,
         help="Year (default: current year)",
     )
+    year_group.add_argument(
+        "--years",
+        type=parse_range_spec,
+        help="Several years, e.g. 2015-2025",
+    )
     fetch_parser.add_argument(
         "--cookie",
         type=str,
         help="Cookie string to override AOC_COOKIE env/.env",
     )
+    fetch_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum simultaneous downloads (default: 4)",
+    )
+    fetch_parser.add_argument(
+        "--rate",
+        type=float,
+        default=2.0,
+        help="Maximum requests started per second (default: 2.0)",
+    )
+    fetch_parser.add_argument(
+        "--retries",
+        type=int,
+        default=5,
+        help="Retries with exponential backoff on 429/5xx (default: 5)",
+    )
+    fetch_parser.add_argument(
+        "--base-url",
+        type=str,
+        default=AOC_URL,
+        help="Server to fetch from, e.g. a local stand-in (default: %(default)s)",
+    )
+    add_compress_argument(fetch_parser)
+
+    import_parser = subparsers.add_parser(
+        "store-import",
+        help="Move plain data/YYYY/dayXX/part1.txt inputs into the content-addressed store",
+    )
+    import_parser.add_argument(
+        "--years",
+        type=parse_range_spec,
+        default=[dt.datetime.now().year],
+        help="Years to import, e.g. 2025 or 2015-2025 (default: current year)",
+    )
+    import_parser.add_argument(
+        "--days",
+        type=parse_range_spec,
+        default=list(range(1, 26)),
+        help="Days to import (default: 1-25)",
+    )
+    add_compress_argument(import_parser)
+    import_parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Delete part1.txt once it has been stored and read back",
+    )
+
+    subparsers.add_parser(
+        "store-verify", help="Re-hash every blob in the input store and report corruption"
+    )
 
     execute_parser = subparsers.add_parser(
         "execute",
         help="Run a specific solution (or its inline tests) by day and part",
     )
+    add_day_part_arguments(execute_parser)
     execute_parser.add_argument(
-        "--day",
-        type=int,
-        required=True,
-        help="Day number (1-25)",
+        "--test",
+        action="store_true",
+        help="Run inline tests (requires run_tests in the solution file)",
     )
+    add_impl_argument(execute_parser)
     execute_parser.add_argument(
-        "--part",
+        "--timeout",
+        type=positive_seconds,
+        help="Cancel a solution that runs longer than this many seconds and report "
+        "how far it got",
+    )
+    execute_parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Show items done, items/s and ETA for solutions that report progress",
+    )
+    execute_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue a resumable solve from its last checkpoint",
+    )
+    execute_parser.add_argument(
+        "--checkpoint-every",
+        type=float,
+        default=5.0,
+        help="Seconds between checkpoints of a resumable solve (default: 5.0)",
+    )
+    add_profile_arguments(execute_parser)
+    add_report_arguments(execute_parser)
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Time read_input() and solve() for a day and part over repeated runs",
+    )
+    add_day_part_arguments(bench_parser)
+    bench_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed runs (default: 5)",
+    )
+    add_impl_argument(bench_parser)
+    bench_parser.add_argument(
+        "--all-impls",
+        action="store_true",
+        help="Time every registered implementation, check they agree and rank them",
+    )
+    bench_parser.add_argument(
+        "--remember",
+        action="store_true",
+        help="With --all-impls, record the fastest per input size class for --impl auto",
+    )
+    add_profile_arguments(bench_parser)
+    add_report_arguments(bench_parser)
+
+    gen_parser = subparsers.add_parser(
+        "gen",
+        help="Write a deterministic synthetic input for a day, streamed to disk",
+    )
+    gen_parser.add_argument("--day", type=int, required=True, help="Day number (1-25)")
+    gen_parser.add_argument(
+        "--scale",
         type=int,
-        choices=[1, 2],
         required=True,
-        help="Puzzle part (1 or 2)",
+        help="Input size: lines/ranges/banks/problems, or the side of the day 4 grid",
     )
-    execute_parser.add_argument(
-        "--test",
+    gen_parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    gen_parser.add_argument(
+        "--output",
+        type=str,
+        help="Output path, or - for stdout "
+        "(default: data/generated/dayXX/scale<K>-seed<S>.txt)",
+    )
+
+    scaling_parser = subparsers.add_parser(
+        "scaling",
+        help="Fit empirical complexity exponents for solve() over generated inputs",
+    )
+    scaling_parser.add_argument("--day", type=int, help="Only this day (default: all)")
+    scaling_parser.add_argument(
+        "--part", type=int, choices=[1, 2], help="Only this part (default: both)"
+    )
+    scaling_parser.add_argument(
+        "--steps", type=int, default=5, help="Number of input sizes (default: 5)"
+    )
+    scaling_parser.add_argument(
+        "--factor",
+        type=float,
+        default=2.0,
+        help="Input size growth between steps (default: 2.0)",
+    )
+    scaling_parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per size, best kept (default: 3)"
+    )
+    scaling_parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=5.0,
+        help="Stop growing a solution once one run takes this long (default: 5.0)",
+    )
+    scaling_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed exponent increase over the baseline (default: 0.25)",
+    )
+    scaling_parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=scaling.BASELINE_PATH,
+        help="Baseline file (default: benchmarks/scaling.json)",
+    )
+    scaling_parser.add_argument(
+        "--save-baseline",
         action="store_true",
-        help="Run inline tests (requires run_tests in the solution file)",
+        help="Record these exponents as the new baseline instead of comparing",
+    )
+
+    fuzz_parser = subparsers.add_parser(
+        "fuzz",
+        help="Cross-check every registered implementation on small random inputs",
+    )
+    fuzz_parser.add_argument(
+        "--day",
+        type=parse_range_spec,
+        default=sorted(generators.GENERATORS),
+        help="Days to fuzz, e.g. 2 or 1-6 (default: every day with a generator)",
+    )
+    fuzz_parser.add_argument(
+        "--part", type=int, choices=[1, 2], help="Only this part (default: both)"
+    )
+    fuzz_parser.add_argument(
+        "--budget",
+        type=float,
+        default=30.0,
+        help="Seconds to spend generating, checking and shrinking (default: 30.0)",
     )
+    fuzz_parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    fuzz_parser.add_argument(
+        "--no-save",
+        dest="save",
+        action="store_false",
+        help="Report mismatches without adding reproducers to TESTS",
+    )
+
+    test_parser = subparsers.add_parser(
+        "test",
+        help="Run inline TESTS for every solution in parallel with per-case timeouts",
+    )
+    test_parser.add_argument(
+        "--day",
+        type=parse_range_spec,
+        help="Only run tests for these days, e.g. 4 or 1-6 (default: all days)",
+    )
+    test_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    test_parser.add_argument(
+        "--timeout",
+        type=positive_seconds,
+        default=10.0,
+        help="Seconds before a test case is killed (default: 10.0)",
+    )
+    add_format_argument(test_parser)
 
     sync_parser = subparsers.add_parser(
         "sync-part2",
@@ -166,7 +562,7 @@ def parse_args() -> argparse.Namespace:
 def load_solution_module(day: int, part: int):
     if day < 1 or day > 25:
         raise SystemExit("Day must be between 1 and 25.")
-    path = SOLUTIONS_DIR / f"day{day:02d}" / f"part{part}.py"
+    path = solution_path(day, part)
 
     if part == 2 and not path.exists():
         copy_part_one_to_two(day=day, force=True)
@@ -174,39 +570,630 @@ def load_solution_module(day: int, part: int):
     if not path.exists():
         raise SystemExit(f"Solution file not found: {path.relative_to(ROOT)}")
 
-    module_name = f"solutions.day{day:02d}.part{part}"
-    spec = importlib.util.spec_from_file_location(module_name, path)
-    if spec is None or spec.loader is None:
-        raise SystemExit(f"Unable to load module from {path}")
+    try:
+        return import_solution(day, part)
+    except ImportError as exc:
+        raise SystemExit(str(exc))
+
+
+@dataclass
+class Solution:
+    module: ModuleType
+    impl: str
+    read_input: Callable[[], Any]
+    solve: Callable[[Any], Any]
+    source: store.InputSource
+
+    @property
+    def solution_hash(self) -> str:
+        return file_hash(Path(self.module.__file__))
 
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
 
+def run_label(day: int, part: int) -> str:
+    return f"day{day:02d}-part{part}"
 
-def run_solution(day: int, part: int, run_tests: bool) -> None:
+
+def input_source(module: ModuleType, input_path: Optional[Path]) -> store.InputSource:
+    if input_path is None:
+        return store.InputSource(module.DATA_DIR)
+    if not input_path.exists():
+        raise SystemExit(f"Input file not found: {input_path}")
+    return store.InputSource(input_path.parent, input_path)
+
+
+def solution_entry_points(
+    day: int,
+    part: int,
+    input_path: Optional[Path] = None,
+    use_parse_cache: bool = True,
+    impl: Optional[str] = None,
+) -> Solution:
+    """
+    Load a day/part and resolve how to read its input and solve it.
+
+    impl names a registered variant (see aoc.registry); "auto" picks the one
+    remembered as fastest for this input's size class, and None means the
+    plain solve(). When input_path is given the input is read from that file
+    so solutions can be run against generated inputs. Solutions that define
+    parse(data) and solve_parsed(parsed) go through the parse cache when the
+    plain solve() is selected: read_input() then returns the cached typed
+    arrays and solve is solve_parsed.
+    """
     module = load_solution_module(day, part)
+    if not callable(getattr(module, "read_input", None)) or not callable(
+        getattr(module, "solve", None)
+    ):
+        raise SystemExit(
+            f"{module.__file__} must define read_input() and solve(lines) to execute."
+        )
+    source = input_source(module, input_path)
+
+    available = registry.variants(module)
+    name = impl or registry.DEFAULT
+    if name == registry.AUTO:
+        name = registry.choose(run_label(day, part), source.size(), available)
+    if name not in available:
+        raise SystemExit(
+            f"No implementation {name!r} for day {day} part {part}. "
+            f"Available: {', '.join(available)}"
+        )
+    chosen = available[name]
+    read_input, solve = chosen.reader(source), chosen.fn
+    if name == registry.DEFAULT and input_path is None:
+        read_input = module.read_input
+
+    parse = getattr(module, "parse", None)
+    solve_parsed = getattr(module, "solve_parsed", None)
+    if (
+        name == registry.DEFAULT
+        and use_parse_cache
+        and callable(parse)
+        and callable(solve_parsed)
+    ):
+
+        def read_input():
+            parsed, _ = parse_cache.load_or_parse(
+                parse, source.read_bytes, source.data_dir, source.digest(), part
+            )
+            return parsed
+
+        solve = solve_parsed
+
+    return Solution(module, name, read_input, solve, source)
+
+
+def selected_runs(days: list[int], parts: Optional[list[int]]) -> list[tuple[int, int]]:
+    """
+    (day, part) pairs to run. An explicit --part is always honoured (part 2 is
+    bootstrapped from part 1 if missing); otherwise only existing files run.
+    """
+    if parts is not None:
+        return [(day, part) for day in days for part in parts]
+    return [
+        (day, part)
+        for day in days
+        for part in (1, 2)
+        if solution_path(day, part).exists()
+    ]
+
+
+def execute_solution(
+    day: int,
+    part: int,
+    profile: Optional[str] = None,
+    profile_top: int = 20,
+    measure_memory: bool = False,
+    input_path: Optional[Path] = None,
+    use_parse_cache: bool = True,
+    impl: Optional[str] = None,
+    resume: bool = False,
+    checkpoint_every: float = 5.0,
+    timeout: Optional[float] = None,
+    show_progress: bool = False,
+    stdout_to_stderr: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run read_input() and solve() once and return the result record.
+
+    Resumable solves (see aoc.checkpoint) are checkpointed as they run, and
+    with resume continue from the last checkpoint. With timeout the run is
+    cancelled once it has taken that many seconds (see aoc.progress); the
+    record then has status "timeout", no answer, and the timings and progress
+    reached so far.
+    """
+    solution = solution_entry_points(day, part, input_path, use_parse_cache, impl)
+    label = run_label(day, part)
+    parse_profiler = Profiler(profile, f"{label}-parse", profile_top)
+    solve_profiler = Profiler(profile, f"{label}-solve", profile_top)
+
+    solve = solution.solve
+    steps = getattr(solve, "steps", None)
+    if steps is not None:
+        digest = solution.source.digest()
+        solve = functools.partial(
+            checkpoint.run,
+            steps,
+            # Always under the solution's own data/YYYY/dayXX, even for --input
+            # files elsewhere; the input digest in the name tells inputs apart.
+            path=checkpoint.checkpoint_path(
+                solution.module.DATA_DIR, part, solution.impl, digest
+            ),
+            input_digest=digest,
+            solution_hash=solution.solution_hash,
+            resume=resume,
+            interval=checkpoint_every,
+        )
+    elif resume:
+        print(
+            f"{label} ({solution.impl}) does not checkpoint; running from scratch",
+            file=sys.stderr,
+        )
+
+    record: Dict[str, Any] = {"day": day, "part": part, "impl": solution.impl}
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    tracker = progress.Tracker(label, deadline, render=show_progress)
+    parse: Optional[Phase] = None
+    started = time.perf_counter_ns()
+    try:
+        with progress.tracking(tracker):
+            parse = run_phase(
+                solution.read_input,
+                profiler=parse_profiler,
+                measure_memory=measure_memory,
+                stdout_to_stderr=stdout_to_stderr,
+            )
+            started = time.perf_counter_ns()
+            solve_phase = run_phase(
+                solve,
+                parse.value,
+                profiler=solve_profiler,
+                measure_memory=measure_memory,
+                stdout_to_stderr=stdout_to_stderr,
+            )
+    except progress.Cancelled:
+        elapsed = time.perf_counter_ns() - started
+        record.update(
+            status="timeout",
+            answer=None,
+            parse_ns=parse.elapsed_ns if parse else elapsed,
+            solve_ns=elapsed if parse else None,
+            progress={
+                "done": tracker.done,
+                "total": tracker.total,
+                "items_per_s": tracker.rate,
+                "summary": tracker.describe(),
+            },
+        )
+    else:
+        parse_profiler.report()
+        solve_profiler.report()
+        record.update(
+            status="ok",
+            answer=solve_phase.value,
+            parse_ns=parse.elapsed_ns,
+            solve_ns=solve_phase.elapsed_ns,
+            parse_memory=parse.memory and parse.memory.to_dict(),
+            solve_memory=solve_phase.memory and solve_phase.memory.to_dict(),
+        )
+    record.update(
+        peak_rss=peak_rss(),
+        input_hash=solution.source.digest(),
+        solution_hash=solution.solution_hash,
+    )
+    return record
+
+
+def describe_timeout(record: Dict[str, Any], timeout: Optional[float]) -> str:
+    """Partial-timing report for a run that was cancelled at its deadline."""
+    label = run_label(record["day"], record["part"])
+    if record["solve_ns"] is None:
+        elapsed = format_duration(record["parse_ns"] / 1e9)
+        phases = f"cancelled while reading input after {elapsed}"
+    else:
+        phases = (
+            f"parse {format_duration(record['parse_ns'] / 1e9)}, "
+            f"solve cancelled after {format_duration(record['solve_ns'] / 1e9)}"
+        )
+    report = f"{label} ({record['impl']}): TIMEOUT after {timeout}s; {phases}"
+    if record["progress"]["done"]:
+        report += f"; reached {record['progress']['summary']}"
+    return report
+
+
+def run_solutions(
+    days: list[int],
+    parts: Optional[list[int]],
+    run_tests: bool,
+    output_format: str = "text",
+    measure_memory: bool = False,
+    **options: Any,
+) -> None:
+    runs = selected_runs(days, parts)
+    if not runs:
+        raise SystemExit("No solution files found for the selected days.")
 
     if run_tests:
-        run_tests_fn = getattr(module, "run_tests", None)
-        if not callable(run_tests_fn):
-            raise SystemExit(
-                f"{module.__file__} missing run_tests(). Add run_tests() to the solution file."
+        for day, part in runs:
+            module = load_solution_module(day, part)
+            run_tests_fn = getattr(module, "run_tests", None)
+            if not callable(run_tests_fn):
+                raise SystemExit(
+                    f"{module.__file__} missing run_tests(). Add run_tests() to the solution file."
+                )
+            run_tests_fn()
+        return
+
+    timed_out = False
+    if output_format != "text":
+        with RecordWriter(output_format) as writer:
+            for day, part in runs:
+                record = execute_solution(
+                    day,
+                    part,
+                    measure_memory=measure_memory,
+                    stdout_to_stderr=True,
+                    **options,
+                )
+                timed_out |= record["status"] == "timeout"
+                writer.write(record)
+        if timed_out:
+            raise SystemExit(1)
+        return
+
+    for day, part in runs:
+        record = execute_solution(day, part, measure_memory=measure_memory, **options)
+        if record["status"] == "timeout":
+            timed_out = True
+            print(describe_timeout(record, options.get("timeout")), file=sys.stderr)
+            continue
+        if len(runs) == 1:
+            print(record["answer"])
+        else:
+            print(f"day{day:02d} part{part}: {record['answer']}")
+        if measure_memory:
+            for name in ("parse", "solve"):
+                stats = record[f"{name}_memory"]
+                print(
+                    f"  {name}  {format_duration(record[f'{name}_ns'] / 1e9):>10}  "
+                    f"{describe_memory(MemoryStats(**stats))}",
+                    file=sys.stderr,
+                )
+    if timed_out:
+        raise SystemExit(1)
+
+
+def bench_solution(
+    day: int,
+    part: int,
+    repeat: int,
+    profile: Optional[str] = None,
+    profile_top: int = 20,
+    measure_memory: bool = False,
+    input_path: Optional[Path] = None,
+    use_parse_cache: bool = True,
+    impl: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Time read_input() and solve() over several runs; solution output is discarded."""
+    solution = solution_entry_points(day, part, input_path, use_parse_cache, impl)
+    label = run_label(day, part)
+    parse_profiler = Profiler(profile, f"{label}-parse", profile_top)
+    solve_profiler = Profiler(profile, f"{label}-solve", profile_top)
+
+    parse_runs: list[Phase] = []
+    solve_runs: list[Phase] = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse = run_phase(
+                solution.read_input, profiler=parse_profiler, measure_memory=measure_memory
+            )
+            solve_runs.append(
+                run_phase(
+                    solution.solve,
+                    parse.value,
+                    profiler=solve_profiler,
+                    measure_memory=measure_memory,
+                )
             )
-        run_tests_fn()
+        parse_runs.append(parse)
+    parse_profiler.report()
+    solve_profiler.report()
+
+    return {
+        "day": day,
+        "part": part,
+        "impl": solution.impl,
+        "answer": solve_runs[-1].value,
+        "runs": repeat,
+        "parse_ns": timing_summary(parse_runs),
+        "solve_ns": timing_summary(solve_runs),
+        "peak_rss": peak_rss(),
+        "parse_memory": peak_memory(parse_runs),
+        "solve_memory": peak_memory(solve_runs),
+        "input_hash": solution.source.digest(),
+        "solution_hash": solution.solution_hash,
+    }
+
+
+def run_benchmarks(
+    days: list[int],
+    parts: Optional[list[int]],
+    output_format: str = "text",
+    **options: Any,
+) -> None:
+    runs = selected_runs(days, parts)
+    if not runs:
+        raise SystemExit("No solution files found for the selected days.")
+
+    if output_format != "text":
+        with RecordWriter(output_format) as writer:
+            for day, part in runs:
+                writer.write(bench_solution(day, part, **options))
         return
 
-    read_input = getattr(module, "read_input", None)
-    solve = getattr(module, "solve", None)
-    if not callable(read_input) or not callable(solve):
+    for day, part in runs:
+        record = bench_solution(day, part, **options)
+        print(f"day{day:02d}-part{part}: {record['answer']!r} ({record['runs']} runs)")
+        for name in ("parse", "solve"):
+            summary = record[f"{name}_ns"]
+            line = (
+                f"  {name}  min {format_duration(summary['min'] / 1e9):>10}  "
+                f"mean {format_duration(summary['mean'] / 1e9):>10}  "
+                f"max {format_duration(summary['max'] / 1e9):>10}"
+            )
+            if record[f"{name}_memory"] is not None:
+                line += f"  {describe_memory(MemoryStats(**record[f'{name}_memory']))}"
+            print(line)
+
+
+def bench_variants(
+    day: int,
+    part: int,
+    repeat: int,
+    input_path: Optional[Path] = None,
+    remember: bool = False,
+) -> Dict[str, Any]:
+    """
+    Time every registered implementation of a day/part on the same input,
+    ranked by mean read+solve time, and check that they all agree. With
+    remember, the fastest is recorded for `--impl auto` if they do.
+    """
+    module = load_solution_module(day, part)
+    source = input_source(module, input_path)
+    label = run_label(day, part)
+
+    impls: list[Dict[str, Any]] = []
+    for name, variant in registry.variants(module).items():
+        read_input = variant.reader(source)
+        parse_runs: list[Phase] = []
+        solve_runs: list[Phase] = []
+        for _ in range(repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                parse = run_phase(read_input)
+                solve_runs.append(run_phase(variant.fn, parse.value))
+            parse_runs.append(parse)
+        impls.append(
+            {
+                "impl": name,
+                "kind": variant.kind,
+                "answer": solve_runs[-1].value,
+                "parse_ns": timing_summary(parse_runs),
+                "solve_ns": timing_summary(solve_runs),
+                "total_ns": statistics.fmean(
+                    parsed.elapsed_ns + solved.elapsed_ns
+                    for parsed, solved in zip(parse_runs, solve_runs)
+                ),
+            }
+        )
+    impls.sort(key=lambda entry: entry["total_ns"])
+
+    agree = len({repr(entry["answer"]) for entry in impls}) == 1
+    size = source.size()
+    if remember and agree:
+        registry.remember_choice(label, size, impls[0]["impl"])
+    return {
+        "day": day,
+        "part": part,
+        "runs": repeat,
+        "size": size,
+        "size_class": registry.size_class(size),
+        "agree": agree,
+        "fastest": impls[0]["impl"],
+        "impls": impls,
+        "input_hash": source.digest(),
+    }
+
+
+def run_variant_benchmarks(
+    days: list[int],
+    parts: Optional[list[int]],
+    output_format: str = "text",
+    **options: Any,
+) -> None:
+    runs = selected_runs(days, parts)
+    if not runs:
+        raise SystemExit("No solution files found for the selected days.")
+
+    records: list[Dict[str, Any]] = []
+    if output_format != "text":
+        with RecordWriter(output_format) as writer:
+            for day, part in runs:
+                records.append(bench_variants(day, part, **options))
+                writer.write(records[-1])
+    else:
+        for day, part in runs:
+            record = bench_variants(day, part, **options)
+            records.append(record)
+            print(
+                f"{run_label(day, part)}: {len(record['impls'])} implementation(s), "
+                f"input {record['size']} B ({record['runs']} runs)"
+            )
+            fastest = record["impls"][0]["total_ns"]
+            for rank, entry in enumerate(record["impls"], start=1):
+                print(
+                    f"  {rank}. {entry['impl']:<16} {entry['kind']:<6} "
+                    f"{format_duration(entry['total_ns'] / 1e9):>10}  "
+                    f"x{entry['total_ns'] / fastest:.2f}  answer {entry['answer']!r}"
+                )
+            if not record["agree"]:
+                print("  MISMATCH: implementations disagree")
+
+    if not all(record["agree"] for record in records):
+        raise SystemExit(1)
+
+
+def timing_summary(runs: list[Phase]) -> Dict[str, float]:
+    times = [run.elapsed_ns for run in runs]
+    return {"min": min(times), "mean": statistics.fmean(times), "max": max(times)}
+
+
+def max_memory(runs: list[Phase]) -> Optional[MemoryStats]:
+    """The run with the highest traced peak, or None if memory was not measured."""
+    measured = [run.memory for run in runs if run.memory is not None]
+    return max(measured, key=lambda stats: stats.traced_peak, default=None)
+
+
+def peak_memory(runs: list[Phase]) -> Optional[Dict[str, Optional[int]]]:
+    stats = max_memory(runs)
+    return stats.to_dict() if stats else None
+
+
+def generate_input(day: int, scale: int, seed: int, output: Optional[str]) -> None:
+    if day not in generators.GENERATORS:
         raise SystemExit(
-            f"{module.__file__} must define read_input() and solve(lines) to execute."
+            f"No input generator for day {day}. "
+            f"Available: {', '.join(map(str, sorted(generators.GENERATORS)))}"
         )
+    if output == "-":
+        generators.generate(day, scale, seed, sys.stdout)
+        return
 
-    lines = read_input()
-    result = solve(lines)
-    print(result)
+    if output is None:
+        target = GENERATED_DIR / f"day{day:02d}" / f"scale{scale}-seed{seed}.txt"
+    else:
+        target = Path(output)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("w", buffering=1 << 20) as out:
+        generators.generate(day, scale, seed, out)
+    print(f"Wrote generated input to {target}", file=sys.stderr)
+
+
+def run_scaling_suite(
+    day: Optional[int],
+    part: Optional[int],
+    steps: int,
+    factor: float,
+    repeat: int,
+    max_seconds: float,
+    tolerance: float,
+    baseline_path: Path,
+    save_baseline: bool,
+) -> None:
+    days = [day] if day is not None else sorted(scaling.BASE_SCALES)
+    parts = [part] if part is not None else [1, 2]
+    baseline = scaling.load_baseline(baseline_path)
+
+    results: list[scaling.ScalingResult] = []
+    for current_day in days:
+        if current_day not in scaling.BASE_SCALES:
+            raise SystemExit(f"No scaling preset for day {current_day}.")
+        for current_part in parts:
+            if not solution_path(current_day, current_part).exists():
+                continue
+            solve = solution_entry_points(
+                current_day, current_part, use_parse_cache=False
+            ).solve
+            label = run_label(current_day, current_part)
+            result = scaling.measure(
+                label,
+                current_day,
+                solve,
+                steps=steps,
+                factor=factor,
+                repeat=repeat,
+                max_seconds=max_seconds,
+            )
+            results.append(result)
+
+            previous = baseline.get(label)
+            against = f"  (baseline {previous['exponent']:.2f})" if previous else ""
+            print(
+                f"{label}: exponent {result.exponent:.2f}{against}  "
+                f"{format_duration(result.seconds[0])} @ {result.sizes[0]} B -> "
+                f"{format_duration(result.seconds[-1])} @ {result.sizes[-1]} B"
+            )
+
+    if save_baseline:
+        scaling.save_baseline(results, baseline_path)
+        print(f"Saved baseline to {baseline_path}")
+        return
+
+    worse = scaling.regressions(results, baseline, tolerance)
+    for result, previous in worse:
+        print(
+            f"REGRESSION {result.label}: exponent {result.exponent:.2f} "
+            f"vs baseline {previous:.2f} (tolerance {tolerance})"
+        )
+    if worse:
+        raise SystemExit(1)
+
+
+def run_fuzzer(
+    days: list[int], part: Optional[int], budget: float, seed: int, save: bool
+) -> None:
+    report = fuzz.fuzz(days, [part] if part else None, budget=budget, seed=seed, save=save)
+    if report.skipped:
+        print(f"Skipped: {', '.join(report.skipped)}")
+    if not report.targets:
+        raise SystemExit("Nothing to fuzz: no selected solution has two implementations.")
+
+    for target in report.targets:
+        status = "MISMATCH" if target.mismatch else "ok"
+        print(
+            f"{target.label}: {status} after {target.cases} input(s) "
+            f"({', '.join(target.variants)})"
+        )
+        mismatch = target.mismatch
+        if mismatch is None:
+            continue
+        print(
+            f"  shrunk {mismatch.original_lines} line(s) to "
+            f"{len(mismatch.raw.splitlines())}:"
+        )
+        for line in mismatch.raw.splitlines():
+            print(f"    {line}")
+        for name, (kind, value) in mismatch.outcomes.items():
+            print(f"  {name:<16} {value!r}" if kind == "ok" else f"  {name:<16} {value}")
+        if mismatch.saved:
+            path = solution_path(target.day, target.part).relative_to(ROOT)
+            print(f"  added reproducer to TESTS in {path}")
+    print(f"Fuzzed for {format_duration(report.elapsed)}")
+    if report.mismatches:
+        raise SystemExit(1)
+
+
+def run_test_suite(
+    days: Optional[list[int]], jobs: int, timeout: float, output_format: str = "text"
+) -> None:
+    if days is not None and any(day < 1 or day > 25 for day in days):
+        raise SystemExit("Day must be between 1 and 25.")
+    cases = harness.collect_cases(days)
+    if not cases:
+        raise SystemExit("No inline TESTS found.")
+
+    if output_format == "text":
+        results = harness.run_cases(cases, jobs=jobs, timeout=timeout)
+        passed = harness.report(results)
+    else:
+        with RecordWriter(output_format) as writer:
+            results = harness.run_cases(
+                cases,
+                jobs=jobs,
+                timeout=timeout,
+                on_result=lambda result: writer.write(result.to_record()),
+            )
+        passed = all(result.status == "pass" for result in results)
+    if not passed:
+        raise SystemExit(1)
 
 
 def copy_part_one_to_two(day: int, force: bool) -> None:
@@ -269,10 +1256,102 @@ def main() -> None:
 
     if args.command == "fetch":
         cookie = get_cookie(args.cookie)
-        fetch_input(day=args.day, year=args.year, cookie=cookie)
-        bootstrap_solution_file(day=args.day, year=args.year)
+        days = args.days or [args.day]
+        years = args.years or [args.year]
+        results = fetch_inputs(
+            days=days,
+            years=years,
+            cookie=cookie,
+            base_url=args.base_url,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            retries=args.retries,
+            compression=args.compress,
+        )
+        # Solutions are not split by year, so only bootstrap for a single event.
+        if len(years) == 1:
+            for result in sorted(results, key=lambda r: r.day):
+                if result.status != "failed":
+                    bootstrap_solution_file(day=result.day, year=result.year)
+        if any(result.status == "failed" for result in results):
+            raise SystemExit(1)
+    elif args.command == "store-import":
+        import_inputs(
+            years=args.years, days=args.days, compression=args.compress, prune=args.prune
+        )
+    elif args.command == "store-verify":
+        verify_store()
     elif args.command == "execute":
-        run_solution(day=args.day, part=args.part, run_tests=args.test)
+        try:
+            run_solutions(
+                days=args.day,
+                parts=[args.part] if args.part else None,
+                run_tests=args.test,
+                profile=args.profile,
+                profile_top=args.profile_top,
+                measure_memory=args.memory,
+                output_format=args.format,
+                input_path=args.input,
+                use_parse_cache=args.parse_cache,
+                impl=args.impl,
+                resume=args.resume,
+                checkpoint_every=args.checkpoint_every,
+                timeout=args.timeout,
+                show_progress=args.progress,
+            )
+        except KeyboardInterrupt:
+            raise SystemExit(130)
+    elif args.command == "bench" and args.all_impls:
+        run_variant_benchmarks(
+            days=args.day,
+            parts=[args.part] if args.part else None,
+            output_format=args.format,
+            repeat=max(1, args.repeat),
+            input_path=args.input,
+            remember=args.remember,
+        )
+    elif args.command == "bench":
+        run_benchmarks(
+            days=args.day,
+            parts=[args.part] if args.part else None,
+            output_format=args.format,
+            repeat=max(1, args.repeat),
+            profile=args.profile,
+            profile_top=args.profile_top,
+            measure_memory=args.memory,
+            input_path=args.input,
+            use_parse_cache=args.parse_cache,
+            impl=args.impl,
+        )
+    elif args.command == "gen":
+        generate_input(day=args.day, scale=args.scale, seed=args.seed, output=args.output)
+    elif args.command == "scaling":
+        run_scaling_suite(
+            day=args.day,
+            part=args.part,
+            steps=max(2, args.steps),
+            factor=args.factor,
+            repeat=max(1, args.repeat),
+            max_seconds=args.max_seconds,
+            tolerance=args.tolerance,
+            baseline_path=args.baseline,
+            save_baseline=args.save_baseline,
+        )
+    elif args.command == "fuzz":
+        run_fuzzer(
+            days=args.day,
+            part=args.part,
+            budget=args.budget,
+            seed=args.seed,
+            save=args.save,
+        )
+    elif args.command == "test":
+        run_test_suite(
+            days=args.day,
+            jobs=max(1, args.jobs),
+            timeout=args.timeout,
+            output_format=args.format,
+        )
     elif args.command == "copy-part":
         copy_part_one_to_two(day=args.day, force=args.force)
     elif args.command == "sync-part2":
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import itertools
+import operator
 import sys
 
+from array import array
 from pathlib import Path
+from typing import Mapping, Sequence
 
 
 # Resolve project root from this file's location.
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc.registry import variant  # noqa: E402
+from aoc.store import read_input_text  # noqa: E402
+from solutions import lib  # noqa: E402
+
 DATA_DIR = ROOT / "data" / "2025" / "day01"
 TESTS: list[tuple[str, int | str]] = [(
 """L68
@@ -28,12 +39,12 @@ L82
 
 def read_input() -> list[str]:
     """
-    Load the puzzle input for part 1.
+    Load the puzzle input for this part.
 
-    This defaults to part1.txt (as downloaded by main.py fetch).
+    Only one input is stored per day; it is resolved through the input store
+    (data/store) and falls back to part1.txt.
     """
-    path = DATA_DIR / "part1.txt"
-    return path.read_text().splitlines()
+    return read_input_text(DATA_DIR).splitlines()
 
 
 def solve(lines: list[str]) -> str | int:
@@ -60,6 +71,31 @@ def solve(lines: list[str]) -> str | int:
     return count
 
 
+def parse(data: bytes) -> dict[str, array]:
+    """
+    Typed arrays for the parse cache: a +1/-1 sign (L/R) and a distance per
+    rotation, via lib.signed_tags' whole-buffer passes.
+    """
+    signs, distances = lib.signed_tags(data, b"L", b"R")
+    return {"signs": signs, "distances": distances}
+
+
+def solve_parsed(parsed: Mapping[str, Sequence[int]]) -> int:
+    """
+    solve() over the cached sign/distance arrays. The dial is at 0 whenever the
+    running sum of signed distances is a multiple of 100, so one C-level
+    accumulate replaces the per-step modulo bookkeeping.
+    """
+    steps = map(operator.mul, parsed["signs"], parsed["distances"])
+    return sum(1 for pos in itertools.accumulate(steps, initial=50) if pos % 100 == 0)
+
+
+@variant("bytes", kind="bytes")
+def solve_bytes(data: bytes) -> int:
+    """solve() straight from the raw input through the byte-level parser."""
+    return solve_parsed(parse(data))
+
+
 def run_tests() -> None:
     if not TESTS:
         raise SystemExit("Add test cases to TESTS to run tests.")
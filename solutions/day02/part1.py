@@ -10,11 +10,19 @@ Update YEAR if you are working on a different event.
 
 import argparse
 import sys
+from array import array
 from pathlib import Path
+from typing import Mapping, Sequence
 
 
 YEAR = 2025
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc.store import read_input_text  # noqa: E402
+from solutions import lib  # noqa: E402
+
 DAY_DIR = Path(__file__).resolve().parent
 DAY = DAY_DIR.name if DAY_DIR.name.startswith("day") else "dayXX"
 DATA_DIR = ROOT / "data" / str(YEAR) / DAY
@@ -34,14 +42,10 @@ def read_input() -> list[str]:
     """
     Load the puzzle input for this part.
 
-    Only one input file is stored (part1.txt).
+    Only one input is stored per day; it is resolved through the input store
+    (data/store) and falls back to part1.txt.
     """
-    part1 = DATA_DIR / "part1.txt"
-
-    if not part1.exists():
-        raise FileNotFoundError(f"No input file found in {DATA_DIR}. Add part1.txt.")
-
-    return part1.read_text().splitlines()
+    return read_input_text(DATA_DIR).splitlines()
 
 def get_invalid_ids(start: str, end: str) -> set[str]:
     invalid_keys = set()
@@ -93,6 +97,19 @@ def solve(lines: list[str]) -> int | str:
 
     return sum(map(int, invalid_ids))
 
+def parse(data: bytes) -> dict[str, array]:
+    """Typed arrays for the parse cache: the bounds of every ID range."""
+    starts, ends = lib.ranges(data)
+    return {"starts": starts, "ends": ends}
+
+
+def solve_parsed(parsed: Mapping[str, Sequence[int]]) -> int:
+    """solve() over the cached range bounds."""
+    invalid_ids: set[int] = set()
+    for start, end in zip(parsed["starts"], parsed["ends"]):
+        invalid_ids.update(map(int, get_invalid_ids(str(start), str(end))))
+    return sum(invalid_ids)
+
 
 def run_tests() -> None:
     if not TESTS:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 import json
-from typing import Any
+from typing import Any, Generator
 from cgi import test
 import math
 import pydantic
@@ -15,11 +15,22 @@ Update YEAR if you are working on a different event.
 
 import argparse
 import sys
+from array import array
 from pathlib import Path
+from typing import Mapping, Sequence
 
 
 YEAR = 2025
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc import progress  # noqa: E402
+from aoc.checkpoint import resumable  # noqa: E402
+from aoc.registry import variant  # noqa: E402
+from aoc.store import read_input_text, write_atomic  # noqa: E402
+from solutions import lib  # noqa: E402
+
 DAY_DIR = Path(__file__).resolve().parent
 DAY = DAY_DIR.name if DAY_DIR.name.startswith("day") else "dayXX"
 DATA_DIR = ROOT / "data" / str(YEAR) / DAY
@@ -39,14 +50,10 @@ def read_input() -> list[str]:
     """
     Load the puzzle input for this part.
 
-    Only one input file is stored (part1.txt).
+    Only one input is stored per day; it is resolved through the input store
+    (data/store) and falls back to part1.txt.
     """
-    part1 = DATA_DIR / "part1.txt"
-
-    if not part1.exists():
-        raise FileNotFoundError(f"No input file found in {DATA_DIR}. Add part1.txt.")
-
-    return part1.read_text().splitlines()
+    return read_input_text(DATA_DIR).splitlines()
 
 def get_invalid_ids(start: str, end: str) -> set[str]:
     invalid_keys = set()
@@ -108,59 +115,102 @@ class PrecomputedValues(pydantic.BaseModel):
     computed_n: int = 1
     computed_keys: list[int] = []
 
-def precompute_values(max_digit_length: int, data: str | None) -> PrecomputedValues:
-    if data:
-        values = PrecomputedValues.model_validate_json(data or '')
-    else:
-        values = PrecomputedValues()
-
-    computed_n: int = values.computed_n
-
-
-    start = str(max(1, computed_n))
-    end = str(int("9"*max_digit_length))
+def precompute_steps(
+    max_digit_length: int, values: PrecomputedValues
+) -> Generator[PrecomputedValues, None, PrecomputedValues]:
+    """
+    Extend values.computed_keys up to the largest max_digit_length-digit number,
+    one digit length at a time, yielding a fresh PrecomputedValues after each.
+    """
+    computed_n = max(1, values.computed_n)
+    end = int("9" * max_digit_length)
+    for length in range(len(str(computed_n)), max_digit_length + 1):
+        chunk_end = min(end, int("9" * length))
+        if chunk_end <= values.computed_n:
+            continue
+        start = str(max(computed_n, 10 ** (length - 1)))
+        new_keys = set(map(int, get_invalid_ids(start, str(chunk_end))))
+        values = PrecomputedValues(
+            computed_n=chunk_end,
+            computed_keys=sorted(set(values.computed_keys).union(new_keys)),
+        )
+        yield values
+    return values
 
-    if end <= start:
-        return values
 
-    new_keys: set[int] = set(map(int, get_invalid_ids(start, end)))
-    values.computed_keys = sorted(set(values.computed_keys).union(new_keys))
-    values.computed_n = int(end)
+@dataclass(frozen=True)
+class ScanState:
+    """Progress of solve2: the key table, then how far the range scan got."""
 
-    with open(DATA_DIR / 'invalid_keys.json', 'w') as f:
-        f.write(values.model_dump_json())
+    values: PrecomputedValues
+    range_index: int = 0
+    next_id: int | None = None
+    partial_sum: int = 0
 
-    return values
 
+# IDs checked between checkpoints in solve2's scan.
+SCAN_CHUNK = 1 << 20
 
-def fetch_precomputed_values(n: int) -> list[int]:
-    with open(DATA_DIR / 'invalid_keys.json') as f:
-        data = f.read()
-    
-    return precompute_values(n, data).computed_keys
 
-def solve2(lines: list[str]) -> int | str:
+@variant("precomputed")
+@resumable
+def solve2(
+    lines: list[str], state: ScanState | None = None
+) -> Generator[ScanState, None, int]:
     all_ranges: list[tuple[str, str]] = []
-    invalid_ids = set[int]()
     for line in lines:
         ranges = line.split(",")
         for curr_range in ranges:
             start, end = curr_range.split('-')
             all_ranges.append((start, end))
-        
+
     max_length = 0
     for r in all_ranges:
         max_length = max(max_length, len(r[0]), len(r[1]))
 
-    precomputed_values = set(fetch_precomputed_values(max_length))
-
-    for r in all_ranges:
-        start, end = r
-        for i in range(int(start), int(end) + 1):
-            if i in precomputed_values:
-                invalid_ids.add(i)
-
-    return sum(invalid_ids)
+    # Overlapping ranges merged, so every ID is scanned (and summed) once and a
+    # running sum can stand in for the set of invalid IDs.
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted((int(start), int(end)) for start, end in all_ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    keys_path = DATA_DIR / 'invalid_keys.json'
+    if state is None:
+        data = keys_path.read_text() if keys_path.exists() else None
+        try:
+            values = PrecomputedValues.model_validate_json(data) if data else PrecomputedValues()
+        except pydantic.ValidationError:
+            values = PrecomputedValues()  # unreadable cache: recompute it
+        state = ScanState(values)
+    if state.values.computed_n < int("9" * max_length):
+        for values in precompute_steps(max_length, state.values):
+            state = ScanState(values)
+            yield state
+        write_atomic(keys_path, state.values.model_dump_json().encode())
+
+    precomputed_values = set(state.values.computed_keys)
+    partial_sum = state.partial_sum
+    total = sum(end - start + 1 for start, end in merged)
+    scanned = sum(end - start + 1 for start, end in merged[: state.range_index])
+    for range_index in range(state.range_index, len(merged)):
+        start, end = merged[range_index]
+        first = start
+        if range_index == state.range_index and state.next_id is not None:
+            first = state.next_id
+            scanned += first - start
+        for chunk_start in range(first, end + 1, SCAN_CHUNK):
+            chunk_end = min(chunk_start + SCAN_CHUNK, end + 1)
+            for i in range(chunk_start, chunk_end):
+                if i in precomputed_values:
+                    partial_sum += i
+            scanned += chunk_end - chunk_start
+            progress.update(scanned, total)
+            yield ScanState(state.values, range_index, chunk_end, partial_sum)
+
+    return partial_sum
 
 
 def solve(lines: list[str]) -> int | str:
@@ -180,6 +230,19 @@ def solve(lines: list[str]) -> int | str:
 
     return sum(map(int, invalid_ids))
 
+def parse(data: bytes) -> dict[str, array]:
+    """Typed arrays for the parse cache: the bounds of every ID range."""
+    starts, ends = lib.ranges(data)
+    return {"starts": starts, "ends": ends}
+
+
+def solve_parsed(parsed: Mapping[str, Sequence[int]]) -> int:
+    """solve() over the cached range bounds."""
+    invalid_ids: set[int] = set()
+    for start, end in zip(parsed["starts"], parsed["ends"]):
+        invalid_ids.update(map(int, get_invalid_ids(str(start), str(end))))
+    return sum(invalid_ids)
+
 
 def run_tests() -> None:
     if not TESTS:
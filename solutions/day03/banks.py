@@ -0,0 +1,142 @@
+"""
+Parallel day03: the k-digit selection over byte-range chunks of the input.
+
+Every line is an independent bank, so the memory-mapped file is cut into
+byte ranges of roughly equal size, each moved forward to just past a
+newline. A worker maps the file itself, splits its range into banks and
+returns the sum of their largest k-digit numbers. Only (path, start, end, k)
+goes to a worker and one int comes back.
+
+largest() picks the digits greedily: the i-th digit is the highest one that
+still leaves enough digits after it, found with at most ten bytes.find
+calls over the allowed window, so the per-character work stays in C.
+
+    uv run solutions/day03/banks.py [--input <path>] [--part 1|2] [--workers <n>]
+
+times the pool at 1, 2, 4, ... workers against the serial scan.
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc.store import InputSource  # noqa: E402
+from aoc.units import format_count, format_duration  # noqa: E402
+from solutions import lib  # noqa: E402
+from solutions.lib import columns  # noqa: E402
+
+DATA_DIR = ROOT / "data" / "2025" / "day03"
+DIGITS = b"9876543210"
+# Chunks per worker, so one slow chunk does not leave the other workers idle.
+CHUNKS_PER_WORKER = 4
+# Chunks smaller than this are not worth a task of their own.
+MIN_CHUNK = 1 << 16
+
+
+def largest(bank: bytes, k: int) -> int:
+    """The largest number formed by k of bank's digits, kept in order."""
+    if len(bank) < k:
+        raise ValueError(f"Bank {bank[:20]!r} has fewer than {k} digits")
+    value = 0
+    start = 0
+    for remaining in range(k, 0, -1):
+        stop = len(bank) - remaining + 1
+        for digit in DIGITS:
+            position = bank.find(digit, start, stop)
+            if position != -1:
+                break
+        value = value * 10 + digit - 0x30
+        start = position + 1
+    return value
+
+
+def line_chunks(mm: mmap.mmap, parts: int) -> list[tuple[int, int]]:
+    """About `parts` byte ranges of similar size covering mm, cut after newlines."""
+    size = len(mm)
+    parts = max(1, min(parts, size // MIN_CHUNK))
+    cuts = [0]
+    for part in range(1, parts):
+        newline = mm.find(b"\n", max(size * part // parts, cuts[-1]))
+        if newline == -1:
+            break
+        if newline + 1 > cuts[-1]:
+            cuts.append(newline + 1)
+    cuts.append(size)
+    return [(start, end) for start, end in zip(cuts, cuts[1:]) if end > start]
+
+
+def chunk_total(path: str, start: int, end: int, k: int) -> int:
+    """Worker: the sum over the banks in bytes [start, end) of the file."""
+    with columns.mapped(Path(path)) as mm:
+        return sum(largest(bank, k) for bank in mm[start:end].split())
+
+
+def total(path: Path, k: int, workers: int | None = None) -> int:
+    """Sum of every bank's largest k-digit number, on a pool of `workers` processes."""
+    workers = workers or os.cpu_count() or 1
+    with columns.mapped(path) as mm:
+        chunks = line_chunks(mm, workers * CHUNKS_PER_WORKER)
+    if workers == 1 or len(chunks) <= 1:
+        return sum(chunk_total(str(path), start, end, k) for start, end in chunks)
+    with lib.worker_pool(workers) as pool:
+        futures = [pool.submit(chunk_total, str(path), start, end, k) for start, end in chunks]
+        return sum(future.result() for future in futures)
+
+
+def scaling_report(path: Path, k: int, max_workers: int, repeat: int = 3) -> None:
+    """Best-of-`repeat` times of the serial scan against the pool."""
+
+    def best(workers: int) -> tuple[float, int]:
+        times, answer = [], 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            answer = total(path, k, workers)
+            times.append(time.perf_counter() - started)
+        return min(times), answer
+
+    size = path.stat().st_size
+    serial, expected = best(1)
+    print(f"{path} ({size:,} bytes), k={k}, {os.cpu_count()} CPU(s)")
+    print(f"{'workers':<8}{'time':>12}{'bytes/s':>10}{'speedup':>10}{'efficiency':>12}")
+    print(
+        f"{'serial':<8}{format_duration(serial):>12}"
+        f"{format_count(size / serial):>10}{1.0:>9.2f}x"
+    )
+    workers = 2
+    while workers <= max_workers:
+        elapsed, answer = best(workers)
+        if answer != expected:
+            raise SystemExit(f"{workers} workers answered {answer}, serial {expected}")
+        speedup = serial / elapsed
+        print(
+            f"{workers:<8}{format_duration(elapsed):>12}{format_count(size / elapsed):>10}"
+            f"{speedup:>9.2f}x{speedup / workers:>11.0%}"
+        )
+        if workers == max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the parallel day03 scan against the serial one."
+    )
+    parser.add_argument("--input", type=Path, help="Input file (default: the stored input)")
+    parser.add_argument("--part", type=int, choices=(1, 2), default=2)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+    k = 2 if args.part == 1 else 12
+    scaling_report(InputSource(DATA_DIR, args.input).file(), k, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,13 @@ from pathlib import Path
 
 YEAR = 2025
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc.registry import variant  # noqa: E402
+from aoc.store import read_input_text  # noqa: E402
+from solutions.day03 import banks  # noqa: E402
+
 DAY_DIR = Path(__file__).resolve().parent
 DAY = DAY_DIR.name if DAY_DIR.name.startswith("day") else "dayXX"
 DATA_DIR = ROOT / "data" / str(YEAR) / DAY
@@ -24,14 +31,10 @@ def read_input() -> list[str]:
     """
     Load the puzzle input for this part.
 
-    Only one input file is stored (part1.txt).
+    Only one input is stored per day; it is resolved through the input store
+    (data/store) and falls back to part1.txt.
     """
-    part1 = DATA_DIR / "part1.txt"
-
-    if not part1.exists():
-        raise FileNotFoundError(f"No input file found in {DATA_DIR}. Add part1.txt.")
-
-    return part1.read_text().splitlines()
+    return read_input_text(DATA_DIR).splitlines()
 
 
 def solve(lines: list[str]) -> int | str:
@@ -61,6 +64,12 @@ def solve(lines: list[str]) -> int | str:
     return total
 
 
+@variant("parallel", kind="path")
+def solve_parallel(path: Path) -> int:
+    """solve() over newline-aligned byte chunks of the input on a process pool."""
+    return banks.total(path, k=2)
+
+
 
 def run_tests() -> None:
     if not TESTS:
@@ -0,0 +1,106 @@
+"""
+Bitboard neighbour counting for day04, in pure Python ints.
+
+The whole grid is one int with bit r * stride + c set for a roll at (r, c).
+Rows are `width + 1` bits apart, so every row ends in an always-empty
+padding column and a horizontal shift never carries a roll into the next
+row. Shifting the board by each of the 8 neighbour offsets lines every
+cell up with one of its neighbours, and a carry-save adder tree sums the 8
+shifted boards bit-parallel: every cell's count is held as binary digits
+spread across a few ints, and "fewer than 4 neighbours" is just "neither the
+4s nor the 8s digit is set". That is a couple of dozen big-int operations
+per board whatever its size, instead of eight lookups per cell.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+# '@' -> '1', everything else -> '0'; and back, with '.' for empty cells.
+_BITS = bytes(0x31 if c == 0x40 else 0x30 for c in range(256))
+_CELLS = bytes.maketrans(b"01", b".@")
+
+
+def _full_add(a: int, b: int, c: int) -> tuple[int, int]:
+    """Per-bit sum and carry of three boards."""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (c & partial)
+
+
+def at_least_four(
+    n0: int, n1: int, n2: int, n3: int, n4: int, n5: int, n6: int, n7: int
+) -> int:
+    """Bits set in at least 4 of the 8 neighbour boards, via a carry-save adder tree."""
+    ones_a, twos_a = _full_add(n0, n1, n2)
+    ones_b, twos_b = _full_add(n3, n4, n5)
+    ones_c, twos_c = n6 ^ n7, n6 & n7
+    _, twos_d = _full_add(ones_a, ones_b, ones_c)
+    twos_e, fours_a = _full_add(twos_a, twos_b, twos_c)
+    fours_b = twos_e & twos_d
+    # Fours digit or eights digit set: fours_a + fours_b >= 1.
+    return fours_a | fours_b
+
+
+def row_bits(row: bytes) -> int:
+    """One row as an int with bit c set for a roll in column c."""
+    return int(row.translate(_BITS)[::-1] or b"0", 2)
+
+
+@dataclass
+class Bitboard:
+    rolls: int
+    width: int
+    height: int
+
+    @property
+    def stride(self) -> int:
+        return self.width + 1
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[bytes]) -> Bitboard:
+        rows = [row.rstrip(b"\r") for row in rows if row.strip()]
+        width = max(map(len, rows), default=0)
+        # Row 0 must end up in the low bits, so build the binary digits
+        # back to front: each row reversed, behind its padding zero.
+        digits = b"".join(
+            b"0" + row.translate(_BITS).ljust(width, b"0")[::-1] for row in reversed(rows)
+        )
+        return cls(int(digits or b"0", 2), width, len(rows))
+
+    @classmethod
+    def parse(cls, data: bytes) -> Bitboard:
+        return cls.from_rows(data.split(b"\n"))
+
+    def to_rows(self, rolls: int | None = None) -> list[bytes]:
+        """The board back as rows of '@' and '.' (the inverse of from_rows)."""
+        board = self.rolls if rolls is None else rolls
+        stride = self.stride
+        digits = format(board, "b").zfill(stride * self.height)[::-1].encode()
+        return [
+            digits[row * stride : row * stride + self.width].translate(_CELLS)
+            for row in range(self.height)
+        ]
+
+    def crowded(self, board: int) -> int:
+        """Cells (rolls or not) with at least 4 neighbouring rolls on `board`."""
+        stride = self.stride
+        # Right shifts bring in the neighbours at higher bits (right and below),
+        # left shifts those at lower bits (left and above).
+        n0, n1, n2 = board >> (stride - 1), board >> stride, board >> (stride + 1)
+        n3, n4 = board >> 1, board << 1
+        n5, n6, n7 = board << (stride - 1), board << stride, board << (stride + 1)
+
+        return at_least_four(n0, n1, n2, n3, n4, n5, n6, n7)
+
+    def accessible(self, rolls: int | None = None) -> int:
+        """Rolls with fewer than 4 neighbouring rolls, as a board."""
+        board = self.rolls if rolls is None else rolls
+        return board & ~self.crowded(board)
+
+    def peel(self) -> int:
+        """Part 2: remove accessible rolls round by round; how many were removed."""
+        board = self.rolls
+        while accessible := self.accessible(board):
+            board ^= accessible
+        return self.rolls.bit_count() - board.bit_count()
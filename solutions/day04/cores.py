@@ -0,0 +1,116 @@
+"""
+k-core decomposition of the day04 roll grid.
+
+Part 2 removes, round after round, every roll with fewer than 4 neighbouring
+rolls. For any threshold t the rolls that are never removed are the grid's
+t-core, the largest set in which every roll has at least t neighbours in the
+set. A roll's core number is the largest t whose core it belongs to, i.e.
+the highest threshold at which it survives. Core numbers are at most 8 here,
+so one bucketed peel (threshold 1, then 2, ... 8, each step continuing from
+the last) finds them all in O(cells) time. After that, "how many rolls go at
+threshold t" is a prefix sum over a 9-entry histogram.
+
+The round in which a roll goes does depend on the threshold. rounds(t)
+replays the peel as a frontier walk, where only the neighbours of rolls
+removed in one round are looked at in the next. That is linear too, and
+each threshold's result is cached.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from solutions import lib
+
+ROLL = ord("@")
+MAX_NEIGHBOURS = 8
+
+
+@dataclass
+class Cores:
+    grid: lib.Grid
+    rolls: list[int]  # grid indices of every roll
+    core: dict[int, int]  # grid index -> core number
+    histogram: list[int]  # rolls per core number 0..8
+    _rounds: dict[int, dict[int, int]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def parse(cls, data: bytes) -> Cores:
+        grid = lib.load_grid(data)
+        rolls = grid.find(b"@")
+        core = decompose(grid, rolls)
+        histogram = [0] * (MAX_NEIGHBOURS + 1)
+        for number in core.values():
+            histogram[number] += 1
+        return cls(grid, rolls, core, histogram)
+
+    def removed(self, threshold: int = 4) -> int:
+        """How many rolls part 2 removes when rolls need `threshold` neighbours to stay."""
+        return sum(self.histogram[: max(threshold, 0)])
+
+    def survives(self, x: int, y: int, threshold: int = 4) -> bool:
+        return self.core.get(self.grid.index(x, y), -1) >= threshold
+
+    def rounds(self, threshold: int = 4) -> dict[int, int]:
+        """grid index -> the round (from 1) in which that roll is removed at `threshold`."""
+        if threshold not in self._rounds:
+            self._rounds[threshold] = peel_rounds(self.grid, self.rolls, threshold)
+        return self._rounds[threshold]
+
+    def round_count(self, threshold: int = 4) -> int:
+        return max(self.rounds(threshold).values(), default=0)
+
+
+def degrees(grid: lib.Grid, rolls: list[int]) -> dict[int, int]:
+    cells = grid.cells
+    offsets = grid.neighbours
+    return {i: sum(cells[i + offset] == ROLL for offset in offsets) for i in rolls}
+
+
+def decompose(grid: lib.Grid, rolls: list[int]) -> dict[int, int]:
+    """Core number of every roll (bucketed peel, O(cells) for 8-neighbour grids)."""
+    degree = degrees(grid, rolls)
+    offsets = grid.neighbours
+    core: dict[int, int] = {}
+    for threshold in range(1, MAX_NEIGHBOURS + 2):
+        # Every roll still present with fewer than `threshold` neighbours has
+        # core number threshold - 1; removing it may push neighbours under too.
+        stack = [i for i, count in degree.items() if count < threshold]
+        while stack:
+            i = stack.pop()
+            if i not in degree:
+                continue
+            del degree[i]
+            core[i] = threshold - 1
+            for offset in offsets:
+                j = i + offset
+                if j in degree:
+                    degree[j] -= 1
+                    if degree[j] < threshold:
+                        stack.append(j)
+        if not degree:
+            break
+    return core
+
+
+def peel_rounds(grid: lib.Grid, rolls: list[int], threshold: int) -> dict[int, int]:
+    """Round of removal per roll when rolls with < threshold neighbours go each round."""
+    degree = degrees(grid, rolls)
+    offsets = grid.neighbours
+    removed_in: dict[int, int] = {}
+    frontier = [i for i, count in degree.items() if count < threshold]
+    round_number = 0
+    while frontier:
+        round_number += 1
+        for i in frontier:
+            removed_in[i] = round_number
+        # Only neighbours of this round's removals can drop below threshold.
+        candidates = set()
+        for i in frontier:
+            for offset in offsets:
+                j = i + offset
+                if j in degree and j not in removed_in:
+                    degree[j] -= 1
+                    candidates.add(j)
+        frontier = [j for j in candidates if degree[j] < threshold]
+    return removed_in
@@ -4,12 +4,21 @@ import argparse
 import sys
 import itertools
 
-from typing import Generator
+from typing import Generator, Iterable, Iterator
 from pathlib import Path
 
 
 YEAR = 2025
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc import progress  # noqa: E402
+from aoc.registry import variant  # noqa: E402
+from aoc.store import read_input_text  # noqa: E402
+from solutions.day04 import tiled  # noqa: E402
+from solutions.day04.bitboard import Bitboard, at_least_four, row_bits  # noqa: E402
+
 DAY_DIR = Path(__file__).resolve().parent
 DAY = DAY_DIR.name if DAY_DIR.name.startswith("day") else "dayXX"
 DATA_DIR = ROOT / "data" / str(YEAR) / DAY
@@ -46,14 +55,10 @@ def read_input() -> list[str]:
     """
     Load the puzzle input for this part.
 
-    Only one input file is stored (part1.txt).
+    Only one input is stored per day; it is resolved through the input store
+    (data/store) and falls back to part1.txt.
     """
-    part1 = DATA_DIR / "part1.txt"
-
-    if not part1.exists():
-        raise FileNotFoundError(f"No input file found in {DATA_DIR}. Add part1.txt.")
-
-    return part1.read_text().splitlines()
+    return read_input_text(DATA_DIR).splitlines()
 
 def neighbors(r: int, c: int) -> Generator[tuple[int, int]]:
     for dir_r, dir_c in itertools.product([-1, 0, 1], repeat=2):
@@ -75,7 +80,9 @@ def solve(lines: list[str]) -> int | str:
                 continue
             count = 0
             for n_r, n_c in neighbors(line_r, line_c):
-                if 0 <= n_r < len(grid) and 0 <= n_c < len(line_val) and grid[n_r][n_c] == '@':
+                # A roll marked 'x' is accessible but still in place, so it
+                # still counts as a neighbour.
+                if 0 <= n_r < len(grid) and 0 <= n_c < len(line_val) and grid[n_r][n_c] in "@x":
                     count += 1
             if count < 4:
                 grid[line_r][line_c] = 'x'
@@ -84,6 +91,52 @@ def solve(lines: list[str]) -> int | str:
     print("\n" + EXPECTED)
     return total
 
+@variant("bitboard", kind="bytes")
+def solve_bitboard(data: bytes) -> int:
+    """solve() with all neighbour counts done bit-parallel (see bitboard.py)."""
+    return Bitboard.parse(data).accessible().bit_count()
+
+@variant("tiled", kind="bytes")
+def solve_tiled(data: bytes) -> int:
+    """solve() on row bands in parallel processes over a shared-memory grid."""
+    return tiled.run(data, peel=False)
+
+def accessible_in_row(above: int, middle: int, below: int) -> int:
+    crowded = at_least_four(
+        above << 1, above, above >> 1, middle << 1, middle >> 1, below << 1, below, below >> 1
+    )
+    return (middle & ~crowded).bit_count()
+
+def row_counts(rows: Iterable[bytes]) -> Iterator[int]:
+    """
+    Accessible rolls per row, each yielded as soon as the row below it has
+    been read. Only three rows are ever held, as ints of bits, so memory is
+    O(width) however tall the grid is.
+    """
+    above = middle = 0
+    started = False
+    for row in rows:
+        row = row.rstrip(b"\r\n")
+        if not row:
+            continue
+        below = row_bits(row)
+        if started:
+            yield accessible_in_row(above, middle, below)
+        above, middle, started = middle, below, True
+    if started:
+        yield accessible_in_row(above, middle, 0)
+
+@variant("stream", kind="path")
+def solve_stream(path: Path) -> int:
+    """solve() reading the grid line by line with a rolling three-row window."""
+    total = 0
+    with path.open("rb") as handle:
+        for done, count in enumerate(row_counts(handle), start=1):
+            total += count
+            if done % 4096 == 0:
+                progress.update(done)
+    return total
+
 def run_tests() -> None:
     if not TESTS:
         raise SystemExit("Add test cases to TESTS to run tests.")
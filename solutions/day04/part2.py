@@ -4,12 +4,24 @@ import argparse
 import sys
 import itertools
 
+from dataclasses import dataclass
 from typing import Generator
 from pathlib import Path
 
 
 YEAR = 2025
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc import progress  # noqa: E402
+from aoc.checkpoint import resumable  # noqa: E402
+from aoc.registry import variant  # noqa: E402
+from aoc.store import read_input_text  # noqa: E402
+from solutions.day04 import tiled  # noqa: E402
+from solutions.day04.bitboard import Bitboard  # noqa: E402
+from solutions.day04.cores import Cores  # noqa: E402
+
 DAY_DIR = Path(__file__).resolve().parent
 DAY = DAY_DIR.name if DAY_DIR.name.startswith("day") else "dayXX"
 DATA_DIR = ROOT / "data" / str(YEAR) / DAY
@@ -25,7 +37,7 @@ TESTS: list[tuple[str, int | str]] = [
 @.@@@.@@@@
 .@@@@@@@@.
 @.@.@@@.@.
-""", 13
+""", 43
 )
 ]
 
@@ -46,14 +58,10 @@ def read_input() -> list[str]:
     """
     Load the puzzle input for this part.
 
-    Only one input file is stored (part1.txt).
+    Only one input is stored per day; it is resolved through the input store
+    (data/store) and falls back to part1.txt.
     """
-    part1 = DATA_DIR / "part1.txt"
-
-    if not part1.exists():
-        raise FileNotFoundError(f"No input file found in {DATA_DIR}. Add part1.txt.")
-
-    return part1.read_text().splitlines()
+    return read_input_text(DATA_DIR).splitlines()
 
 def neighbors(r: int, c: int) -> Generator[tuple[int, int]]:
     for dir_r, dir_c in itertools.product([-1, 0, 1], repeat=2):
@@ -65,15 +73,30 @@ def print_grid(grid: list[list[str]]):
     print()
     print("\n".join(["".join(row) for row in grid]))
 
-def solve(lines: list[str]) -> int | str:
-    total = 0
-    all_removed = set[tuple[int, int]]()
-    all_possible= set[tuple[int, int]]()
-    for line_r, line_val in enumerate(lines):
-        for line_c, cell_val in enumerate(line_val):
-            if cell_val == '@':
-                all_possible.add((line_r, line_c))
-    
+@dataclass(frozen=True)
+class PeelState:
+    """Rolls still in place and how many have been removed so far."""
+
+    remaining: frozenset[tuple[int, int]]
+    removed: int
+
+
+@resumable
+def solve(
+    lines: list[str], state: PeelState | None = None
+) -> Generator[PeelState, None, int]:
+    """Peel accessible rolls round by round, yielding a checkpoint after each round."""
+    if state is None:
+        all_possible = set[tuple[int, int]]()
+        for line_r, line_val in enumerate(lines):
+            for line_c, cell_val in enumerate(line_val):
+                if cell_val == '@':
+                    all_possible.add((line_r, line_c))
+        removed_count = 0
+    else:
+        all_possible = set(state.remaining)
+        removed_count = state.removed
+
     while True:
         removed = set[tuple[int, int]]()
         for (r, c) in all_possible:
@@ -87,9 +110,43 @@ def solve(lines: list[str]) -> int | str:
             break
 
         all_possible = all_possible.difference(removed)
-        all_removed.update(removed)
-    
-    return len(all_removed)
+        removed_count += len(removed)
+        progress.update(removed_count)
+        yield PeelState(frozenset(all_possible), removed_count)
+
+    return removed_count
+
+@variant("bitboard", kind="bytes")
+def solve_bitboard(data: bytes) -> int:
+    """solve() peeling the whole grid per round in a few big-int operations."""
+    board = Bitboard.parse(data)
+    rolls = board.rolls
+    while accessible := board.accessible(rolls):
+        rolls ^= accessible
+        progress.update(board.rolls.bit_count() - rolls.bit_count())
+    return board.rolls.bit_count() - rolls.bit_count()
+
+@variant("tiled", kind="bytes")
+def solve_tiled(data: bytes) -> int:
+    """solve() peeling row bands in parallel, exchanging halo rows between rounds."""
+    return tiled.run(data, peel=True)
+
+@variant("cores", kind="bytes")
+def solve_cores(data: bytes) -> int:
+    """solve() read off the k-core decomposition (see cores.py)."""
+    return Cores.parse(data).removed(4)
+
+def print_thresholds(data: bytes) -> None:
+    """Removed rolls and peel rounds for every threshold, from one decomposition."""
+    cores = Cores.parse(data)
+    print(f"{len(cores.rolls)} rolls; core numbers: {cores.histogram}")
+    print(f"{'threshold':>9} {'removed':>9} {'remaining':>9} {'rounds':>6}")
+    for threshold in range(1, 9):
+        removed = cores.removed(threshold)
+        print(
+            f"{threshold:>9} {removed:>9} {len(cores.rolls) - removed:>9} "
+            f"{cores.round_count(threshold):>6}"
+        )
 
 def run_tests() -> None:
     if not TESTS:
@@ -117,6 +174,11 @@ def parse_cli(argv: list[str]) -> argparse.Namespace:
     parser.add_argument(
         "--test", action="store_true", help="Run inline TESTS instead of puzzle input"
     )
+    parser.add_argument(
+        "--thresholds",
+        action="store_true",
+        help="Print removed rolls and rounds for thresholds 1-8 instead of the answer",
+    )
     return parser.parse_args(argv)
 
 
@@ -125,6 +187,9 @@ def main(argv: list[str] | None = None) -> None:
     if args.test:
         run_tests()
         return
+    if args.thresholds:
+        print_thresholds(read_input_text(DATA_DIR).encode())
+        return
 
     lines = read_input()
     answer = solve(lines)
@@ -0,0 +1,162 @@
+"""
+Tiled multi-process execution for day04.
+
+The padded grid (lib.load_grid) is copied once into a SharedMemory block.
+It is cut into bands of whole rows, and every worker attaches to the block
+by name and reads its band plus one halo row above and below. It counts
+neighbours for the band with the bitboard adder tree, with the halo rows
+taking part as neighbours only. Nothing but the block name and row numbers
+crosses the process boundary.
+
+Part 2 runs in rounds. Each dirty band peels itself to a local fixpoint,
+treating its halo rows as fixed, and writes its rows back to the block. It
+reports whether its first or last row changed, and only neighbours that saw
+such a change are dirty in the next round. This stops once no band
+changes. A band may read a halo row while its neighbour is rewriting it,
+which is harmless: removals only ever clear cells, so a stale halo only
+delays a removal to a later round. The set of rolls that can eventually be
+removed does not depend on the order of removal either.
+
+    uv run solutions/day04/tiled.py [--input <path>] [--workers <n>] [--part 1|2]
+
+times the tiled mode at 1, 2, 4, ... workers against the serial bitboard.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from multiprocessing import shared_memory
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc.store import InputSource  # noqa: E402
+from aoc.units import format_count, format_duration  # noqa: E402
+from solutions import lib  # noqa: E402
+from solutions.day04.bitboard import Bitboard  # noqa: E402
+
+DATA_DIR = ROOT / "data" / "2025" / "day04"
+# Bands per worker, so a band that keeps changing does not hold up a whole round.
+BANDS_PER_WORKER = 4
+
+
+def run_band(
+    name: str, width: int, first: int, last: int, peel: bool
+) -> tuple[int, bool, bool]:
+    """
+    Worker: count (or, with peel, remove to a local fixpoint) the accessible
+    rolls in grid rows [first, last). Returns (count, first row changed, last
+    row changed).
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        stride = width + 2
+        # Padded row y + 1 holds grid row y, so rows first..last + 1 are the
+        # band with its halo (the border rows at the grid's edges).
+        start, stop = first * stride, (last + 2) * stride
+        rows = [bytes(block.buf[i : i + stride]) for i in range(start, stop, stride)]
+        board = Bitboard.from_rows(rows)
+        band = ((1 << (board.stride * (last - first))) - 1) << board.stride
+        if not peel:
+            return (board.accessible() & band).bit_count(), False, False
+
+        rolls = board.rolls
+        while accessible := board.accessible(rolls) & band:
+            rolls ^= accessible
+        removed = board.rolls.bit_count() - rolls.bit_count()
+        if not removed:
+            return 0, False, False
+        peeled = board.to_rows(rolls)
+        block.buf[start + stride : stop - stride] = b"".join(peeled[1:-1])
+        return removed, peeled[1] != rows[1], peeled[-2] != rows[-2]
+    finally:
+        block.close()
+
+
+def bands(height: int, count: int) -> list[tuple[int, int]]:
+    size = max(1, -(-height // max(count, 1)))
+    return [(first, min(first + size, height)) for first in range(0, height, size)]
+
+
+def run(data: bytes, peel: bool, workers: int | None = None) -> int:
+    """Part 1 (peel=False) or part 2 answer, computed band by band on a process pool."""
+    workers = workers or os.cpu_count() or 1
+    grid = lib.load_grid(data)
+    width, cells = grid.width, grid.cells
+    tiles = bands(grid.height, workers * BANDS_PER_WORKER)
+    del grid
+    with lib.shared_block(len(cells)) as block:
+        block.buf[: len(cells)] = cells
+        del cells
+        total = 0
+        with lib.worker_pool(workers) as pool:
+            dirty = set(range(len(tiles)))
+            while dirty:
+                futures = {
+                    index: pool.submit(run_band, block.name, width, *tiles[index], peel)
+                    for index in sorted(dirty)
+                }
+                # A band only needs another look once a row of its halo, i.e.
+                # a neighbour's first or last row, has changed.
+                dirty = set()
+                for index, future in futures.items():
+                    count, top, bottom = future.result()
+                    total += count
+                    if top and index > 0:
+                        dirty.add(index - 1)
+                    if bottom and index + 1 < len(tiles):
+                        dirty.add(index + 1)
+        return total
+
+
+def scaling_report(path: Path, max_workers: int, peel: bool) -> None:
+    data = path.read_bytes()
+    board = Bitboard.parse(data)
+    cells = board.width * board.height
+
+    started = time.perf_counter()
+    expected = board.peel() if peel else board.accessible().bit_count()
+    serial = time.perf_counter() - started
+    print(
+        f"{path}: {board.width} x {board.height} = {format_count(cells)} cells, "
+        f"{os.cpu_count()} CPU(s)"
+    )
+    print(f"{'mode':<12}{'time':>12}{'cells/s':>10}{'speedup':>10}")
+    print(
+        f"{'serial':<12}{format_duration(serial):>12}"
+        f"{format_count(cells / serial):>10}{1.0:>9.2f}x"
+    )
+    workers = 1
+    while True:
+        started = time.perf_counter()
+        answer = run(data, peel, workers)
+        elapsed = time.perf_counter() - started
+        if answer != expected:
+            raise SystemExit(f"{workers} workers answered {answer}, serial {expected}")
+        print(
+            f"{f'{workers} worker(s)':<12}{format_duration(elapsed):>12}"
+            f"{format_count(cells / elapsed):>10}{serial / elapsed:>9.2f}x"
+        )
+        if workers >= max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Time tiled day04 against the serial bitboard."
+    )
+    parser.add_argument("--input", type=Path, help="Grid file (default: the stored input)")
+    parser.add_argument("--part", type=int, choices=(1, 2), default=2)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+    scaling_report(InputSource(DATA_DIR, args.input).file(), args.workers, args.part == 2)
+
+
+if __name__ == "__main__":
+    main()
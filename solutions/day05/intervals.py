@@ -0,0 +1,62 @@
+"""
+A sorted index of merged fresh-ID intervals for day05 membership queries.
+
+Overlapping and touching intervals are merged into disjoint [start, end]
+pairs kept in two parallel sorted lists, so an ID is looked up with one
+bisect instead of a scan over every interval. add() merges a new interval
+with just the neighbours it overlaps, so the index grows without rebuilds.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+
+class IntervalIndex:
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()) -> None:
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        for start, end in sorted(intervals):
+            if start > end:
+                raise ValueError(f"Interval {start}-{end} ends before it starts")
+            if self.ends and start <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __contains__(self, value: int) -> bool:
+        position = bisect_right(self.starts, value) - 1
+        return position >= 0 and value <= self.ends[position]
+
+    def add(self, start: int, end: int) -> None:
+        """Insert [start, end], merging it with every interval it overlaps or touches."""
+        if start > end:
+            raise ValueError(f"Interval {start}-{end} ends before it starts")
+        # Intervals [first, last) are the ones to merge: they end at or after
+        # start - 1 and begin at or before end + 1.
+        first = bisect_left(self.ends, start - 1)
+        last = bisect_right(self.starts, end + 1)
+        if first < last:
+            start = min(start, self.starts[first])
+            end = max(end, self.ends[last - 1])
+        self.starts[first:last] = [start]
+        self.ends[first:last] = [end]
+
+    def count(self, values: Iterable[int]) -> int:
+        """How many of values fall inside some interval."""
+        starts, ends = self.starts, self.ends
+        found = 0
+        for value in values:
+            position = bisect_right(starts, value) - 1
+            if position >= 0 and value <= ends[position]:
+                found += 1
+        return found
+
+    def covered(self) -> int:
+        """How many distinct IDs the intervals cover (part 2's answer)."""
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
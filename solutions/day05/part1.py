@@ -1,11 +1,21 @@
 from __future__ import annotations
 import argparse
 import sys
+from array import array
 from pathlib import Path
+from typing import Iterable, Mapping, Sequence
 
 
 YEAR = 2025
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc.registry import variant  # noqa: E402
+from aoc.store import read_input_text  # noqa: E402
+from solutions import lib  # noqa: E402
+from solutions.day05.intervals import IntervalIndex  # noqa: E402
+
 DAY_DIR = Path(__file__).resolve().parent
 DAY = DAY_DIR.name if DAY_DIR.name.startswith("day") else "dayXX"
 DATA_DIR = ROOT / "data" / str(YEAR) / DAY
@@ -31,14 +41,10 @@ def read_input() -> list[str]:
     """
     Load the puzzle input for this part.
 
-    Only one input file is stored (part1.txt).
+    Only one input is stored per day; it is resolved through the input store
+    (data/store) and falls back to part1.txt.
     """
-    part1 = DATA_DIR / "part1.txt"
-
-    if not part1.exists():
-        raise FileNotFoundError(f"No input file found in {DATA_DIR}. Add part1.txt.")
-
-    return part1.read_text().splitlines()
+    return read_input_text(DATA_DIR).splitlines()
 
 def solve(lines: list[str]) -> int | str:
     idx = 0
@@ -50,10 +56,11 @@ def solve(lines: list[str]) -> int | str:
         intervals.append((int(start), int(end)))
 
     idx += 1
-    count = 0
-    for line in lines[idx:]:
-        val = int(line)
+    return count_fresh(intervals, (int(line) for line in lines[idx:]))
 
+def count_fresh(intervals: list[tuple[int, int]], ids: Iterable[int]) -> int:
+    count = 0
+    for val in ids:
         for (start, end) in intervals:
             if start <= val and val <= end:
                 count += 1
@@ -61,6 +68,31 @@ def solve(lines: list[str]) -> int | str:
     
     return count
 
+def parse(data: bytes) -> dict[str, array]:
+    """Typed arrays for the parse cache: interval bounds and the IDs to check."""
+    interval_block, _, id_block = data.partition(b"\n\n")
+    starts = array("q")
+    ends = array("q")
+    for line in interval_block.split():
+        start, end = line.split(b"-")
+        starts.append(int(start))
+        ends.append(int(end))
+    return {"starts": starts, "ends": ends, "ids": array("q", map(int, id_block.split()))}
+
+def solve_parsed(parsed: Mapping[str, Sequence[int]]) -> int:
+    """solve() over the cached interval bounds and IDs."""
+    return count_fresh(list(zip(parsed["starts"], parsed["ends"])), parsed["ids"])
+
+@variant("indexed", kind="bytes")
+def solve_indexed(data: bytes) -> int:
+    """solve() with the intervals merged into a bisect index (see intervals.py)."""
+    blocks = lib.sections(data)
+    if not blocks:
+        return 0
+    starts, ends = lib.ranges(blocks[0])
+    index = IntervalIndex(zip(starts, ends))
+    return index.count(lib.ints(blocks[1]) if len(blocks) > 1 else ())
+
 def run_tests() -> None:
     if not TESTS:
         raise SystemExit("Add test cases to TESTS to run tests.")
@@ -0,0 +1,176 @@
+"""
+Long-lived fresh-ID lookup service for day05.
+
+The merged interval index is built once (from the stored puzzle input's
+interval section, or --intervals PATH, or empty with --empty) and then
+answers a line protocol, on stdin/stdout by default or on a Unix socket:
+
+    17 32 5           IDs to look up, any number per line (one batch):
+                      answered with one line of 1/0 flags, in order
+    + 3-5 10-14       add intervals to the running index; answered "ok <n>"
+                      with the number of merged intervals
+    stats             "queries <n> batches <b> intervals <m> qps <rate>"
+    quit              close this connection (EOF does the same)
+
+Malformed lines get "error <message>" and the connection stays open. The
+running totals and queries per second are also written to stderr when the
+server stops.
+
+    uv run solutions/day05/server.py [--socket /tmp/day05.sock]
+"""
+
+from __future__ import annotations
+
+import argparse
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc.store import InputSource  # noqa: E402
+from aoc.units import format_count, format_duration  # noqa: E402
+from solutions import lib  # noqa: E402
+from solutions.day05.intervals import IntervalIndex  # noqa: E402
+
+DATA_DIR = ROOT / "data" / "2025" / "day05"
+
+
+def load_index(data: bytes) -> IntervalIndex:
+    """Index of the interval section (everything before the first blank line)."""
+    blocks = lib.sections(data)
+    if not blocks:
+        return IntervalIndex()
+    starts, ends = lib.ranges(blocks[0])
+    return IntervalIndex(zip(starts, ends))
+
+
+class QueryService:
+    """The index plus counters, shared by every connection."""
+
+    def __init__(self, index: IntervalIndex) -> None:
+        self.index = index
+        self.lock = threading.Lock()
+        self.queries = 0
+        self.batches = 0
+        self.busy = 0.0  # seconds spent answering lookups
+        self.started = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self.queries / self.busy if self.busy > 0 else 0.0
+
+    def handle(self, line: bytes) -> bytes | None:
+        """The response line for one request line, or None to close the connection."""
+        request = line.strip()
+        if not request:
+            return b""
+        if request == b"quit":
+            return None
+        if request == b"stats":
+            with self.lock:
+                return (
+                    f"queries {self.queries} batches {self.batches} "
+                    f"intervals {len(self.index)} qps {self.rate:.0f}\n"
+                ).encode()
+        try:
+            if request.startswith(b"+"):
+                starts, ends = lib.ranges(request[1:])
+                # Check the whole line first so an error never leaves it half applied.
+                for start, end in zip(starts, ends):
+                    if start > end:
+                        raise ValueError(f"Interval {start}-{end} ends before it starts")
+                with self.lock:
+                    for start, end in zip(starts, ends):
+                        self.index.add(start, end)
+                    return f"ok {len(self.index)}\n".encode()
+            return self.lookup(request.split())
+        except ValueError as exc:
+            return f"error {exc}\n".encode()
+
+    def lookup(self, tokens: list[bytes]) -> bytes:
+        ids = list(map(int, tokens))
+        with self.lock:
+            started = time.perf_counter()
+            index = self.index
+            flags = b" ".join(b"1" if value in index else b"0" for value in ids)
+            self.busy += time.perf_counter() - started
+            self.queries += len(ids)
+            self.batches += 1
+        return flags + b"\n"
+
+    def serve(self, reader: BinaryIO, writer: BinaryIO) -> None:
+        for line in reader:
+            response = self.handle(line)
+            if response is None:
+                break
+            if response:
+                writer.write(response)
+                writer.flush()
+
+    def summary(self) -> str:
+        return (
+            f"answered {format_count(self.queries)} queries in {self.batches} batches "
+            f"({format_count(self.rate)} queries/s while answering), "
+            f"{len(self.index)} intervals, up {format_duration(time.monotonic() - self.started)}"
+        )
+
+
+def serve_socket(service: QueryService, path: Path) -> None:
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            service.serve(self.rfile, self.wfile)
+
+    if path.exists():
+        path.unlink()
+    with socketserver.ThreadingUnixStreamServer(str(path), Handler) as server:
+        print(f"Listening on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def parse_cli(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve day05 fresh-ID lookups.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--intervals",
+        type=Path,
+        help="File whose first section holds a-b intervals (default: the stored input)",
+    )
+    source.add_argument("--empty", action="store_true", help="Start with no intervals")
+    parser.add_argument(
+        "--socket", type=Path, help="Listen on this Unix socket instead of stdin/stdout"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_cli(argv if argv is not None else sys.argv[1:])
+    data = b"" if args.empty else InputSource(DATA_DIR, args.intervals).read_bytes()
+    started = time.perf_counter()
+    service = QueryService(load_index(data))
+    print(
+        f"Indexed {len(service.index)} merged intervals "
+        f"in {format_duration(time.perf_counter() - started)}",
+        file=sys.stderr,
+    )
+    try:
+        if args.socket is not None:
+            serve_socket(service, args.socket)
+        else:
+            service.serve(sys.stdin.buffer, sys.stdout.buffer)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(service.summary(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
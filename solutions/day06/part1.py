@@ -1,13 +1,23 @@
 from __future__ import annotations
 import argparse
+from array import array
 from functools import reduce
 import sys
 from pathlib import Path
 from tokenize import group
+from typing import Mapping, Sequence
 
 
 YEAR = 2025
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc.registry import variant  # noqa: E402
+from aoc.store import read_input_text  # noqa: E402
+from solutions import lib  # noqa: E402
+from solutions.lib import columns  # noqa: E402
+
 DAY_DIR = Path(__file__).resolve().parent
 DAY = DAY_DIR.name if DAY_DIR.name.startswith("day") else "dayXX"
 DATA_DIR = ROOT / "data" / str(YEAR) / DAY
@@ -26,20 +36,14 @@ def read_input() -> list[str]:
     """
     Load the puzzle input for this part.
 
-    Only one input file is stored (part1.txt).
+    Only one input is stored per day; it is resolved through the input store
+    (data/store) and falls back to part1.txt.
     """
-    part1 = DATA_DIR / "part1.txt"
-
-    if not part1.exists():
-        raise FileNotFoundError(f"No input file found in {DATA_DIR}. Add part1.txt.")
-
-    return part1.read_text().splitlines()
+    return read_input_text(DATA_DIR).splitlines()
 
 def solve(lines: list[str]) -> int | str:
     def add(a, b):
         return a + b
-    def multiply(a, b):
-        return a * b
 
     length = max([len(line.split()) for line in lines])
     groupings: list[list[int]] = [[] for _ in range(0, length)]
@@ -54,12 +58,102 @@ def solve(lines: list[str]) -> int | str:
             case "+":
                 output.append(reduce(add, groupings[i]))
             case "*":
-                output.append(reduce(multiply, groupings[i]))
+                output.append(lib.product(groupings[i]))
             case _:
                 print('operator not understood', operator) 
     
     return sum(output)
 
+def parse(data: bytes) -> dict[str, array]:
+    """
+    Typed arrays for the parse cache: operands row-major, one operator byte per
+    column, and the (rows, columns) shape.
+    """
+    rows = [row for row in data.splitlines() if row.strip()]
+    operators = rows[-1].split()
+    values = array("q")
+    for row in rows[:-1]:
+        values.extend(map(int, row.split()))
+    return {
+        "values": values,
+        "operators": array("B", b"".join(operators)),
+        "shape": array("q", [len(rows) - 1, len(operators)]),
+    }
+
+def solve_parsed(parsed: Mapping[str, Sequence[int]]) -> int:
+    """solve() over the cached operand matrix."""
+    _, columns = parsed["shape"]
+    values = parsed["values"]
+    total = 0
+    for i, operator in enumerate(parsed["operators"]):
+        column = values[i::columns]
+        match chr(operator):
+            case "+":
+                total += sum(column)
+            case "*":
+                total += lib.product(column)
+            case _:
+                print('operator not understood', chr(operator))
+    return total
+
+
+@variant("windowed", kind="path")
+def solve_windowed(path: Path, window: int = columns.WINDOW) -> int:
+    """
+    solve() streaming the memory-mapped input `window` columns at a time, so
+    memory is bounded by window x rows rather than by the width of the sheet.
+    Each problem is a block of columns between all-blank separator columns;
+    its operands are the block's numeric rows read left to right.
+    """
+    total = 0
+    with columns.mapped(path) as mm:
+        for block in columns.column_blocks(mm, window=window):
+            operands = [int(cell) for cell in block[:-1] if not cell.isspace()]
+            match block[-1].strip():
+                case b"+":
+                    total += sum(operands)
+                case b"*":
+                    total += lib.product(operands)
+                case operator:
+                    print('operator not understood', operator.decode())
+    return total
+
+
+MULTIPLY = ord("*")
+
+
+@variant("fold", kind="path")
+def solve_fold(path: Path, chunk: int = columns.WINDOW) -> int:
+    """
+    solve() in one pass over the memory-mapped input: the operator row is read
+    first by seeking back from the end of the file, then each numeric row is
+    streamed `chunk` bytes at a time and folded into a running sum or product
+    per column, so memory is O(columns) whatever the number of rows.
+    """
+    with columns.mapped(path) as mm:
+        operators_start, operators_end = columns.last_row(mm)
+        # One byte per column; the row is whitespace between single-byte operators.
+        operators = mm[operators_start:operators_end].translate(None, b" \t\r")
+        for operator in set(operators) - set(b"+*"):
+            print('operator not understood', chr(operator))
+        totals = [int(operator == MULTIPLY) for operator in operators]
+        for start, end in columns.row_spans(mm, operators_start):
+            column = 0
+            for tokens in columns.token_chunks(mm, start, end, chunk):
+                stop = column + len(tokens)
+                totals[column:stop] = [
+                    total * value if operator == MULTIPLY else total + value
+                    for total, operator, value in zip(
+                        totals[column:stop], operators[column:stop], map(int, tokens)
+                    )
+                ]
+                column = stop
+            if column != len(totals):
+                raise ValueError(
+                    f"Row has {column} numbers but there are {len(totals)} operators"
+                )
+    return sum(total for total, operator in zip(totals, operators) if operator in b"+*")
+
             
 
 
@@ -69,7 +163,7 @@ def run_tests() -> None:
 
     failed = False
     for idx, (raw, expected) in enumerate(TESTS, start=1):
-        lines = [line for line in raw.strip().splitlines()]
+        lines = raw.strip("\r\n").splitlines()
         result = solve(lines)
 
         if result != expected:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 import argparse
+import os
+import time
 from functools import reduce
 import sys
 from pathlib import Path
@@ -8,6 +10,15 @@ from tokenize import group
 
 YEAR = 2025
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc.registry import variant  # noqa: E402
+from aoc.store import InputSource, read_input_text  # noqa: E402
+from aoc.units import format_duration  # noqa: E402
+from solutions import lib  # noqa: E402
+from solutions.lib import columns  # noqa: E402
+
 DAY_DIR = Path(__file__).resolve().parent
 DAY = DAY_DIR.name if DAY_DIR.name.startswith("day") else "dayXX"
 DATA_DIR = ROOT / "data" / str(YEAR) / DAY
@@ -26,14 +37,10 @@ def read_input() -> list[str]:
     """
     Load the puzzle input for this part.
 
-    Only one input file is stored (part1.txt).
+    Only one input is stored per day; it is resolved through the input store
+    (data/store) and falls back to part1.txt.
     """
-    part1 = DATA_DIR / "part1.txt"
-
-    if not part1.exists():
-        raise FileNotFoundError(f"No input file found in {DATA_DIR}. Add part1.txt.")
-
-    return part1.read_text().splitlines()
+    return read_input_text(DATA_DIR).splitlines()
 
 def column(grouping: list[str]) -> list[int]:
     max_length:int = max([len(s) for s in grouping])
@@ -49,8 +56,6 @@ def column(grouping: list[str]) -> list[int]:
 def solve(lines: list[str]) -> int | str:
     def add(a, b):
         return a + b
-    def multiply(a, b):
-        return a * b
 
     split_indexes: list[int] = []
     for i, char in enumerate(lines[0]):
@@ -83,12 +88,101 @@ def solve(lines: list[str]) -> int | str:
             case "+":
                 output.append(reduce(add, column(groupings[i])))
             case "*":
-                output.append(reduce(multiply, column(groupings[i])))
+                output.append(lib.product(column(groupings[i])))
             case _:
                 print('operator not understood', operator) 
     
     return sum(output)
 
+
+def evaluate(block: list[bytes]) -> int:
+    """One problem from its column block: operands read top to bottom per column."""
+    operands = []
+    for digits in zip(*block[:-1]):
+        number = bytes(digits).strip()
+        if number:
+            operands.append(int(number))
+    match block[-1].strip():
+        case b"+":
+            return sum(operands)
+        case b"*":
+            return lib.product(operands)
+        case operator:
+            print('operator not understood', operator.decode())
+            return 0
+
+
+@variant("windowed", kind="path")
+def solve_windowed(path: Path, window: int = columns.WINDOW) -> int:
+    """
+    solve() streaming the memory-mapped input `window` columns at a time, so
+    memory is bounded by window x rows rather than by the width of the sheet.
+    """
+    with columns.mapped(path) as mm:
+        return sum(map(evaluate, columns.column_blocks(mm, window=window)))
+
+
+def evaluate_range(
+    path: str, spans: list[tuple[int, int]], first: int, last: int, window: int
+) -> int:
+    """Worker: the problems in columns [first, last), read from its own mapping."""
+    with columns.mapped(Path(path)) as mm:
+        return sum(map(evaluate, columns.column_blocks(mm, spans, window, first, last)))
+
+
+@variant("parallel", kind="path")
+def solve_parallel(
+    path: Path, workers: int | None = None, window: int = columns.WINDOW
+) -> int:
+    """
+    solve_windowed() on a process pool. The columns are cut at separator
+    columns into a few contiguous ranges per worker; each worker maps the file
+    itself and gets only its byte offsets (row spans plus a column range), and
+    the partial sums are added up here.
+    """
+    workers = workers or os.cpu_count() or 1
+    with columns.mapped(path) as mm:
+        spans = columns.row_spans(mm)
+        ranges = columns.split_columns(mm, spans, workers * 4)
+    if workers == 1 or len(ranges) <= 1:
+        return sum(evaluate_range(str(path), spans, *bounds, window) for bounds in ranges)
+    with lib.worker_pool(workers) as pool:
+        futures = [
+            pool.submit(evaluate_range, str(path), spans, first, last, window)
+            for first, last in ranges
+        ]
+        return sum(future.result() for future in futures)
+
+
+def speedup_report(path: Path, max_workers: int, repeat: int = 3) -> None:
+    """Best-of-`repeat` times of the serial windowed path against the pool."""
+
+    def best(fn, *args) -> tuple[float, int]:
+        times, answer = [], 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            answer = fn(path, *args)
+            times.append(time.perf_counter() - started)
+        return min(times), answer
+
+    serial, expected = best(solve_windowed)
+    print(f"{path} ({path.stat().st_size:,} bytes), {os.cpu_count()} CPU(s)")
+    print(f"{'mode':<12}{'time':>12}{'speedup':>10}{'efficiency':>12}")
+    print(f"{'serial':<12}{format_duration(serial):>12}{1.0:>9.2f}x{'':>12}")
+    workers = 1
+    while True:
+        elapsed, answer = best(solve_parallel, workers)
+        if answer != expected:
+            raise SystemExit(f"{workers} workers answered {answer}, serial {expected}")
+        speedup = serial / elapsed
+        print(
+            f"{f'{workers} worker(s)':<12}{format_duration(elapsed):>12}"
+            f"{speedup:>9.2f}x{speedup / workers:>11.0%}"
+        )
+        if workers >= max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+
             
 
 
@@ -98,7 +192,7 @@ def run_tests() -> None:
 
     failed = False
     for idx, (raw, expected) in enumerate(TESTS, start=1):
-        lines = [line for line in raw.strip().splitlines()]
+        lines = raw.strip("\r\n").splitlines()
         result = solve(lines)
 
         if result != expected:
@@ -118,6 +212,20 @@ def parse_cli(argv: list[str]) -> argparse.Namespace:
     parser.add_argument(
         "--test", action="store_true", help="Run inline TESTS instead of puzzle input"
     )
+    parser.add_argument(
+        "--speedup",
+        action="store_true",
+        help="Time the process-pool mode against the serial windowed solve",
+    )
+    parser.add_argument(
+        "--input", type=Path, help="Input file for --speedup (default: the stored input)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Largest worker count for --speedup (default: CPU count)",
+    )
     return parser.parse_args(argv)
 
 
@@ -126,6 +234,9 @@ def main(argv: list[str] | None = None) -> None:
     if args.test:
         run_tests()
         return
+    if args.speedup:
+        speedup_report(InputSource(DATA_DIR, args.input).file(), args.workers)
+        return
 
     lines = read_input()
     answer = solve(lines)
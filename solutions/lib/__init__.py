@@ -0,0 +1,26 @@
+"""Shared helpers for solution files: fast parsing primitives and CLI boilerplate."""
+
+from solutions.lib import columns
+from solutions.lib.cli import main, parse_cli, run_tests, test_lines
+from solutions.lib.grid import Grid, load_grid
+from solutions.lib.parsing import ints, ranges, sections, signed_tags, tagged_ints
+from solutions.lib.pools import shared_block, worker_pool
+from solutions.lib.products import product
+
+__all__ = [
+    "Grid",
+    "columns",
+    "ints",
+    "load_grid",
+    "main",
+    "parse_cli",
+    "product",
+    "ranges",
+    "run_tests",
+    "sections",
+    "shared_block",
+    "signed_tags",
+    "tagged_ints",
+    "test_lines",
+    "worker_pool",
+]
@@ -0,0 +1,54 @@
+"""The run_tests()/main() boilerplate every solution file used to copy from the template."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any, Callable, Sequence
+
+
+def test_lines(raw: str) -> list[str]:
+    """Inline TESTS inputs as the lines solve() expects (as main.py test does)."""
+    return raw.strip("\r\n").splitlines()
+
+
+def run_tests(
+    tests: Sequence[tuple[str, int | str]], solve: Callable[[list[str]], Any]
+) -> None:
+    if not tests:
+        raise SystemExit("Add test cases to TESTS to run tests.")
+
+    failed = False
+    for idx, (raw, expected) in enumerate(tests, start=1):
+        result = solve(test_lines(raw))
+        if result != expected:
+            failed = True
+            print(f"Test {idx} failed: expected {expected!r}, got {result!r}")
+        else:
+            print(f"Test {idx} passed: got {result!r}")
+
+    if failed:
+        raise SystemExit(1)
+    print(f"All {len(tests)} tests passed.")
+
+
+def parse_cli(argv: list[str], description: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--test", action="store_true", help="Run inline TESTS instead of puzzle input"
+    )
+    return parser.parse_args(argv)
+
+
+def main(
+    argv: list[str] | None,
+    read_input: Callable[[], Any],
+    solve: Callable[[Any], Any],
+    run_tests: Callable[[], None],
+    description: str = "Advent of Code solution",
+) -> None:
+    args = parse_cli(sys.argv[1:] if argv is None else argv, description)
+    if args.test:
+        run_tests()
+        return
+    print(solve(read_input()))
@@ -0,0 +1,173 @@
+"""
+Column-wise streaming over inputs made of a few very wide rows.
+
+The file is memory-mapped and each row's byte span is found with mmap.find,
+so nothing is read up front. column_blocks() then walks all rows in parallel,
+`window` columns at a time, and yields each maximal run of columns that are
+not blank in every row (a "block", e.g. one day06 problem) as soon as the
+window containing its end has been read. Only one window per row plus the
+block currently being assembled is ever held in memory.
+
+Rows shorter than the widest one are treated as padded with spaces.
+"""
+
+from __future__ import annotations
+
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+SPACE = 0x20
+# Columns read per row per step; 64 KiB x a handful of rows stays cache-friendly.
+WINDOW = 1 << 16
+# Non-space bytes -> 0x01, spaces -> 0x00, so OR-ing rows marks occupied columns.
+_OCCUPIED = bytes(0 if c == SPACE else 1 for c in range(256))
+
+
+@contextmanager
+def mapped(path: Path) -> Iterator[mmap.mmap]:
+    with path.open("rb") as handle:
+        if handle.seek(0, 2) == 0:  # an empty file cannot be mapped
+            yield mmap.mmap(-1, 1)[:0]  # type: ignore[misc]
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def row_spans(mm: mmap.mmap, size: int | None = None) -> list[tuple[int, int]]:
+    """(start, end) byte offsets of every non-empty row in mm[:size], newlines excluded."""
+    spans: list[tuple[int, int]] = []
+    start = 0
+    size = len(mm) if size is None else size
+    while start < size:
+        end = mm.find(b"\n", start, size)
+        if end == -1:
+            end = size
+        stop = end - 1 if end > start and mm[end - 1] == 0x0D else end
+        if stop > start:
+            spans.append((start, stop))
+        start = end + 1
+    return spans
+
+
+def last_row(mm: mmap.mmap) -> tuple[int, int]:
+    """(start, end) of the last non-empty row, found by seeking back from the end."""
+    end = len(mm)
+    while end and mm[end - 1] in b"\r\n":
+        end -= 1
+    return mm.rfind(b"\n", 0, end) + 1, end
+
+
+def token_chunks(
+    mm: mmap.mmap, start: int, end: int, chunk: int = WINDOW
+) -> Iterator[list[bytes]]:
+    """
+    The whitespace-separated tokens of mm[start:end], a list per ~`chunk` bytes
+    read; a token cut by a chunk edge is carried over whole to the next list.
+    """
+    carry = b""
+    for position in range(start, end, chunk):
+        data = carry + mm[position : min(position + chunk, end)]
+        tokens = data.split()
+        carry = b""
+        if tokens and position + chunk < end and not data[-1:].isspace():
+            carry = tokens.pop()
+        if tokens:
+            yield tokens
+
+
+def read_window(
+    mm: mmap.mmap, spans: list[tuple[int, int]], column: int, width: int
+) -> list[bytes]:
+    """Columns [column, column + width) of every row, space-padded to `width`."""
+    rows = []
+    for start, end in spans:
+        chunk = mm[min(start + column, end) : min(start + column + width, end)]
+        rows.append(chunk.ljust(width, b" "))
+    return rows
+
+
+def blank_columns(rows: list[bytes]) -> list[int]:
+    """Positions that are a space in every row (rows all have the same width)."""
+    if not rows:
+        return []
+    width = len(rows[0])
+    occupied = 0
+    for row in rows:
+        occupied |= int.from_bytes(row.translate(_OCCUPIED), "big")
+    marks = occupied.to_bytes(width, "big")
+    blanks = []
+    position = marks.find(0)
+    while position != -1:
+        blanks.append(position)
+        position = marks.find(0, position + 1)
+    return blanks
+
+
+def split_columns(
+    mm: mmap.mmap, spans: list[tuple[int, int]], parts: int, window: int = 4096
+) -> list[tuple[int, int]]:
+    """
+    Cut the columns into about `parts` contiguous [first, last) ranges of
+    similar width, each cut at a blank column so no block straddles two ranges.
+    column_blocks(mm, spans, first=first, last=last) then handles each one.
+    """
+    last = max((end - start for start, end in spans), default=0)
+    cuts = [0]
+    for part in range(1, parts):
+        column = max(last * part // parts, cuts[-1])
+        while column < last:
+            width = min(window, last - column)
+            blanks = blank_columns(read_window(mm, spans, column, width))
+            if blanks:
+                column += blanks[0]
+                break
+            column += width
+        if column >= last:
+            break
+        if column > cuts[-1]:
+            cuts.append(column)
+    cuts.append(last)
+    return [(first, stop) for first, stop in zip(cuts, cuts[1:]) if stop > first]
+
+
+def column_blocks(
+    mm: mmap.mmap,
+    spans: list[tuple[int, int]] | None = None,
+    window: int = WINDOW,
+    first: int = 0,
+    last: int | None = None,
+) -> Iterator[list[bytes]]:
+    """
+    Yield every block of non-blank columns as one equal-width slice per row,
+    streaming over columns [first, last) `window` columns at a time.
+    """
+    if spans is None:
+        spans = row_spans(mm)
+    if not spans:
+        return
+    if last is None:
+        last = max(end - start for start, end in spans)
+
+    pending: list[bytes] | None = None  # a block still open at the previous window's edge
+    for column in range(first, last, window):
+        width = min(window, last - column)
+        rows = read_window(mm, spans, column, width)
+        start = 0
+        for blank in blank_columns(rows) + [width]:
+            if blank > start:
+                piece = [row[start:blank] for row in rows]
+                if pending is not None:
+                    piece = [a + b for a, b in zip(pending, piece)]
+                    pending = None
+                if blank == width:
+                    pending = piece
+                else:
+                    yield piece
+            elif pending is not None and blank < width:
+                yield pending
+                pending = None
+            start = blank + 1
+    if pending is not None:
+        yield pending
@@ -0,0 +1,64 @@
+"""
+Character grids as one flat bytearray.
+
+A grid is stored row-major with a one-cell border of `pad` around it, so
+neighbours of any real cell are always in range: the eight neighbours of
+index i are i + offset for offset in grid.neighbours. No bounds checks, no
+per-row lists.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Grid:
+    width: int
+    height: int
+    cells: bytearray
+    pad: int = ord(".")
+
+    @property
+    def stride(self) -> int:
+        return self.width + 2
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    @property
+    def neighbours(self) -> tuple[int, ...]:
+        """Index offsets of the eight surrounding cells."""
+        s = self.stride
+        return (-s - 1, -s, -s + 1, -1, 1, s - 1, s, s + 1)
+
+    def interior(self) -> range:
+        """Indices of the first to last real cell (border columns included)."""
+        return range(self.index(0, 0), self.index(self.width - 1, self.height - 1) + 1)
+
+    def find(self, value: bytes) -> list[int]:
+        """Indices of every real cell equal to the single byte `value`."""
+        target = value[0]
+        cells = self.cells
+        return [i for i in self.interior() if cells[i] == target]
+
+    def rows(self) -> list[bytes]:
+        return [
+            bytes(self.cells[self.index(0, y) : self.index(0, y) + self.width])
+            for y in range(self.height)
+        ]
+
+
+def load_grid(data: bytes, pad: bytes = b".") -> Grid:
+    """Parse newline-separated rows of equal width into a padded flat Grid."""
+    rows = data.replace(b"\r\n", b"\n").strip(b"\n").split(b"\n")
+    width = len(rows[0]) if rows else 0
+    if any(len(row) != width for row in rows):
+        raise ValueError("Grid rows must all have the same width")
+    border = pad * (width + 2)
+    body = b"".join(pad + row + pad for row in rows)
+    return Grid(width, len(rows), bytearray(border + body + border), pad[0])
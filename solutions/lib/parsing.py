@@ -0,0 +1,80 @@
+"""
+Regex-free parsing of raw puzzle bytes into typed arrays.
+
+Everything works on the whole input at once: bytes.translate() maps every
+byte that cannot be part of a number to a space in a single C-level pass,
+and bytes.split() then yields the number tokens, so no Python loop ever
+looks at individual characters.
+"""
+
+from __future__ import annotations
+
+import functools
+from array import array
+
+_DIGITS = b"0123456789"
+# Every byte except the digits becomes a space.
+_UNSIGNED = bytes(c if c in _DIGITS else 0x20 for c in range(256))
+# As above, but '-' survives so it can act as a minus sign.
+_SIGNED = bytes(c if c in _DIGITS or c == 0x2D else 0x20 for c in range(256))
+
+
+def ints(data: bytes, signed: bool = False) -> array:
+    """
+    Every integer in data, in order, as an array('q').
+
+    Anything that is not a digit separates numbers, so "3-5,L68" gives
+    3, 5, 68. With signed, a '-' always starts a new negative number ("x=-4"
+    gives -4, but "3-5" gives 3, -5), so leave it off for a-b ranges.
+    """
+    if not signed:
+        return array("q", map(int, data.translate(_UNSIGNED).split()))
+    tokens = data.translate(_SIGNED).replace(b"-", b" -").split()
+    return array("q", [int(token) for token in tokens if token != b"-"])
+
+
+@functools.lru_cache(maxsize=None)
+def _all_bytes_except(keep: bytes) -> bytes:
+    return bytes(c for c in range(256) if c not in keep)
+
+
+def tagged_ints(data: bytes, tags: bytes) -> tuple[bytes, array]:
+    """
+    For inputs like "L68\nR48" where each number follows a one-byte tag: the
+    tag bytes (b"LR") in order, and the numbers as an array('q').
+
+    The tags come from deleting every other byte with bytes.translate, so tags
+    must not occur anywhere else in the input.
+    """
+    found = data.translate(None, _all_bytes_except(tags))
+    values = ints(data)
+    if len(found) != len(values):
+        raise ValueError(f"Found {len(found)} tags but {len(values)} numbers")
+    return found, values
+
+
+def signed_tags(data: bytes, minus: bytes, plus: bytes) -> tuple[array, array]:
+    """
+    For inputs like "L68\nR48" where a one-byte tag gives each number's
+    direction: an array('b') of -1 (minus) or +1 (plus) per number, and the
+    numbers as an array('q'). The tags are found as in tagged_ints().
+    """
+    tags, values = tagged_ints(data, minus + plus)
+    signs = array("b")
+    # -1 is 0xff as a signed byte.
+    signs.frombytes(tags.translate(bytes.maketrans(minus + plus, b"\xff\x01")))
+    return signs, values
+
+
+def ranges(data: bytes) -> tuple[array, array]:
+    """Starts and ends of "a-b" ranges separated by commas, whitespace or newlines."""
+    values = ints(data)
+    if len(values) % 2:
+        raise ValueError(f"Expected pairs of range bounds, got {len(values)} numbers")
+    return values[0::2], values[1::2]
+
+
+def sections(data: bytes) -> list[bytes]:
+    """Split input into blank-line separated sections, e.g. ranges then IDs."""
+    text = data.replace(b"\r\n", b"\n").strip(b"\n")
+    return [section for section in text.split(b"\n\n") if section.strip()]
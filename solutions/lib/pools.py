@@ -0,0 +1,85 @@
+"""
+Process pools that do not outlive an interrupted solve.
+
+Leaving a `with ProcessPoolExecutor()` block waits for every queued and
+running task. That is the right thing when the block finishes normally, but
+when it is left by an exception (Ctrl+C, or progress.Cancelled raised by the
+SIGALRM behind `execute --timeout`) the solve would keep running in the
+workers until the last task is done. worker_pool() cancels whatever has not
+started and terminates the workers instead.
+
+shared_block() is the SharedMemory counterpart: the block is unlinked however
+the solve ends. Creating and unlinking it hold off the SIGINT/SIGTERM
+handlers, since an exception raised from one halfway through either step
+(after the segment exists, before anything can unlink it) would leak the
+segment. Blocking the signals is not enough: a signal that arrived just
+before still has its Python handler pending, and that runs at the next
+bytecode boundary regardless of the mask.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterator
+
+_HELD_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+@contextlib.contextmanager
+def worker_pool(workers: int) -> Iterator[ProcessPoolExecutor]:
+    """A ProcessPoolExecutor that is shut down at once if the body raises."""
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield pool
+    except BaseException:
+        # The executor has no public way to stop running tasks; its worker
+        # processes have to be terminated directly.
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+        raise
+    pool.shutdown()
+
+
+@contextlib.contextmanager
+def _signals_held() -> Iterator[None]:
+    """Run SIGINT and SIGTERM handlers only once the body is done."""
+    caught: list[int] = []
+
+    def hold(signum: int, frame: object) -> None:
+        caught.append(signum)
+
+    try:
+        previous = {signum: signal.signal(signum, hold) for signum in _HELD_SIGNALS}
+    except ValueError:  # not the main thread, which is the only one handlers run in
+        yield
+        return
+    try:
+        yield
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+        for signum in caught:
+            signal.raise_signal(signum)
+
+
+@contextlib.contextmanager
+def shared_block(size: int) -> Iterator[shared_memory.SharedMemory]:
+    """A new SharedMemory block of `size` bytes, closed and unlinked on exit."""
+    block = None
+    try:
+        # A signal held here is raised on leaving the with, once `block` is set.
+        with _signals_held():
+            block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        yield block
+    finally:
+        if block is not None:
+            with _signals_held():
+                block.close()
+                block.unlink()
@@ -1,11 +1,16 @@
 from __future__ import annotations
-import argparse
 import sys
 from pathlib import Path
 
 
 YEAR = 2025
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aoc.store import read_input_text  # noqa: E402
+from solutions import lib  # noqa: E402
+
 DAY_DIR = Path(__file__).resolve().parent
 DAY = DAY_DIR.name if DAY_DIR.name.startswith("day") else "dayXX"
 DATA_DIR = ROOT / "data" / str(YEAR) / DAY
@@ -16,14 +21,12 @@ def read_input() -> list[str]:
     """
     Load the puzzle input for this part.
 
-    Only one input file is stored (part1.txt).
+    Only one input is stored per day; it is resolved through the input store
+    (data/store) and falls back to part1.txt. For byte-level parsing, pass
+    aoc.store.read_input_bytes(DATA_DIR) to lib.ints, lib.ranges,
+    lib.sections or lib.load_grid.
     """
-    part1 = DATA_DIR / "part1.txt"
-
-    if not part1.exists():
-        raise FileNotFoundError(f"No input file found in {DATA_DIR}. Add part1.txt.")
-
-    return part1.read_text().splitlines()
+    return read_input_text(DATA_DIR).splitlines()
 
 
 def solve(lines: list[str]) -> int | str:
@@ -32,43 +35,11 @@ def solve(lines: list[str]) -> int | str:
 
 
 def run_tests() -> None:
-    if not TESTS:
-        raise SystemExit("Add test cases to TESTS to run tests.")
-
-    failed = False
-    for idx, (raw, expected) in enumerate(TESTS, start=1):
-        lines = [line for line in raw.strip().splitlines()]
-        result = solve(lines)
-
-        if result != expected:
-            failed = True
-            print(f"Test {idx} failed: expected {expected!r}, got {result!r}\n\n")
-        else:
-            print(f"Test {idx} passed: got {result!r}\n\n")
-    
-    if not failed:
-        print(f"All {len(TESTS)} tests passed.")
-
-
-def parse_cli(argv: list[str]) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(
-        description="Advent of Code solver template. Copy into day folder before editing."
-    )
-    parser.add_argument(
-        "--test", action="store_true", help="Run inline TESTS instead of puzzle input"
-    )
-    return parser.parse_args(argv)
+    lib.run_tests(TESTS, solve)
 
 
 def main(argv: list[str] | None = None) -> None:
-    args = parse_cli(argv or sys.argv[1:])
-    if args.test:
-        run_tests()
-        return
-
-    lines = read_input()
-    answer = solve(lines)
-    print(answer)
+    lib.main(argv, read_input, solve, run_tests, description=f"Advent of Code {YEAR} {DAY}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+"""
+Tests for day04's bitboard neighbour counting and k-core decomposition.
+
+    uv run -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import random
+import unittest
+
+from solutions.day04 import bitboard
+from solutions.day04.bitboard import Bitboard
+from solutions.day04.cores import Cores
+
+
+def random_rows(rng: random.Random, width: int, height: int, density: float) -> list[bytes]:
+    return [
+        bytes(0x40 if rng.random() < density else 0x2E for _ in range(width))
+        for _ in range(height)
+    ]
+
+
+def neighbours(rows: list[bytes], x: int, y: int) -> int:
+    return sum(
+        rows[y + dy][x + dx] == 0x40
+        for dy in (-1, 0, 1)
+        for dx in (-1, 0, 1)
+        if (dx or dy) and 0 <= y + dy < len(rows) and 0 <= x + dx < len(rows[0])
+    )
+
+
+def accessible(rows: list[bytes], threshold: int = 4) -> set[tuple[int, int]]:
+    return {
+        (x, y)
+        for y, row in enumerate(rows)
+        for x, cell in enumerate(row)
+        if cell == 0x40 and neighbours(rows, x, y) < threshold
+    }
+
+
+def removal_rounds(rows: list[bytes], threshold: int = 4) -> dict[tuple[int, int], int]:
+    """Part 2 the slow way: (x, y) -> the round its roll is removed in."""
+    rounds: dict[tuple[int, int], int] = {}
+    while found := accessible(rows, threshold):
+        rounds.update(dict.fromkeys(found, max(rounds.values(), default=0) + 1))
+        rows = [
+            bytes(0x2E if (x, y) in found else cell for x, cell in enumerate(row))
+            for y, row in enumerate(rows)
+        ]
+    return rounds
+
+
+def peeled(rows: list[bytes]) -> int:
+    return len(removal_rounds(rows))
+
+
+def positions(board: Bitboard, bits: int) -> set[tuple[int, int]]:
+    return {
+        (x, y)
+        for y, row in enumerate(board.to_rows(bits))
+        for x, cell in enumerate(row)
+        if cell == 0x40
+    }
+
+
+class BitboardTest(unittest.TestCase):
+    def test_at_least_four_for_every_combination(self) -> None:
+        # Bit j of board i is bit i of j, so the 256 bits of the result cover
+        # every way the 8 neighbour boards can overlap.
+        boards = [sum(1 << j for j in range(256) if j >> i & 1) for i in range(8)]
+        expected = sum(1 << j for j in range(256) if j.bit_count() >= 4)
+        self.assertEqual(bitboard.at_least_four(*boards), expected)
+
+    def test_row_bits(self) -> None:
+        self.assertEqual(bitboard.row_bits(b"@..@@"), 0b11001)
+        self.assertEqual(bitboard.row_bits(b""), 0)
+
+    def test_rows_round_trip(self) -> None:
+        rows = [b"..@@.", b"@@@.@", b".....", b"@...@"]
+        board = Bitboard.from_rows(rows)
+        self.assertEqual((board.width, board.height), (5, 4))
+        self.assertEqual(board.to_rows(), rows)
+        self.assertEqual(Bitboard.parse(b"\n".join(rows) + b"\n").to_rows(), rows)
+
+    def test_accessible_matches_counting_neighbours(self) -> None:
+        rng = random.Random(4)
+        for _ in range(50):
+            rows = random_rows(rng, rng.randint(1, 14), rng.randint(1, 14), rng.random())
+            board = Bitboard.from_rows(rows)
+            self.assertEqual(positions(board, board.accessible()), accessible(rows))
+
+    def test_peel_matches_round_by_round_removal(self) -> None:
+        rng = random.Random(6)
+        for _ in range(30):
+            rows = random_rows(rng, rng.randint(1, 12), rng.randint(1, 12), 0.7)
+            self.assertEqual(Bitboard.from_rows(rows).peel(), peeled(rows))
+
+
+
+class CoresTest(unittest.TestCase):
+    def grids(self) -> list[list[bytes]]:
+        rng = random.Random(9)
+        return [
+            random_rows(rng, rng.randint(1, 10), rng.randint(1, 10), rng.uniform(0.3, 1.0))
+            for _ in range(25)
+        ]
+
+    def test_core_numbers(self) -> None:
+        for rows in self.grids():
+            cores = Cores.parse(b"\n".join(rows) + b"\n")
+            rolls = {(x, y) for y, row in enumerate(rows) for x, c in enumerate(row) if c == 0x40}
+            for threshold in range(10):
+                removed = removal_rounds(rows, threshold)
+                survivors = {(x, y) for x, y in rolls if cores.survives(x, y, threshold)}
+                self.assertEqual(survivors, rolls - removed.keys())
+                self.assertEqual(cores.removed(threshold), len(removed))
+
+    def test_rounds_match_round_by_round_removal(self) -> None:
+        for rows in self.grids():
+            cores = Cores.parse(b"\n".join(rows) + b"\n")
+            for threshold in (1, 3, 4, 6):
+                expected = removal_rounds(rows, threshold)
+                rounds = {
+                    cores.grid.position(index): number
+                    for index, number in cores.rounds(threshold).items()
+                }
+                self.assertEqual(rounds, expected)
+                self.assertEqual(cores.round_count(threshold), max(expected.values(), default=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
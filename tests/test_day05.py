@@ -0,0 +1,113 @@
+"""
+Tests for day05's interval index and the lookup service built on it.
+
+    uv run -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import io
+import random
+import unittest
+
+from solutions.day05 import part1, part2
+from solutions.day05.intervals import IntervalIndex
+from solutions.day05.server import QueryService, load_index
+
+
+def covered_ids(intervals: list[tuple[int, int]]) -> set[int]:
+    return {value for start, end in intervals for value in range(start, end + 1)}
+
+
+class IntervalIndexTest(unittest.TestCase):
+    def test_merges_overlapping_and_touching(self) -> None:
+        index = IntervalIndex([(10, 14), (3, 5), (16, 20), (12, 18), (6, 6)])
+        self.assertEqual((index.starts, index.ends), ([3, 10], [6, 20]))
+
+    def test_add_merges_with_every_neighbour_it_reaches(self) -> None:
+        index = IntervalIndex([(1, 2), (5, 6), (9, 10), (20, 30)])
+        index.add(3, 8)
+        self.assertEqual((index.starts, index.ends), ([1, 20], [10, 30]))
+        index.add(11, 19)
+        self.assertEqual((index.starts, index.ends), ([1], [30]))
+        index.add(40, 40)
+        index.add(35, 36)
+        self.assertEqual((index.starts, index.ends), ([1, 35, 40], [30, 36, 40]))
+
+    def test_add_matches_a_brute_force_model(self) -> None:
+        rng = random.Random(5)
+        for _ in range(200):
+            intervals = []
+            index = IntervalIndex()
+            for _ in range(rng.randint(1, 12)):
+                start = rng.randint(0, 60)
+                interval = (start, start + rng.randint(0, 8))
+                intervals.append(interval)
+                index.add(*interval)
+            ids = covered_ids(intervals)
+            self.assertEqual(index.covered(), len(ids))
+            self.assertTrue(all(a > b + 1 for a, b in zip(index.starts[1:], index.ends)))
+            self.assertEqual([v for v in range(-1, 72) if v in index], sorted(ids))
+            self.assertEqual(index.count(range(-1, 72)), len(ids))
+
+    def test_rejects_backwards_intervals(self) -> None:
+        with self.assertRaises(ValueError):
+            IntervalIndex([(5, 3)])
+        with self.assertRaises(ValueError):
+            IntervalIndex().add(5, 3)
+
+    def test_indexed_variants_match_solve(self) -> None:
+        for module in (part1, part2):
+            for raw, expected in module.TESTS:
+                data = raw.strip("\r\n").encode() + b"\n"
+                self.assertEqual(module.solve_indexed(data), expected)
+            self.assertEqual(module.solve_indexed(b""), 0)
+
+
+class QueryServiceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = QueryService(load_index(b"3-5\n10-14\n\n1\n5\n"))
+
+    def ask(self, line: bytes) -> bytes | None:
+        return self.service.handle(line)
+
+    def test_lookup_answers_in_order(self) -> None:
+        self.assertEqual(self.ask(b"1 5 8 11 17\n"), b"0 1 0 1 0\n")
+
+    def test_add_intervals(self) -> None:
+        self.assertEqual(self.ask(b"+ 6-9 20-22\n"), b"ok 2\n")
+        self.assertEqual(self.ask(b"8 21\n"), b"1 1\n")
+
+    def test_bad_add_changes_nothing(self) -> None:
+        response = self.ask(b"+ 30-40 9-2\n")
+        assert response is not None
+        self.assertTrue(response.startswith(b"error "))
+        self.assertEqual(len(self.service.index), 2)
+        self.assertEqual(self.ask(b"35\n"), b"0\n")
+
+    def test_bad_lookup_keeps_connection(self) -> None:
+        response = self.ask(b"1 x\n")
+        assert response is not None
+        self.assertTrue(response.startswith(b"error "))
+        self.assertEqual(self.ask(b"4\n"), b"1\n")
+
+    def test_stats_count_lookups(self) -> None:
+        self.ask(b"1 2 3\n")
+        self.ask(b"4\n")
+        stats = self.ask(b"stats\n")
+        assert stats is not None
+        self.assertTrue(stats.startswith(b"queries 4 batches 2 intervals 2 qps "))
+
+    def test_serve_until_quit(self) -> None:
+        reader = io.BytesIO(b"4\n\n+ 20-21\nquit\n4\n")
+        writer = io.BytesIO()
+        self.service.serve(reader, writer)
+        self.assertEqual(writer.getvalue(), b"1\nok 3\n")
+
+    def test_empty_index(self) -> None:
+        service = QueryService(load_index(b""))
+        self.assertEqual(service.handle(b"1 2\n"), b"0 0\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Tests for aoc.fetch against a local stand-in for the puzzle input server.
+
+    uv run -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import hashlib
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from aoc import store
+from aoc.fetch import FetchResult, InputFetcher
+
+COOKIE = "session=test"
+
+
+class StandIn(ThreadingHTTPServer):
+    """Serves /YYYY/day/D/input from `inputs`, with ETags and scripted failures."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.inputs: dict[str, bytes] = {}
+        self.failures: dict[str, list[int]] = {}  # path -> statuses to answer first
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: StandIn
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.requests.append((self.path, dict(self.headers)))
+            failures = self.server.failures.get(self.path)
+            status = failures.pop(0) if failures else None
+        if status is not None:
+            self.send_response(status)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("Cookie") != COOKIE:
+            self.reply(400, b"Please log in.\n")
+            return
+        body = self.server.inputs.get(self.path)
+        if body is None:
+            self.reply(404, b"Not found.\n")
+            return
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.reply(200, body, {"ETag": etag})
+
+    def reply(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class FetchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StandIn()
+        thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.store = store.InputStore(self.root / "store")
+        self.fetcher = InputFetcher(
+            COOKIE, self.server.url, rate=0, retries=3, backoff=0, timeout=5, store=self.store
+        )
+        self.addCleanup(self.fetcher.close)
+
+    def data_dir(self, year: int, day: int) -> Path:
+        return self.root / str(year) / f"day{day:02d}"
+
+    def fetch(self, day: int = 1) -> FetchResult:
+        return self.fetcher.fetch(2025, day, self.data_dir(2025, day))
+
+    def test_download_lands_in_store(self) -> None:
+        self.server.inputs["/2025/day/1/input"] = b"L68\nR48\n"
+        result = self.fetch()
+        self.assertEqual(result.status, "written")
+        self.assertEqual(store.read_input_bytes(result.data_dir, self.store), b"L68\nR48\n")
+
+    def test_retries_429_and_5xx(self) -> None:
+        self.server.inputs["/2025/day/1/input"] = b"123\n"
+        self.server.failures["/2025/day/1/input"] = [503, 429, 502]
+        self.assertEqual(self.fetch().status, "written")
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_gives_up_after_retries(self) -> None:
+        self.server.inputs["/2025/day/1/input"] = b"123\n"
+        self.server.failures["/2025/day/1/input"] = [503] * 10
+        result = self.fetch()
+        self.assertEqual(result.status, "failed")
+        self.assertIn("HTTP 503", result.detail)
+        self.assertEqual(len(self.server.requests), 1 + self.fetcher.retries)
+
+    def test_client_errors_are_not_retried(self) -> None:
+        result = self.fetch(day=2)
+        self.assertEqual(result.status, "failed")
+        self.assertIn("HTTP 404", result.detail)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_revalidates_with_etag(self) -> None:
+        self.server.inputs["/2025/day/1/input"] = b"first\n"
+        self.assertEqual(self.fetch().status, "written")
+        self.assertNotIn("If-None-Match", self.server.requests[-1][1])
+
+        result = self.fetch()
+        self.assertEqual((result.status, result.detail), ("unchanged", "not modified"))
+        self.assertIn("If-None-Match", self.server.requests[-1][1])
+
+        self.server.inputs["/2025/day/1/input"] = b"second\n"
+        self.assertEqual(self.fetch().status, "written")
+        self.assertEqual(store.read_input_bytes(self.data_dir(2025, 1), self.store), b"second\n")
+
+    def test_fetch_many(self) -> None:
+        days = range(1, 7)
+        for day in days:
+            self.server.inputs[f"/2025/day/{day}/input"] = f"day {day}\n".encode()
+        self.server.failures["/2025/day/3/input"] = [500]
+        results = list(self.fetcher.fetch_many([(2025, day) for day in days], self.data_dir))
+        self.assertEqual(sorted(result.day for result in results), list(days))
+        self.assertTrue(all(result.status == "written" for result in results))
+        for day in days:
+            data = store.read_input_bytes(self.data_dir(2025, day), self.store)
+            self.assertEqual(data, f"day {day}\n".encode())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Tests for aoc.fuzz: comparing implementations, shrinking, saving reproducers.
+
+    uv run -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import ast
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc import fuzz, registry
+
+
+def total(lines: list[str]) -> int:
+    return sum(int(token) for line in lines for token in line.split(",") if token)
+
+
+def skips_sevens(lines: list[str]) -> int:
+    """total() with a bug: any token containing a 7 is dropped."""
+    return sum(int(token) for line in lines for token in line.split(",") if "7" not in token)
+
+
+def crashes_on_negatives(lines: list[str]) -> int:
+    if any(token.startswith("-") for line in lines for token in line.split(",")):
+        raise ValueError("negative")
+    return total(lines)
+
+
+VARIANTS = {
+    registry.DEFAULT: registry.Variant(registry.DEFAULT, total),
+    "buggy": registry.Variant("buggy", skips_sevens),
+}
+
+
+class DdminTest(unittest.TestCase):
+    def test_finds_the_single_culprit(self) -> None:
+        items = [str(i) for i in range(40)]
+        self.assertEqual(fuzz.ddmin(items, lambda subset: "23" in subset), ["23"])
+
+    def test_keeps_every_item_the_failure_needs(self) -> None:
+        def fails(subset: list[str]) -> bool:
+            return "b" in subset and "g" in subset
+
+        self.assertEqual(fuzz.ddmin(list("abcdefgh"), fails), ["b", "g"])
+
+    def test_result_is_one_minimal(self) -> None:
+        def fails(subset: list[str]) -> bool:
+            return sum(map(int, subset)) >= 50
+
+        result = fuzz.ddmin([str(i) for i in range(30)], fails)
+        self.assertTrue(fails(result))
+        for index in range(len(result)):
+            self.assertFalse(fails(result[:index] + result[index + 1 :]))
+
+
+class ShrinkTest(unittest.TestCase):
+    def test_shrinks_lines_then_tokens(self) -> None:
+        raw = "1,2,3\n4,17,5\n6\n8,9"
+
+        def fails(candidate: str) -> bool:
+            return fuzz.disagreement(VARIANTS, candidate) is not None
+
+        self.assertTrue(fails(raw))
+        self.assertEqual(fuzz.shrink(raw, fails), "17")
+
+
+class DisagreementTest(unittest.TestCase):
+    def test_agreeing_implementations(self) -> None:
+        self.assertIsNone(fuzz.disagreement(VARIANTS, "1,2\n3"))
+
+    def test_different_answers(self) -> None:
+        outcomes = fuzz.disagreement(VARIANTS, "1,7")
+        self.assertEqual(outcomes, {registry.DEFAULT: ("ok", 8), "buggy": ("ok", 1)})
+
+    def test_crash_counts_only_when_solve_succeeds(self) -> None:
+        variants = {
+            registry.DEFAULT: registry.Variant(registry.DEFAULT, total),
+            "strict": registry.Variant("strict", crashes_on_negatives),
+        }
+        outcomes = fuzz.disagreement(variants, "-1,2")
+        assert outcomes is not None
+        self.assertEqual(outcomes["strict"], ("error", "ValueError: negative"))
+
+        variants = {registry.DEFAULT: variants["strict"], "total": variants[registry.DEFAULT]}
+        self.assertIsNone(fuzz.disagreement(variants, "-1,2"))
+
+
+class AddTestCaseTest(unittest.TestCase):
+    SOURCE = (
+        "TESTS: list[tuple[str, int | str]] = [\n"
+        '    ("""1\n""", 1),\n'
+        "]\n"
+        "\n"
+        "\n"
+        "def solve(lines):\n"
+        "    return 0\n"
+    )
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "part1.py"
+        self.path.write_text(self.SOURCE)
+
+    def saved_cases(self) -> list[tuple[str, object]]:
+        namespace: dict[str, object] = {}
+        exec(compile(self.path.read_text(), str(self.path), "exec"), namespace)
+        return namespace["TESTS"]  # type: ignore[return-value]
+
+    def test_appends_and_keeps_the_rest(self) -> None:
+        self.assertTrue(fuzz.add_test_case(self.path, "1,7\n2", 10))
+        self.assertEqual(self.saved_cases(), [("1\n", 1), ("1,7\n2\n", 10)])
+        self.assertTrue(self.path.read_text().endswith("\n\ndef solve(lines):\n    return 0\n"))
+        ast.parse(self.path.read_text())
+
+    def test_skips_inputs_already_there(self) -> None:
+        self.assertFalse(fuzz.add_test_case(self.path, "1", 1))
+        self.assertEqual(self.path.read_text(), self.SOURCE)
+
+    def test_escapes_awkward_inputs(self) -> None:
+        self.assertTrue(fuzz.add_test_case(self.path, 'a"""b\\c', "x"))
+        self.assertEqual(self.saved_cases()[-1], ('a"""b\\c\n', "x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Tests for aoc.harness: timed-out cases must take their worker pools with them.
+
+    uv run -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+import unittest
+from pathlib import Path
+
+from aoc import harness
+from aoc.loader import import_solution
+
+SHM = Path("/dev/shm")
+PROC = Path("/proc")
+
+
+def shared_memory_blocks() -> set[str]:
+    return {path.name for path in SHM.iterdir()} if SHM.is_dir() else set()
+
+
+def live_members(group: int) -> list[int]:
+    """Pids in process group `group` that are still running (zombies excluded)."""
+    members = []
+    for stat in PROC.glob("[0-9]*/stat"):
+        try:
+            # pid (comm) state ppid pgrp ...; comm may itself contain spaces.
+            state, _, pgrp = stat.read_text().rpartition(")")[2].split()[:3]
+        except OSError:
+            continue
+        if int(pgrp) == group and state != "Z":
+            members.append(int(stat.parent.name))
+    return members
+
+
+class TimeoutTest(unittest.TestCase):
+    def run_tiled(self, part: int, timeout: float) -> harness.CaseResult:
+        _, expected = import_solution(4, part).TESTS[0]
+        case = harness.TestCase(4, part, 0, expected, impl="tiled")
+        [result] = harness.run_cases([case], jobs=1, timeout=timeout)
+        return result
+
+    def test_pool_variant_passes(self) -> None:
+        self.assertEqual(self.run_tiled(1, timeout=30).status, "pass")
+
+    def test_timed_out_pool_variant_is_stopped(self) -> None:
+        blocks = shared_memory_blocks()
+        started = time.perf_counter()
+        # Starting the pool alone takes longer than a millisecond.
+        result = self.run_tiled(2, timeout=0.001)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(result.status, "timeout")
+        # Hanging on an orphaned pool worker would never return at all; a
+        # stubborn case is SIGKILLed after KILL_GRACE.
+        self.assertLess(elapsed, harness.KILL_GRACE + 5)
+        self.assertEqual(multiprocessing.active_children(), [])
+        self.assertEqual(shared_memory_blocks() - blocks, set())
+
+    @unittest.skipUnless(hasattr(os, "setsid") and PROC.is_dir(), "needs /proc")
+    def test_stop_case_kills_the_group(self) -> None:
+        proc = multiprocessing.Process(target=_pool_forever)
+        proc.start()
+        deadline = time.monotonic() + 10
+        while len(live_members(proc.pid)) < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(len(live_members(proc.pid)), 2)
+        harness.stop_case(proc)
+        self.assertEqual(live_members(proc.pid), [])
+
+
+def _pool_forever() -> None:
+    """A case process whose pool worker never finishes."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    os.setsid()
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        pool.submit(time.sleep, 3600).result()
+
+
+if __name__ == "__main__":
+    unittest.main()
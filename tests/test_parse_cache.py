@@ -0,0 +1,69 @@
+"""
+Tests for aoc.parse_cache: hits, misses and damaged sidecars.
+
+    uv run -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import hashlib
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc import parse_cache
+from aoc.loader import import_solution
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.module = import_solution(1, 1)
+        raw, self.expected = self.module.TESTS[0]
+        self.data = raw.encode()
+        self.digest = hashlib.sha256(self.data).hexdigest()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_dir = Path(tmp.name)
+        self.path = parse_cache.cache_path(
+            self.data_dir, self.digest, 1, parse_cache.parser_digest(self.module.parse)
+        )
+
+    def solve(self) -> tuple[int | str, bool]:
+        parsed, hit = parse_cache.load_or_parse(
+            self.module.parse, lambda: self.data, self.data_dir, self.digest, 1
+        )
+        return self.module.solve_parsed(parsed), hit
+
+    def test_miss_then_hit(self) -> None:
+        self.assertEqual(self.solve(), (self.expected, False))
+        self.assertTrue(self.path.exists())
+        self.assertEqual(self.solve(), (self.expected, True))
+
+    def test_truncated_sidecar_is_reparsed(self) -> None:
+        self.solve()
+        whole = self.path.read_bytes()
+        for size in (len(whole) - 1, len(whole) // 2, 30, 10, 5, 0):
+            with self.subTest(size=size):
+                self.path.write_bytes(whole[:size])
+                self.assertIsNone(parse_cache.load(self.path))
+                self.assertEqual(self.solve(), (self.expected, False))
+                # The miss rewrote the sidecar in full.
+                self.assertEqual(self.path.read_bytes(), whole)
+
+    def test_damaged_header_is_reparsed(self) -> None:
+        self.solve()
+        whole = self.path.read_bytes()
+        header_start = len(parse_cache.MAGIC) + 8
+        for damaged in (
+            whole[:header_start] + b"\xff" * 16 + whole[header_start + 16 :],
+            whole[: len(parse_cache.MAGIC)] + b"\xff" * 8 + whole[header_start:],
+            b"XXXXXXXX" + whole[len(parse_cache.MAGIC) :],
+        ):
+            with self.subTest(damaged=damaged[:24]):
+                self.path.write_bytes(damaged)
+                self.assertIsNone(parse_cache.load(self.path))
+                self.assertEqual(self.solve(), (self.expected, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
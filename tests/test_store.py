@@ -0,0 +1,82 @@
+"""
+Tests for aoc.store: round trips, corruption checks and repairing blobs.
+
+    uv run -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc import store
+
+DATA = b"L68\nL30\nR48\n" * 1000
+
+
+class StoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.store = store.InputStore(self.root / "store")
+
+    def compressions(self) -> list[str]:
+        return ["none", "gzip"] + (["zstd"] if store.zstandard is not None else [])
+
+    def test_round_trip(self) -> None:
+        for compression in self.compressions():
+            with self.subTest(compression=compression):
+                ref = self.store.put(DATA, compression)
+                self.assertEqual(ref.size, len(DATA))
+                self.assertEqual(self.store.read(ref), DATA)
+                self.assertTrue(self.store.intact(ref))
+                # Storing the same content again reuses the blob.
+                self.assertEqual(self.store.put(DATA, compression), ref)
+
+    def test_empty_input(self) -> None:
+        ref = self.store.put(b"")
+        self.assertEqual(self.store.read(ref), b"")
+
+    def test_ref_resolves_through_data_dir(self) -> None:
+        data_dir = self.root / "2025" / "day01"
+        ref, changed = store.store_input(data_dir, DATA, "gzip", self.store)
+        self.assertTrue(changed)
+        self.assertEqual(store.current_ref(data_dir), ref)
+        self.assertEqual(store.read_input_bytes(data_dir, self.store), DATA)
+        self.assertEqual(store.input_digest(data_dir), ref.sha256)
+        self.assertEqual(store.store_input(data_dir, DATA, "gzip", self.store), (ref, False))
+
+    def test_corrupt_blob_is_rejected(self) -> None:
+        for compression in self.compressions():
+            with self.subTest(compression=compression):
+                ref = self.store.put(DATA, compression)
+                path = self.store.blob_path(ref.sha256, compression)
+                blob = path.read_bytes()
+                for damaged in (blob[: len(blob) // 2], blob[:-1] + bytes([blob[-1] ^ 1])):
+                    path.write_bytes(damaged)
+                    with self.assertRaises(store.DAMAGED):
+                        self.store.read(ref)
+                    self.assertFalse(self.store.intact(ref))
+                path.write_bytes(blob)
+
+    def test_put_repairs_corrupt_blob(self) -> None:
+        for compression in self.compressions():
+            with self.subTest(compression=compression):
+                ref = self.store.put(DATA, compression)
+                path = self.store.blob_path(ref.sha256, compression)
+                path.write_bytes(b"garbage")
+                self.assertEqual(self.store.put(DATA, compression), ref)
+                self.assertEqual(self.store.read(ref), DATA)
+
+    def test_write_atomic_leaves_no_temp_files(self) -> None:
+        path = self.root / "nested" / "file.bin"
+        store.write_atomic(path, b"one")
+        store.write_atomic(path, b"two")
+        self.assertEqual(path.read_bytes(), b"two")
+        self.assertEqual([p.name for p in path.parent.iterdir()], ["file.bin"])
+
+
+if __name__ == "__main__":
+    unittest.main()